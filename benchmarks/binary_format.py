@@ -0,0 +1,78 @@
+"""
+Encode and decode speed of the binary workflow format against the textual ones.
+
+A synthetic workflow is encoded with :mod:`aloof_union.core.binary`, with
+pickle, and in each textual format, then decoded back to a
+:class:`UnifiedWorkflow`. Textual formats are decoded by re-parsing their
+serialized text, the way a cache or worker process would have to. Times
+are the best of ``--repeat`` runs.
+
+Usage::
+
+    python benchmarks/binary_format.py [--states N] [-k K] [--repeat R]
+"""
+
+import argparse
+import io
+import pickle
+from typing import Any, Callable, Dict, Tuple
+
+from scaling import FORMATS, best_time
+
+from aloof_union.core import binary
+from aloof_union.core.parsers import get_parser
+from aloof_union.tests.synthetic import synthetic_workflow
+
+
+def codecs() -> Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], Any]]]:
+    """Encoder and decoder of each format, keyed by label."""
+    result = {
+        "binary": (binary.dumps, binary.loads),
+        "pickle": (pickle.dumps, pickle.loads),
+    }
+    for label, automation_type in FORMATS.items():
+        parser = get_parser(automation_type)
+
+        def encode(workflow: Any, parser: Any = parser) -> str:
+            buffer = io.StringIO()
+            parser.serialize_to(workflow, buffer)
+            return buffer.getvalue()
+
+        def decode(text: str, parser: Any = parser) -> Any:
+            return parser.parse_stream(io.StringIO(text))
+
+        result[label] = (encode, decode)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--states", type=int, default=10_000)
+    parser.add_argument("-k", type=int, default=2, help="Conditions per transition")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    workflow = synthetic_workflow(args.states, k=args.k)
+    print(f"{args.states} states, {len(workflow.transitions)} transitions")
+    timings = {}
+    for label, (encode, decode) in codecs().items():
+        data = encode(workflow)
+        size = len(data.encode("utf-8") if isinstance(data, str) else data)
+        timings[label] = (
+            best_time(lambda: encode(workflow), args.repeat),
+            best_time(lambda: decode(data), args.repeat),
+            size,
+        )
+
+    binary_decode = timings["binary"][1]
+    for label, (encode_s, decode_s, size) in timings.items():
+        print(
+            f"  {label:<8} encode {encode_s * 1000:8.1f} ms"
+            f"  decode {decode_s * 1000:8.1f} ms"
+            f"  ({decode_s / binary_decode:5.1f}x binary)"
+            f"  {size / 2**20:7.2f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
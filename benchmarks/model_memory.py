@@ -0,0 +1,138 @@
+"""
+Memory footprint of the unified workflow model.
+
+Builds the same synthetic workflow three ways and reports the memory held
+by each, as measured by ``tracemalloc``:
+
+* ``dict``: the original ``__dict__``-based dataclasses, with state names
+  copied into every transition the way a JSON decoder produces them
+* ``slotted``: the current slotted, interned models
+* ``compact``: slotted models with transitions stored in a
+  :class:`~aloof_union.core.compact.TransitionTable`
+* ``interned``: slotted models whose conditions and actions are shared
+  through a :class:`~aloof_union.core.interning.FlyweightPool`
+
+Usage::
+
+    python benchmarks/model_memory.py [--states N] [--transitions M]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from aloof_union.core.compact import compact_workflow
+from aloof_union.core.interning import intern_workflow
+from aloof_union.core.models import (
+    Action,
+    Condition,
+    Transition,
+    UnifiedWorkflow,
+    WorkflowState,
+)
+
+
+@dataclass
+class DictCondition:
+    field: str
+    operator: str
+    value: Any
+
+
+@dataclass
+class DictAction:
+    type: str
+    parameters: Dict[str, Any]
+
+
+@dataclass
+class DictTransition:
+    from_state: str
+    to_state: str
+    conditions: List[DictCondition]
+    actions: List[DictAction]
+
+
+@dataclass
+class DictWorkflowState:
+    name: str
+    description: Optional[str] = None
+    is_initial: bool = False
+    is_terminal: bool = False
+    properties: Dict[str, Any] = None
+
+
+def _name(i: int) -> str:
+    # Build a fresh string object each call, as json.loads does for values
+    return "".join(["Status ", str(i)])
+
+
+def build(n_states: int, n_transitions: int, dict_based: bool) -> UnifiedWorkflow:
+    state_cls = DictWorkflowState if dict_based else WorkflowState
+    transition_cls = DictTransition if dict_based else Transition
+    condition_cls = DictCondition if dict_based else Condition
+    action_cls = DictAction if dict_based else Action
+
+    states = {
+        _name(i): state_cls(name=_name(i), is_initial=i == 0) for i in range(n_states)
+    }
+    transitions = [
+        transition_cls(
+            from_state=_name(i % n_states),
+            to_state=_name((i * 7 + 1) % n_states),
+            conditions=[condition_cls("assignee", "is not", None)],
+            actions=[action_cls("notify", {"template": "assigned"})],
+        )
+        for i in range(n_transitions)
+    ]
+    return UnifiedWorkflow(states, transitions, {"source": "benchmark"})
+
+
+def interned(workflow: UnifiedWorkflow) -> UnifiedWorkflow:
+    intern_workflow(workflow)
+    return workflow
+
+
+def measure(factory: Callable[[], Any]) -> int:
+    """Return the bytes still allocated by the object ``factory`` returns."""
+    gc.collect()
+    tracemalloc.start()
+    result = factory()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--states", type=int, default=1_000)
+    parser.add_argument("--transitions", type=int, default=200_000)
+    args = parser.parse_args()
+
+    results = {
+        "dict": measure(lambda: build(args.states, args.transitions, True)),
+        "slotted": measure(lambda: build(args.states, args.transitions, False)),
+        "compact": measure(
+            lambda: compact_workflow(build(args.states, args.transitions, False))
+        ),
+        "interned": measure(
+            lambda: interned(build(args.states, args.transitions, False))
+        ),
+    }
+
+    baseline = results["dict"]
+    print(f"{args.states} states, {args.transitions} transitions")
+    for label, size in results.items():
+        print(
+            f"  {label:<8} {size / 2**20:8.1f} MiB"
+            f"  ({size / args.transitions:6.0f} B/transition,"
+            f" {1 - size / baseline:6.1%} saved vs dict)"
+        )
+
+
+if __name__ == "__main__":
+    main()
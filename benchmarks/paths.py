@@ -0,0 +1,56 @@
+"""
+All-pairs shortest paths, in one process and across worker processes.
+
+A synthetic workflow's :class:`aloof_union.core.analysis.PathAnalysis` runs
+a search from every state, first in the calling process and then over
+``--workers`` processes; each run starts from a fresh analysis so nothing
+is memoized between them. Times are the best of ``--repeat`` runs.
+
+Usage::
+
+    python benchmarks/paths.py [--states N] [--workers W] [--repeat R]
+        [--weighted]
+"""
+
+import argparse
+import os
+import random
+
+from scaling import best_time
+
+from aloof_union.core.analysis import PathAnalysis
+from aloof_union.tests.synthetic import synthetic_workflow
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--states", type=int, default=2000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--weighted", action="store_true", help="Use Dijkstra with random costs"
+    )
+    args = parser.parse_args()
+
+    workflow = synthetic_workflow(args.states)
+    costs = None
+    if args.weighted:
+        rng = random.Random(0)
+        costs = {
+            (t.from_state, t.to_state): rng.uniform(1, 10) for t in workflow.transitions
+        }
+    print(f"{args.states} states, {len(workflow.transitions)} transitions")
+
+    for workers in sorted({1, args.workers}):
+        seconds = best_time(
+            lambda: PathAnalysis(workflow, costs).all_pairs(workers=workers),
+            args.repeat,
+        )
+        print(
+            f"  {workers:3d} worker(s) {seconds * 1000:9.1f} ms"
+            f"  ({args.states / seconds:10,.0f} sources/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Throughput of the compiled routing engine against interpreting conditions.
+
+Random tickets are routed through a synthetic workflow by
+:class:`aloof_union.core.routing.RoutingEngine`, and by a loop that reads
+each transition's condition list and looks its operators up for every
+ticket. When NumPy is installed, the same tickets held as columns are
+also routed by :class:`aloof_union.core.routing.ColumnarRouter`. Times are
+the best of ``--repeat`` runs.
+
+Usage::
+
+    python benchmarks/routing.py [--states N] [--tickets T] [-k K] [--repeat R]
+"""
+
+import argparse
+import random
+from typing import Any, Dict, List, Mapping
+
+from scaling import best_time
+
+from aloof_union.core.models import UnifiedWorkflow
+from aloof_union.core.routing import RoutingEngine, compile_condition
+from aloof_union.tests.synthetic import synthetic_workflow
+
+
+def random_tickets(
+    workflow: UnifiedWorkflow, count: int, k: int, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Tickets in random states with random values of the synthetic fields."""
+    rng = random.Random(seed)
+    states = list(workflow.states)
+    return [
+        {
+            "status": rng.choice(states),
+            **{f"field{j}": rng.randrange(1000) for j in range(k)},
+        }
+        for _ in range(count)
+    ]
+
+
+def interpret(workflow: UnifiedWorkflow, tickets: List[Mapping[str, Any]]) -> int:
+    """Route tickets by re-reading every condition list; return enabled count."""
+    outgoing = workflow.index.outgoing
+    enabled = 0
+    for ticket in tickets:
+        for transition in outgoing[ticket["status"]]:
+            if all(
+                compile_condition(c.field, c.operator, c.value)(ticket)
+                for c in transition.conditions
+            ):
+                enabled += 1
+    return enabled
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--states", type=int, default=1000)
+    parser.add_argument("--tickets", type=int, default=100_000)
+    parser.add_argument("-k", type=int, default=2, help="Conditions per transition")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    workflow = synthetic_workflow(args.states, k=args.k)
+    tickets = random_tickets(workflow, args.tickets, args.k)
+    print(
+        f"{args.states} states, {len(workflow.transitions)} transitions, "
+        f"{args.tickets} tickets"
+    )
+
+    engine = RoutingEngine(workflow)
+    compile_s = best_time(lambda: RoutingEngine(workflow), args.repeat)
+    compiled_s = best_time(lambda: engine.route(tickets), args.repeat)
+    interpreted_s = best_time(lambda: interpret(workflow, tickets), args.repeat)
+    timings = [("compiled", compiled_s), ("interpreted", interpreted_s)]
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        from aloof_union.core.routing import ColumnarRouter
+
+        router = ColumnarRouter(workflow)
+        states = np.array([t["status"] for t in tickets])
+        columns = {
+            f"field{j}": np.array([t[f"field{j}"] for t in tickets])
+            for j in range(args.k)
+        }
+        timings.append(
+            (
+                "columnar",
+                best_time(lambda: router.next_states(columns, states), args.repeat),
+            )
+        )
+
+    print(f"  compile      {compile_s * 1000:8.1f} ms")
+    for label, seconds in timings:
+        print(
+            f"  {label:<12} {seconds * 1000:8.1f} ms"
+            f"  ({args.tickets / seconds:10,.0f} tickets/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Scaling benchmark of parse, validate and serialize for every format pair.
+
+For each size, a synthetic workflow is generated in every source format
+(see :mod:`aloof_union.tests.synthetic`) and converted to every target
+format. Each stage is timed separately, taking the best of ``--repeat``
+runs, and the peak memory of one full conversion is measured with
+``tracemalloc``. Results are written to a JSON file; pass an earlier file
+to ``--compare`` to flag regressions between releases.
+
+Usage::
+
+    python benchmarks/scaling.py [--sizes 100,1000,10000,100000]
+        [--output scaling.json] [--compare baseline.json]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple
+
+import aloof_union
+from aloof_union.core.models import AutomationType
+from aloof_union.core.parsers import get_parser
+from aloof_union.core.transpilers import WorkflowValidator
+from aloof_union.tests.synthetic import synthetic_content
+
+FORMATS = {
+    "fs": AutomationType.FRESHSERVICE,
+    "jsm": AutomationType.JSM,
+    "mermaid": AutomationType.MERMAID,
+}
+
+
+def best_time(fn: Callable[[], Any], repeat: int) -> float:
+    """Return the fastest of ``repeat`` timed calls of ``fn``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(fn: Callable[[], Any]) -> int:
+    """Return the peak bytes allocated while ``fn`` runs."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench_pair(
+    content: Any, from_name: str, to_name: str, repeat: int
+) -> Dict[str, Any]:
+    source = get_parser(FORMATS[from_name])
+    target = get_parser(FORMATS[to_name])
+    validator = WorkflowValidator()
+
+    workflow = source.parse(content)
+
+    def validate() -> None:
+        # Rebuild the graph index each run, as a fresh conversion would
+        workflow.invalidate_index()
+        validator.check(workflow)
+
+    def convert() -> None:
+        parsed = source.parse(content)
+        validator.check(parsed)
+        target.serialize(parsed)
+
+    row = {
+        "from": from_name,
+        "to": to_name,
+        "states": len(workflow.states),
+        "transitions": len(workflow.transitions),
+        "valid": validator.check(workflow).ok,
+        "parse_s": best_time(lambda: source.parse(content), repeat),
+        "validate_s": best_time(validate, repeat),
+        "serialize_s": best_time(lambda: target.serialize(workflow), repeat),
+        "peak_bytes": peak_memory(convert),
+    }
+    row["total_s"] = row["parse_s"] + row["validate_s"] + row["serialize_s"]
+    return row
+
+
+def run(
+    sizes: List[int],
+    transitions_per_state: int,
+    k: int,
+    seed: int,
+    repeat: int,
+    pairs: List[Tuple[str, str]],
+) -> List[Dict[str, Any]]:
+    results = []
+    for n_states in sizes:
+        for from_name in dict.fromkeys(f for f, _ in pairs):
+            content = synthetic_content(
+                FORMATS[from_name], n_states, n_states * transitions_per_state, k, seed
+            )
+            for pair_from, to_name in pairs:
+                if pair_from != from_name:
+                    continue
+                row = bench_pair(content, from_name, to_name, repeat)
+                row["k"] = k
+                results.append(row)
+                print(
+                    f"{n_states:>7} states  {from_name:>7} -> {to_name:<7}"
+                    f"  parse {row['parse_s'] * 1e3:9.1f} ms"
+                    f"  validate {row['validate_s'] * 1e3:9.1f} ms"
+                    f"  serialize {row['serialize_s'] * 1e3:9.1f} ms"
+                    f"  peak {row['peak_bytes'] / 2**20:8.1f} MiB",
+                    flush=True,
+                )
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: str, threshold: float) -> int:
+    """Print changes against an earlier run; return the number of regressions."""
+    with open(baseline_path) as f:
+        baseline = {
+            (r["from"], r["to"], r["states"]): r for r in json.load(f)["results"]
+        }
+
+    regressions = 0
+    for row in results:
+        old = baseline.get((row["from"], row["to"], row["states"]))
+        if old is None:
+            continue
+        for metric in ("total_s", "peak_bytes"):
+            ratio = row[metric] / old[metric] if old[metric] else 1.0
+            if ratio > threshold:
+                regressions += 1
+                print(
+                    f"REGRESSION {row['from']} -> {row['to']} at {row['states']} "
+                    f"states: {metric} x{ratio:.2f}"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--sizes",
+        default="100,1000,10000,100000",
+        help="Comma-separated state counts",
+    )
+    parser.add_argument("--transitions-per-state", type=int, default=3)
+    parser.add_argument(
+        "-k", type=int, default=2, help="Conditions and actions per transition"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--pairs",
+        default=None,
+        help="Comma-separated from:to pairs, e.g. fs:jsm (defaults to all)",
+    )
+    parser.add_argument("--output", default="scaling.json")
+    parser.add_argument("--compare", default=None, help="Earlier results to diff")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.10,
+        help="Slowdown or growth ratio reported as a regression",
+    )
+    args = parser.parse_args()
+
+    if args.pairs:
+        pairs = [tuple(p.split(":")) for p in args.pairs.split(",")]
+    else:
+        pairs = [(f, t) for f in FORMATS for t in FORMATS]
+
+    results = run(
+        [int(s) for s in args.sizes.split(",")],
+        args.transitions_per_state,
+        args.k,
+        args.seed,
+        args.repeat,
+        pairs,
+    )
+    report = {
+        "version": aloof_union.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
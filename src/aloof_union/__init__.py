@@ -1,7 +1,31 @@
 """aloof_union."""
 
-from aloof_union.core.models import AutomationType
-from aloof_union.core.transpiler import WorkflowTranspiler
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from aloof_union.core.models import AutomationType
+    from aloof_union.core.transpiler import WorkflowTranspiler
 
 __version__ = "0.1.0"
 __all__ = ["WorkflowTranspiler", "AutomationType"]
+
+# Public names and their modules; imported on first access so that
+# ``import aloof_union`` (and the CLI) start quickly
+_LAZY = {
+    "AutomationType": "aloof_union.core.models",
+    "WorkflowTranspiler": "aloof_union.core.transpiler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY])
@@ -1,8 +1,109 @@
-import json
+import os
+import sys
+from contextlib import contextmanager
 
 import click
 
-from aloof_union import AutomationType, WorkflowTranspiler
+from aloof_union.core.registry import BUILTIN_ALIASES, BUILTIN_PARSERS, registry
+
+# Everything a command needs beyond this is imported inside the command, so
+# that `--help` and argument errors stay fast and each run only loads the
+# modules it uses.
+
+
+class FormatChoice(click.ParamType):
+    """A format name or alias known to the parser registry, plugins included."""
+
+    name = "format"
+    # Built-in formats only: listing plugins would scan entry points on
+    # every usage line. Plugin names are still accepted.
+    metavar = "[{}|...]".format(
+        "|".join([t.value for t in BUILTIN_PARSERS] + list(BUILTIN_ALIASES))
+    )
+
+    def get_metavar(self, param, ctx=None):
+        return self.metavar
+
+    def convert(self, value, param, ctx):
+        try:
+            return registry.resolve(value)
+        except KeyError:
+            self.fail(
+                f"{value!r} is not a known format; choose from "
+                f"{', '.join(registry.names(aliases=True))}.",
+                param,
+                ctx,
+            )
+
+
+FROM_TYPE_OPTION = click.option(
+    "--from-type", "-f", type=FormatChoice(), required=True, help="Source format."
+)
+
+TO_TYPE_OPTION = click.option(
+    "--to-type", "-t", type=FormatChoice(), required=True, help="Target format."
+)
+
+VALIDATION_OPTION = click.option(
+    "--validation",
+    type=click.Choice(["full", "structural", "none"]),
+    default="structural",
+    show_default=True,
+    help="Checks to run: every rule, only cheap structural ones, or none.",
+)
+
+CACHE_DIR_OPTION = click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Reuse results of unchanged inputs stored in this directory.",
+)
+
+CACHE_MAX_MB_OPTION = click.option(
+    "--cache-max-mb",
+    type=click.FloatRange(min=0),
+    default=None,
+    help="Evict least recently used cache entries beyond this size.",
+)
+
+PROFILE_OPTION = click.option(
+    "--profile",
+    is_flag=True,
+    help="Print a per-stage timing breakdown to stderr.",
+)
+
+PROFILE_DUMP_OPTION = click.option(
+    "--profile-dump",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Write cProfile stats of this process to a file (use -j 1 to "
+    "include conversions run by convert-dir).",
+)
+
+
+@contextmanager
+def _cprofile(path):
+    if path is None:
+        yield
+        return
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+
+def _make_cache(cache_dir, cache_max_mb):
+    if cache_dir is None:
+        return None
+    from aloof_union.core.cache import TranspileCache
+
+    max_bytes = None if cache_max_mb is None else int(cache_max_mb * 1024 * 1024)
+    return TranspileCache(cache_dir, max_bytes)
 
 
 @click.group()
@@ -14,36 +115,133 @@ def cli():
 @cli.command()
 @click.argument("input_file", type=click.Path(exists=True))
 @click.argument("output_file", type=click.Path())
+@FROM_TYPE_OPTION
+@TO_TYPE_OPTION
+@VALIDATION_OPTION
+@CACHE_DIR_OPTION
+@CACHE_MAX_MB_OPTION
+@PROFILE_OPTION
+@PROFILE_DUMP_OPTION
+def convert(
+    input_file,
+    output_file,
+    from_type,
+    to_type,
+    validation,
+    cache_dir,
+    cache_max_mb,
+    profile,
+    profile_dump,
+):
+    """Convert workflow from one format to another.
+
+    INPUT_FILE may be gzip- or zstd-compressed; it is decompressed on the fly.
+    """
+    from aloof_union.core.batch import convert_file
+    from aloof_union.core.instrumentation import StageProfile
+    from aloof_union.core.transpiler import WorkflowTranspiler
+
+    stage_profile = StageProfile() if profile else None
+    transpiler = WorkflowTranspiler(
+        validation=validation,
+        cache=_make_cache(cache_dir, cache_max_mb),
+        observer=stage_profile,
+    )
+    with _cprofile(profile_dump):
+        convert_file(
+            transpiler,
+            input_file,
+            output_file,
+            from_type,
+            to_type,
+        )
+    if stage_profile is not None:
+        click.echo(stage_profile.format(), err=True)
+
+
+@cli.command("convert-dir")
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False))
+@click.argument("output_dir", type=click.Path(file_okay=False))
+@FROM_TYPE_OPTION
+@TO_TYPE_OPTION
 @click.option(
-    "--from-type", "-f", type=click.Choice(["fs", "jsm", "mermaid"]), required=True
+    "--workers",
+    "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes (defaults to the CPU count).",
 )
 @click.option(
-    "--to-type", "-t", type=click.Choice(["fs", "jsm", "mermaid"]), required=True
+    "--pattern",
+    default=None,
+    help="Glob selecting input files (defaults to the source format extension).",
 )
-def convert(input_file, output_file, from_type, to_type):
-    """Convert workflow from one format to another."""
-    format_map = {
-        "fs": AutomationType.FRESHSERVICE,
-        "jsm": AutomationType.JSM,
-        "mermaid": AutomationType.MERMAID,
-    }
+@click.option(
+    "--summary",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Where to write the JSON summary (defaults to OUTPUT_DIR/summary.json).",
+)
+@VALIDATION_OPTION
+@CACHE_DIR_OPTION
+@CACHE_MAX_MB_OPTION
+@PROFILE_OPTION
+@PROFILE_DUMP_OPTION
+def convert_dir(
+    input_dir,
+    output_dir,
+    from_type,
+    to_type,
+    workers,
+    pattern,
+    summary,
+    validation,
+    cache_dir,
+    cache_max_mb,
+    profile,
+    profile_dump,
+):
+    """Convert every workflow file under INPUT_DIR into OUTPUT_DIR.
 
-    transpiler = WorkflowTranspiler()
+    Compressed exports are picked up with e.g. --pattern '*.json.gz'.
+    """
+    from aloof_union.core.batch import convert_directory, write_summary
+    from aloof_union.core.instrumentation import StageProfile
 
-    with open(input_file, "r") as f:
-        content = f.read()
-        if from_type != "mermaid":
-            content = json.loads(content)
+    if summary is None:
+        summary = os.path.join(output_dir, "summary.json")
 
-    result = transpiler.transpile(
-        content, from_type=format_map[from_type], to_type=format_map[to_type]
-    )
+    with _cprofile(profile_dump):
+        results = convert_directory(
+            input_dir,
+            output_dir,
+            from_type,
+            to_type,
+            workers=workers,
+            validation=validation,
+            pattern=pattern,
+            cache=_make_cache(cache_dir, cache_max_mb),
+            profile=profile,
+            exclude=[summary],
+        )
 
-    with open(output_file, "w") as f:
-        if to_type == "mermaid":
-            f.write(result)
-        else:
-            json.dump(result, f, indent=2)
+    os.makedirs(output_dir, exist_ok=True)
+    report = write_summary(results, summary)
+
+    for result in results:
+        if not result.ok:
+            click.echo(f"FAILED {result.source}: {result.error}", err=True)
+    if profile:
+        total = StageProfile()
+        for result in results:
+            total.merge(result.profile)
+        click.echo(total.format(), err=True)
+    click.echo(
+        f"Converted {report['succeeded']}/{report['total']} files "
+        f"({report['failed']} failed); summary written to {summary}"
+    )
+    if report["failed"]:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+# aloof_union/core/analysis/__init__.py
+"""
+Analyses of a workflow's state graph.
+
+Submodules are imported on first use; the simulator needs NumPy, which
+the rest of the package never loads.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .cycles import Condensation, condense
+    from .paths import PathAnalysis, action_cost
+    from .reachability import Reachability
+    from .simulation import SimulationResult, TicketFlowSimulator, simulate
+
+# Module of each lazily exported name
+_LAZY_NAMES = {
+    "Condensation": "cycles",
+    "condense": "cycles",
+    "PathAnalysis": "paths",
+    "action_cost": "paths",
+    "Reachability": "reachability",
+    "SimulationResult": "simulation",
+    "TicketFlowSimulator": "simulation",
+    "simulate": "simulation",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_NAMES:
+        value = getattr(import_module(f".{_LAZY_NAMES[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_NAMES])
+
+
+__all__ = [
+    "Condensation",
+    "condense",
+    "PathAnalysis",
+    "action_cost",
+    "Reachability",
+    "SimulationResult",
+    "TicketFlowSimulator",
+    "simulate",
+]
@@ -0,0 +1,200 @@
+# aloof_union/core/analysis/cycles.py
+"""
+Cycles and the condensation of a workflow's state graph.
+
+Loops such as reopen and escalation cycles are the strongly connected
+components of the graph. Collapsing each component to a single node
+gives the condensation, a DAG that can be ordered and layered. Every
+function here runs in time linear in the number of states and
+transitions.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from aloof_union.core.models import UnifiedWorkflow
+
+
+def strongly_connected_components(
+    adjacency: Sequence[Sequence[int]],
+) -> Tuple[List[List[int]], List[int]]:
+    """
+    Strongly connected components, by an iterative version of Tarjan's
+    algorithm, so deep graphs cannot exhaust the recursion limit.
+
+    Args:
+        adjacency: Successor ids of every state, indexed by state id
+
+    Returns:
+        The components in reverse topological order, so every component
+        comes after all those it can reach, and the component number of
+        every state id
+    """
+    count = len(adjacency)
+    order = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    component_of = [-1] * count
+    components: List[List[int]] = []
+    stack: List[int] = []
+    counter = 0
+
+    for root in range(count):
+        if order[root] != -1:
+            continue
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        # Each frame is a state and the position of its next successor
+        work = [(root, 0)]
+        while work:
+            state, position = work[-1]
+            successors = adjacency[state]
+            if position < len(successors):
+                work[-1] = (state, position + 1)
+                next_id = successors[position]
+                if order[next_id] == -1:
+                    order[next_id] = low[next_id] = counter
+                    counter += 1
+                    stack.append(next_id)
+                    on_stack[next_id] = True
+                    work.append((next_id, 0))
+                elif on_stack[next_id] and order[next_id] < low[state]:
+                    low[state] = order[next_id]
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if low[state] < low[parent]:
+                    low[parent] = low[state]
+            if low[state] == order[state]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component_of[member] = len(components)
+                    component.append(member)
+                    if member == state:
+                        break
+                components.append(component)
+
+    return components, component_of
+
+
+@dataclass
+class Condensation:
+    """
+    A workflow's strongly connected components and the DAG between them.
+
+    Components are numbered in topological order: every transition
+    between two components goes from a lower number to a higher one.
+    """
+
+    #: Member states of each component, in state order
+    components: List[Tuple[str, ...]]
+    #: Component number of every state
+    component_of: Dict[str, int]
+    #: Distinct successor components of each component
+    successors: List[List[int]]
+    #: Whether each component contains a cycle, a self-loop included
+    cyclic: List[bool]
+    #: Whether each component holds or can reach a terminal state
+    terminates: List[bool]
+
+    def cycles(self) -> List[Tuple[str, ...]]:
+        """Member states of every component that contains a cycle."""
+        return [c for c, cyclic in zip(self.components, self.cyclic) if cyclic]
+
+    def non_terminating_cycles(self) -> List[Tuple[str, ...]]:
+        """
+        Cycles that can never reach a terminal state: a ticket entering
+        one can loop but never finish.
+        """
+        return [
+            component
+            for component, cyclic, terminates in zip(
+                self.components, self.cyclic, self.terminates
+            )
+            if cyclic and not terminates
+        ]
+
+    def layer_of(self) -> List[int]:
+        """
+        Layer of each component: the length of the longest chain of
+        components leading to it, so components without predecessors are
+        in layer 0 and every transition goes to a higher layer.
+        """
+        layer = [0] * len(self.components)
+        for number, successors in enumerate(self.successors):
+            next_layer = layer[number] + 1
+            for successor in successors:
+                if layer[successor] < next_layer:
+                    layer[successor] = next_layer
+        return layer
+
+    def layers(self) -> List[List[str]]:
+        """States grouped by the layer of their component, first layer first."""
+        layer = self.layer_of()
+        grouped: List[List[str]] = [[] for _ in range(max(layer, default=-1) + 1)]
+        for component, number in zip(self.components, layer):
+            grouped[number].extend(component)
+        return grouped
+
+
+def condense(workflow: "UnifiedWorkflow") -> Condensation:
+    """
+    Build the condensation of a workflow's state graph.
+
+    Transitions referencing undeclared states are ignored.
+
+    Args:
+        workflow: The workflow to analyse
+
+    Returns:
+        The workflow's components, in topological order
+    """
+    index = workflow.index
+    names = index.names
+    adjacency = index.adjacency
+    reverse_order, tarjan_of = strongly_connected_components(adjacency)
+
+    # Tarjan emits sinks first; renumber so sources come first
+    last = len(reverse_order) - 1
+    component_of = [last - number for number in tarjan_of]
+    members = [sorted(ids) for ids in reversed(reverse_order)]
+
+    successors: List[List[int]] = []
+    cyclic: List[bool] = []
+    seen = [-1] * len(members)
+    for number, ids in enumerate(members):
+        targets = []
+        loops = len(ids) > 1
+        for state in ids:
+            for next_id in adjacency[state]:
+                target = component_of[next_id]
+                if target == number:
+                    loops = True
+                elif seen[target] != number:
+                    seen[target] = number
+                    targets.append(target)
+        successors.append(targets)
+        cyclic.append(loops)
+
+    # Successors have higher numbers, so walk backwards
+    terminal = set(index.terminal)
+    terminates = [False] * len(members)
+    for number in range(len(members) - 1, -1, -1):
+        terminates[number] = any(names[i] in terminal for i in members[number]) or any(
+            terminates[target] for target in successors[number]
+        )
+
+    return Condensation(
+        components=[tuple(names[i] for i in ids) for ids in members],
+        component_of={name: component_of[i] for i, name in enumerate(names)},
+        successors=successors,
+        cyclic=cyclic,
+        terminates=terminates,
+    )
@@ -0,0 +1,352 @@
+# aloof_union/core/analysis/paths.py
+"""
+Shortest and critical paths between workflow states.
+
+:class:`PathAnalysis` builds a weighted adjacency list once and memoizes
+every single-source search, so repeated queries from the same state cost
+a dictionary lookup. Without costs every transition counts as one hop
+and searches are breadth-first; with costs they use Dijkstra's algorithm.
+"""
+
+import heapq
+import math
+import os
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from aloof_union.core.index import WorkflowIndex
+    from aloof_union.core.models import Transition, UnifiedWorkflow
+
+#: Cost of taking a transition
+CostFunction = Callable[["Transition"], float]
+#: A cost function, or a side table of costs per ``(from_state, to_state)``
+Costs = Union[CostFunction, Mapping[Tuple[str, str], float]]
+#: Successor ids and transition costs of every state, indexed by state id
+WeightedAdjacency = List[List[Tuple[int, float]]]
+#: Distance to and predecessor of every state id, from one source
+SearchResult = Tuple[List[float], List[int]]
+
+
+def action_cost(parameter: str = "cost", default: float = 1.0) -> CostFunction:
+    """
+    Cost stored in the parameters of a transition's actions.
+
+    Args:
+        parameter: Action parameter holding the cost
+        default: Cost of a transition none of whose actions set ``parameter``
+
+    Returns:
+        A cost function summing ``parameter`` over the transition's actions
+    """
+
+    def cost(transition: "Transition") -> float:
+        values = [
+            action.parameters[parameter]
+            for action in transition.actions
+            if action.parameters and parameter in action.parameters
+        ]
+        return float(sum(values)) if values else default
+
+    return cost
+
+
+def _weighted_adjacency(
+    workflow: "UnifiedWorkflow", costs: Optional[Costs], default: float
+) -> WeightedAdjacency:
+    """Cheapest transition to every successor of every state."""
+    index = workflow.index
+    ids = index.ids
+    if costs is None:
+        return [[(target, 1.0) for target in targets] for targets in index.adjacency]
+
+    if callable(costs):
+        cost_of = costs
+    else:
+        table = costs
+
+        def cost_of(transition: "Transition") -> float:
+            return table.get((transition.from_state, transition.to_state), default)
+
+    adjacency: WeightedAdjacency = []
+    for name in index.names:
+        cheapest: Dict[int, float] = {}
+        for transition in index.outgoing[name]:
+            target = ids.get(transition.to_state)
+            if target is None:
+                continue
+            cost = float(cost_of(transition))
+            if cost < 0 or math.isnan(cost):
+                raise ValueError(
+                    f"Transition {transition.from_state} -> {transition.to_state} "
+                    f"has invalid cost {cost}"
+                )
+            if cost < cheapest.get(target, math.inf):
+                cheapest[target] = cost
+        adjacency.append(list(cheapest.items()))
+    return adjacency
+
+
+def _search(adjacency: WeightedAdjacency, weighted: bool, source: int) -> SearchResult:
+    """
+    Single-source shortest paths: breadth-first when every transition
+    costs one hop, Dijkstra's algorithm otherwise.
+    """
+    distance = [math.inf] * len(adjacency)
+    previous = [-1] * len(adjacency)
+    distance[source] = 0
+
+    if not weighted:
+        queue = deque([source])
+        while queue:
+            state = queue.popleft()
+            next_distance = distance[state] + 1
+            for target, _ in adjacency[state]:
+                if distance[target] == math.inf:
+                    distance[target] = next_distance
+                    previous[target] = state
+                    queue.append(target)
+        return distance, previous
+
+    heap = [(0.0, source)]
+    while heap:
+        state_distance, state = heapq.heappop(heap)
+        if state_distance > distance[state]:
+            continue
+        for target, cost in adjacency[state]:
+            next_distance = state_distance + cost
+            if next_distance < distance[target]:
+                distance[target] = next_distance
+                previous[target] = state
+                heapq.heappush(heap, (next_distance, target))
+    return distance, previous
+
+
+# Graph shared by the searches of one worker process
+_worker_graph: Optional[Tuple[WeightedAdjacency, bool]] = None
+
+
+def _init_worker(adjacency: WeightedAdjacency, weighted: bool) -> None:
+    global _worker_graph
+    _worker_graph = (adjacency, weighted)
+
+
+def _search_many(sources: Sequence[int]) -> List[Tuple[int, SearchResult]]:
+    adjacency, weighted = _worker_graph
+    return [(source, _search(adjacency, weighted, source)) for source in sources]
+
+
+def _trace(previous: List[int], target: int) -> List[int]:
+    path = [target]
+    while previous[path[-1]] != -1:
+        path.append(previous[path[-1]])
+    path.reverse()
+    return path
+
+
+class PathAnalysis:
+    """
+    Shortest and critical paths over a workflow's state graph.
+
+    Obtain the hop-count analysis through :meth:`UnifiedWorkflow.paths`,
+    which caches it with the workflow's index. Transitions referencing
+    undeclared states are ignored, and of parallel transitions between
+    the same states only the cheapest counts.
+    """
+
+    def __init__(
+        self,
+        workflow: "UnifiedWorkflow",
+        costs: Optional[Costs] = None,
+        default_cost: float = 1.0,
+    ):
+        """
+        Args:
+            workflow: The workflow to analyse
+            costs: Cost of each transition, as a function of the transition
+                (see :func:`action_cost`) or a mapping from
+                ``(from_state, to_state)``. Every transition costs one hop
+                when omitted.
+            default_cost: Cost of transitions missing from a ``costs``
+                mapping
+
+        Raises:
+            ValueError: If a transition's cost is negative or NaN
+        """
+        #: Graph index the analysis was built from
+        self.index: "WorkflowIndex" = workflow.index
+        #: State names; position is the state's integer id
+        self.names = self.index.names
+        #: Integer id of every state
+        self.ids = self.index.ids
+
+        self._weighted = costs is not None
+        self._adjacency = _weighted_adjacency(workflow, costs, default_cost)
+        self._results: Dict[int, SearchResult] = {}
+
+    def _id(self, state: str) -> int:
+        try:
+            return self.ids[state]
+        except KeyError:
+            raise KeyError(f"Unknown state: {state}") from None
+
+    def _from(self, source: int) -> SearchResult:
+        result = self._results.get(source)
+        if result is None:
+            result = _search(self._adjacency, self._weighted, source)
+            self._results[source] = result
+        return result
+
+    def distances(self, source: str) -> Dict[str, float]:
+        """
+        Shortest distance from ``source`` to every state it can reach.
+
+        Returns:
+            Distances in state order, ``source`` itself at distance 0
+        """
+        distance, _ = self._from(self._id(source))
+        return {name: d for name, d in zip(self.names, distance) if d != math.inf}
+
+    def distance(self, source: str, target: str) -> Optional[float]:
+        """Shortest distance from ``source`` to ``target``, or None if unreachable."""
+        distance = self._from(self._id(source))[0][self._id(target)]
+        return None if distance == math.inf else distance
+
+    def shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """
+        States along a shortest path from ``source`` to ``target``.
+
+        Returns:
+            The path, both ends included, or None if ``target`` is
+            unreachable
+        """
+        distance, previous = self._from(self._id(source))
+        target_id = self._id(target)
+        if distance[target_id] == math.inf:
+            return None
+        return [self.names[i] for i in _trace(previous, target_id)]
+
+    def initial_to_terminal(self) -> Dict[Tuple[str, str], float]:
+        """
+        Shortest distance from each initial state to each terminal state.
+
+        Returns:
+            Distances keyed by ``(initial, terminal)``; pairs with no path
+            between them are left out
+        """
+        found = {}
+        for initial in self.index.initial:
+            distance, _ = self._from(self.ids[initial])
+            for terminal in self.index.terminal:
+                d = distance[self.ids[terminal]]
+                if d != math.inf:
+                    found[initial, terminal] = d
+        return found
+
+    def all_pairs(self, workers: Optional[int] = 1) -> Dict[str, Dict[str, float]]:
+        """
+        Shortest distances between every pair of connected states.
+
+        Args:
+            workers: Number of worker processes searching from disjoint sets
+                of sources; ``None`` uses the CPU count. ``1`` searches in
+                the calling process.
+
+        Returns:
+            For every state, its :meth:`distances`
+        """
+        missing = [i for i in range(len(self.names)) if i not in self._results]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = max(1, min(workers, len(missing)))
+
+        if workers > 1:
+            # Imported here so single-process searches don't pay for it
+            from concurrent.futures import ProcessPoolExecutor
+
+            chunk = max(1, len(missing) // (workers * 4))
+            chunks = [missing[i : i + chunk] for i in range(0, len(missing), chunk)]
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self._adjacency, self._weighted),
+            ) as pool:
+                for results in pool.map(_search_many, chunks):
+                    self._results.update(results)
+
+        return {name: self.distances(name) for name in self.names}
+
+    def critical_path(self) -> Tuple[float, List[str]]:
+        """
+        Longest acyclic path from an initial state to a terminal state.
+
+        The longest path through a graph with cycles is unbounded. A
+        depth-first search from the initial states therefore drops its back
+        edges, the transitions that close a loop such as a reopen, and the
+        longest path is taken over the DAG that remains. Paths start at any
+        state when the workflow has no initial states, and end at any state
+        when it has no terminal states.
+
+        Returns:
+            The path's total cost and its states, or ``(0, [])`` when no
+            initial state leads to a terminal state
+        """
+        adjacency = self._adjacency
+        names, ids = self.names, self.ids
+        starts = [ids[name] for name in self.index.initial or names]
+        ends = {ids[name] for name in self.index.terminal or names}
+
+        # Iterative DFS; finishing order reversed is a topological order of
+        # the graph without its back edges
+        visited = [False] * len(names)
+        on_path = [False] * len(names)
+        back_edges = set()
+        finished = []
+        for root in starts:
+            if visited[root]:
+                continue
+            visited[root] = on_path[root] = True
+            work = [(root, 0)]
+            while work:
+                state, position = work[-1]
+                if position < len(adjacency[state]):
+                    work[-1] = (state, position + 1)
+                    target = adjacency[state][position][0]
+                    if on_path[target]:
+                        back_edges.add((state, target))
+                    elif not visited[target]:
+                        visited[target] = on_path[target] = True
+                        work.append((target, 0))
+                    continue
+                work.pop()
+                on_path[state] = False
+                finished.append(state)
+
+        length = [-math.inf] * len(names)
+        previous = [-1] * len(names)
+        for state in starts:
+            length[state] = 0
+        best: Tuple[float, int] = (-math.inf, -1)
+        for state in reversed(finished):
+            if state in ends and length[state] > best[0]:
+                best = (length[state], state)
+            for target, cost in adjacency[state]:
+                if (state, target) in back_edges:
+                    continue
+                if length[state] + cost > length[target]:
+                    length[target] = length[state] + cost
+                    previous[target] = state
+
+        if best[1] == -1:
+            return 0, []
+        return best[0], [names[i] for i in _trace(previous, best[1])]
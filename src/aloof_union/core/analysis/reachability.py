@@ -0,0 +1,196 @@
+# aloof_union/core/analysis/reachability.py
+"""
+Reachability queries over a workflow's state graph.
+
+:class:`Reachability` computes the transitive closure once, storing the
+states reachable from each strongly connected component as the bits of a
+Python int, so "can A reach B?" is a single bit test afterwards. The
+closure takes O(V²) bits; :func:`reachable_ids` answers the single-source
+questions the validator needs in linear time instead.
+"""
+
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence
+
+from .cycles import strongly_connected_components
+
+if TYPE_CHECKING:
+    from aloof_union.core.models import UnifiedWorkflow
+
+
+def reachable_ids(
+    adjacency: Sequence[Sequence[int]], sources: Iterable[int]
+) -> List[bool]:
+    """
+    Mark every state reachable from any of ``sources``, themselves included.
+
+    Args:
+        adjacency: Successor ids of every state, indexed by state id; pass
+            a reverse adjacency to find the states that reach ``sources``
+        sources: Ids to start from
+
+    Returns:
+        One flag per state id
+    """
+    seen = [False] * len(adjacency)
+    stack = []
+    for source in sources:
+        if not seen[source]:
+            seen[source] = True
+            stack.append(source)
+    while stack:
+        for next_id in adjacency[stack.pop()]:
+            if not seen[next_id]:
+                seen[next_id] = True
+                stack.append(next_id)
+    return seen
+
+
+def _closure(
+    components: Sequence[Sequence[int]],
+    component_of: Sequence[int],
+    adjacency: Sequence[Sequence[int]],
+) -> List[int]:
+    """
+    Bitset of the states reachable from each component.
+
+    ``components`` must list every component after all those it can reach
+    through ``adjacency``. A component with a cycle reaches its own states.
+    """
+    own = [sum(1 << member for member in members) for members in components]
+    reach = [0] * len(components)
+    for number, members in enumerate(components):
+        bits = 0
+        cyclic = len(members) > 1
+        targets = set()
+        for member in members:
+            for next_id in adjacency[member]:
+                target = component_of[next_id]
+                if target == number:
+                    cyclic = True
+                else:
+                    targets.add(target)
+        if cyclic:
+            bits = own[number]
+        for target in targets:
+            bits |= reach[target] | own[target]
+        reach[number] = bits
+    return reach
+
+
+def _ids(bits: int) -> List[int]:
+    """Positions of the set bits of ``bits``, lowest first."""
+    return [i for i, bit in enumerate(bin(bits)[:1:-1]) if bit == "1"]
+
+
+class Reachability:
+    """
+    Transitive closure of a workflow's state graph.
+
+    A state reaches another when a chain of one or more transitions leads
+    from it to the other; a state reaches itself only through a cycle.
+    Transitions referencing undeclared states are ignored. The closure is
+    not updated when the workflow changes afterwards.
+    """
+
+    def __init__(self, workflow: "UnifiedWorkflow"):
+        index = workflow.index
+        #: State names; position is the state's integer id
+        self.names = list(index.names)
+        #: Integer id of every state
+        self.ids = dict(index.ids)
+
+        self._adjacency = index.adjacency
+        self._reverse_adjacency = index.reverse_adjacency
+        self._components, self._component_of = strongly_connected_components(
+            self._adjacency
+        )
+        self._reach = _closure(self._components, self._component_of, self._adjacency)
+        self._reached_by: Optional[List[int]] = None
+
+        self._initial = 0
+        for name in index.initial:
+            self._initial |= 1 << self.ids[name]
+        self._terminal = 0
+        for name in index.terminal:
+            self._terminal |= 1 << self.ids[name]
+
+        # States reachable from an initial state, and those able to reach
+        # a terminal state, each counting the states themselves
+        self._from_initial = self._initial
+        for name in index.initial:
+            self._from_initial |= self._bits(name)
+        self._to_terminal = self._terminal
+        if self._terminal:
+            for state in range(len(self.names)):
+                if self._reach[self._component_of[state]] & self._terminal:
+                    self._to_terminal |= 1 << state
+
+    def _id(self, state: str) -> int:
+        try:
+            return self.ids[state]
+        except KeyError:
+            raise KeyError(f"Unknown state: {state}") from None
+
+    def _bits(self, state: str) -> int:
+        return self._reach[self._component_of[self._id(state)]]
+
+    def _names(self, bits: int) -> List[str]:
+        names = self.names
+        return [names[i] for i in _ids(bits)]
+
+    def can_reach(self, source: str, target: str) -> bool:
+        """
+        Whether some chain of transitions leads from ``source`` to ``target``.
+
+        Raises:
+            KeyError: If either state is not in the workflow
+        """
+        return bool(self._bits(source) >> self._id(target) & 1)
+
+    def reachable_from(self, state: str) -> List[str]:
+        """States ``state`` can reach, in state order."""
+        return self._names(self._bits(state))
+
+    def reaching(self, state: str) -> List[str]:
+        """States that can reach ``state``, in state order."""
+        if self._reached_by is None:
+            # Sources come last in the forward order, so reversing it lists
+            # every component after all those reaching it
+            components = self._components[::-1]
+            last = len(components) - 1
+            component_of = [last - c for c in self._component_of]
+            reached_by = _closure(components, component_of, self._reverse_adjacency)
+            self._reached_by = reached_by[::-1]
+        return self._names(self._reached_by[self._component_of[self._id(state)]])
+
+    def can_terminate(self, state: str) -> bool:
+        """Whether ``state`` is terminal or can reach a terminal state."""
+        return bool(self._to_terminal >> self._id(state) & 1)
+
+    def unreachable(self) -> List[str]:
+        """States no initial state can reach, initial states excepted."""
+        everything = (1 << len(self.names)) - 1
+        return self._names(everything & ~self._from_initial)
+
+    def dead_ends(self) -> List[str]:
+        """
+        Reachable states that are not terminal but have no way out.
+        """
+        candidates = self._from_initial & ~self._terminal
+        return [
+            name
+            for name in self._names(candidates)
+            if not self._adjacency[self.ids[name]]
+        ]
+
+    def traps(self) -> List[str]:
+        """
+        Reachable states with outgoing transitions that can never reach a
+        terminal state. Empty when the workflow has no terminal states.
+        """
+        if not self._terminal:
+            return []
+        candidates = self._from_initial & ~self._to_terminal
+        return [
+            name for name in self._names(candidates) if self._adjacency[self.ids[name]]
+        ]
@@ -0,0 +1,422 @@
+# aloof_union/core/analysis/simulation.py
+"""
+Monte Carlo simulation of tickets flowing through a workflow.
+
+Tickets start in the initial states, wait in each state for a random
+dwell time, then take one of the state's outgoing transitions at random,
+until they reach a terminal state. Tickets are stepped in NumPy batches:
+one step moves every ticket still in flight at once, so millions of
+tickets cost a few hundred array operations rather than a Python loop per
+ticket.
+
+Transitions are chosen with Walker alias tables, laid out flat with one
+slot per route: a single uniform draw per ticket picks a slot of its
+state and then either the slot's own target or its alias. Choosing the
+next state is thus a constant number of array gathers whatever the
+number of routes.
+
+NumPy is an optional dependency (``pip install aloof-union[simulation]``).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from ..models import UnifiedWorkflow
+
+#: Draws ``size`` dwell times from a random generator
+Sampler = Callable[[Any, int], Any]
+#: A dwell-time distribution, or a fixed duration
+DwellTime = Union[float, Sampler]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Simulation needs the numpy package "
+            "(pip install aloof-union[simulation])"
+        )
+
+
+def fixed(duration: float) -> Sampler:
+    """Dwell time that is always ``duration``."""
+    return lambda rng, size: np.full(size, float(duration))
+
+
+def exponential(mean: float) -> Sampler:
+    """Exponentially distributed dwell time with the given mean."""
+    return lambda rng, size: rng.exponential(mean, size)
+
+
+def uniform(low: float, high: float) -> Sampler:
+    """Dwell time drawn uniformly from ``[low, high)``."""
+    return lambda rng, size: rng.uniform(low, high, size)
+
+
+def lognormal(mu: float, sigma: float) -> Sampler:
+    """Log-normal dwell time; ``mu`` and ``sigma`` describe its logarithm."""
+    return lambda rng, size: rng.lognormal(mu, sigma, size)
+
+
+def empirical(samples: Sequence[float]) -> Sampler:
+    """Dwell time resampled from observed durations."""
+    _require_numpy()
+    observed = np.asarray(samples, dtype=float)
+    if not observed.size:
+        raise ValueError("An empirical distribution needs at least one sample")
+    return lambda rng, size: rng.choice(observed, size)
+
+
+def _alias_table(weights: List[float]) -> Tuple[List[float], List[int]]:
+    """
+    Build a Walker alias table for sampling indices by weight (Vose's method).
+
+    Returns:
+        Per slot, the probability of keeping the slot's own index and the
+        index to take otherwise
+    """
+    k = len(weights)
+    total = sum(weights)
+    scaled = [w * k / total for w in weights]
+    cutoff = [1.0] * k
+    alias = list(range(k))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        low, high = small.pop(), large[-1]
+        cutoff[low] = scaled[low]
+        alias[low] = high
+        scaled[high] -= 1.0 - scaled[low]
+        if scaled[high] < 1.0:
+            small.append(large.pop())
+    # Whatever remains is 1 up to rounding and keeps its own index
+    return cutoff, alias
+
+
+@dataclass(eq=False)
+class SimulationResult:
+    """
+    Outcome of a simulation run.
+
+    Per-state arrays are indexed by state id, in the order of
+    :attr:`states`.
+    """
+
+    #: State names, in workflow order
+    states: List[str]
+    #: Number of tickets simulated
+    tickets: int
+    #: Time from start to terminal state of every completed ticket
+    cycle_times: Any
+    #: Number of times tickets entered each state and waited in it
+    visits: Any
+    #: Total time all tickets spent in each state
+    time_in_state: Any
+    #: Number of tickets that finished in each state
+    ended_in: Any
+    #: Tickets stopped in a non-terminal state without outgoing transitions
+    stuck: int
+    #: Tickets still moving when the step limit was reached
+    unfinished: int
+
+    @property
+    def completed(self) -> int:
+        """Number of tickets that reached a terminal state."""
+        return len(self.cycle_times)
+
+    @property
+    def mean_cycle_time(self) -> float:
+        """Mean time to a terminal state of the completed tickets."""
+        return float(self.cycle_times.mean()) if self.completed else float("nan")
+
+    def percentiles(self, q: Sequence[float] = (50, 90, 99)) -> Dict[float, float]:
+        """Percentiles of the cycle time of completed tickets."""
+        if not self.completed:
+            return {p: float("nan") for p in q}
+        return dict(zip(q, np.percentile(self.cycle_times, q).tolist()))
+
+    def occupancy(self, arrival_rate: float = 1.0) -> Dict[str, float]:
+        """
+        Mean number of tickets in each state at steady state.
+
+        By Little's law this is the arrival rate times the mean time a
+        ticket spends in the state.
+
+        Args:
+            arrival_rate: New tickets per time unit
+        """
+        per_ticket = self.time_in_state * (arrival_rate / self.tickets)
+        return dict(zip(self.states, per_ticket.tolist()))
+
+    def bottlenecks(self, top: int = 3) -> List[Tuple[str, float]]:
+        """
+        States holding tickets longest, with their share of all ticket time.
+
+        Args:
+            top: Number of states to return
+        """
+        total = self.time_in_state.sum()
+        if not total:
+            return []
+        order = np.argsort(-self.time_in_state, kind="stable")[:top]
+        return [
+            (self.states[i], float(self.time_in_state[i] / total))
+            for i in order
+            if self.time_in_state[i]
+        ]
+
+    def format(self, top: int = 5) -> str:
+        """Render a summary of the run as text."""
+        lines = [
+            f"{self.tickets} tickets: {self.completed} completed, "
+            f"{self.stuck} stuck, {self.unfinished} unfinished"
+        ]
+        if self.completed:
+            spread = ", ".join(
+                f"p{p:g} {value:.2f}" for p, value in self.percentiles().items()
+            )
+            lines.append(f"cycle time: mean {self.mean_cycle_time:.2f}, {spread}")
+        occupancy = self.occupancy()
+        for name, share in self.bottlenecks(top):
+            lines.append(
+                f"  {name:<24}{share:>7.1%} of ticket time, "
+                f"{occupancy[name]:.2f} tickets per unit arrival rate"
+            )
+        return "\n".join(lines)
+
+
+class TicketFlowSimulator:
+    """
+    Simulator compiled from a workflow, ready for repeated runs.
+
+    Transition probabilities are given per ``(from_state, to_state)`` pair;
+    several transitions between the same two states count as one route.
+    Routes out of a state that have no probability share what the given
+    ones leave equally. When every route has one, they are used as
+    relative weights. Dwell times are given per state, as a distribution
+    from this module, any callable ``(rng, size) -> array``, or a number
+    for a fixed duration.
+
+    Terminal states end a ticket's flow, as do non-terminal states without
+    outgoing transitions; tickets ending in the latter count as stuck.
+    Transitions to undeclared states are ignored.
+    """
+
+    def __init__(
+        self,
+        workflow: UnifiedWorkflow,
+        probabilities: Optional[Mapping[Tuple[str, str], float]] = None,
+        dwell: Optional[Mapping[str, DwellTime]] = None,
+        default_dwell: DwellTime = 1.0,
+    ):
+        """
+        Args:
+            workflow: The workflow to simulate
+            probabilities: Probability of each ``(from_state, to_state)`` route
+            dwell: Dwell-time distribution of each state
+            default_dwell: Dwell time of states missing from ``dwell``
+
+        Raises:
+            ImportError: If NumPy is not installed
+            ValueError: If the workflow has no initial state, or a
+                probability or dwell time refers to an unknown state or route
+                or does not add up
+        """
+        _require_numpy()
+        index = workflow.index
+        self.states: List[str] = list(index.names)
+        ids = index.ids
+        n = len(self.states)
+
+        if not index.initial:
+            raise ValueError("Workflow has no initial state to start tickets in")
+        self._starts = np.array([ids[name] for name in index.initial], dtype=np.intp)
+        self._terminal = np.zeros(n, dtype=bool)
+        self._terminal[[ids[name] for name in index.terminal]] = True
+
+        self._compile_routes(index.adjacency, ids, dict(probabilities or {}))
+        self._compile_dwell(ids, dict(dwell or {}), default_dwell)
+
+    def _compile_routes(
+        self,
+        adjacency: List[List[int]],
+        ids: Dict[str, int],
+        probabilities: Dict[Tuple[str, str], float],
+    ) -> None:
+        for from_state, to_state in probabilities:
+            source, target = ids.get(from_state), ids.get(to_state)
+            if source is None or target not in adjacency[source]:
+                raise ValueError(f"No transition from {from_state!r} to {to_state!r}")
+
+        cutoffs: List[float] = []
+        targets: List[int] = []
+        aliases: List[int] = []
+        first = np.zeros(len(self.states), dtype=np.intp)
+        degree = np.zeros(len(self.states), dtype=np.intp)
+        for source, successors in enumerate(adjacency):
+            first[source] = len(targets)
+            if self._terminal[source] or not successors:
+                continue
+            name = self.states[source]
+            weights = [probabilities.get((name, self.states[t])) for t in successors]
+            cutoff, alias = _alias_table(self._fill_weights(name, weights))
+            cutoffs.extend(cutoff)
+            targets.extend(successors)
+            aliases.extend(successors[a] for a in alias)
+            degree[source] = len(successors)
+
+        self._cutoffs = np.array(cutoffs, dtype=float)
+        self._targets = np.array(targets, dtype=np.intp)
+        self._aliases = np.array(aliases, dtype=np.intp)
+        self._first = first
+        self._degree = degree
+        # Ticket flow stops in terminal states and in dead ends
+        self._absorbing = self._terminal | (degree == 0)
+
+    @staticmethod
+    def _fill_weights(name: str, weights: List[Optional[float]]) -> List[float]:
+        given = [w for w in weights if w is not None]
+        if any(w < 0 for w in given):
+            raise ValueError(f"Negative transition probability out of {name!r}")
+        missing = len(weights) - len(given)
+        if missing:
+            share = (1.0 - sum(given)) / missing
+            if share < -1e-9:
+                raise ValueError(f"Probabilities out of {name!r} add up to over 1")
+            return [max(share, 0.0) if w is None else w for w in weights]
+        if not sum(given):
+            raise ValueError(f"Probabilities out of {name!r} add up to 0")
+        return given
+
+    def _compile_dwell(
+        self, ids: Dict[str, int], dwell: Dict[str, DwellTime], default: DwellTime
+    ) -> None:
+        unknown = [name for name in dwell if name not in ids]
+        if unknown:
+            raise ValueError(f"Dwell time given for unknown state {unknown[0]!r}")
+
+        def sampler(value: DwellTime) -> Sampler:
+            return value if callable(value) else fixed(value)
+
+        # One sampler per distinct distribution, so that a step draws once
+        # per distribution rather than once per state
+        samplers: List[Sampler] = [sampler(default)]
+        kinds = np.zeros(len(self.states), dtype=np.intp)
+        seen: Dict[int, int] = {}
+        for name, value in dwell.items():
+            kind = seen.get(id(value))
+            if kind is None:
+                kind = seen[id(value)] = len(samplers)
+                samplers.append(sampler(value))
+            kinds[ids[name]] = kind
+        self._samplers = samplers
+        self._kinds = kinds
+
+    def _dwell(self, rng: Any, states: Any) -> Any:
+        kinds = self._kinds[states]
+        present = np.flatnonzero(np.bincount(kinds, minlength=len(self._samplers)))
+        if len(present) == 1:
+            return np.asarray(self._samplers[present[0]](rng, len(states)), float)
+        times = np.empty(len(states))
+        for kind in present:
+            mask = kinds == kind
+            times[mask] = self._samplers[kind](rng, int(mask.sum()))
+        return times
+
+    def _step(self, rng: Any, states: Any) -> Any:
+        degree = self._degree[states]
+        scaled = rng.random(len(states)) * degree
+        slots = scaled.astype(np.intp)
+        # The fractional part is itself uniform and decides slot vs alias
+        coin = scaled - slots
+        # Guards against u * k rounding up to k for draws just below 1
+        np.minimum(slots, degree - 1, out=slots)
+        slots += self._first[states]
+        return np.where(
+            coin < self._cutoffs[slots], self._targets[slots], self._aliases[slots]
+        )
+
+    def run(
+        self,
+        tickets: int,
+        seed: Optional[int] = None,
+        max_steps: int = 1000,
+        batch_size: int = 1_000_000,
+    ) -> SimulationResult:
+        """
+        Simulate tickets through the workflow.
+
+        Args:
+            tickets: Number of tickets to simulate
+            seed: Seed of the random generator; equal seeds give equal results
+            max_steps: Transitions a ticket may take before it is given up on
+                as unfinished, which bounds runs through cycles
+            batch_size: Tickets stepped together; bounds memory use
+
+        Returns:
+            The aggregated outcome of all tickets
+        """
+        rng = np.random.default_rng(seed)
+        n = len(self.states)
+        visits = np.zeros(n, dtype=np.int64)
+        time_in_state = np.zeros(n)
+        ended_in = np.zeros(n, dtype=np.int64)
+        cycle_times = []
+        unfinished = 0
+
+        for offset in range(0, tickets, batch_size):
+            size = min(batch_size, tickets - offset)
+            states = self._starts[rng.integers(len(self._starts), size=size)]
+            clock = np.zeros(size)
+
+            for step in range(max_steps + 1):
+                finished = self._absorbing[states]
+                if finished.any():
+                    ended = states[finished]
+                    ended_in += np.bincount(ended, minlength=n)
+                    cycle_times.append(clock[finished][self._terminal[ended]])
+                    states, clock = states[~finished], clock[~finished]
+                if not len(states):
+                    break
+                if step == max_steps:
+                    unfinished += len(states)
+                    break
+
+                dwell = self._dwell(rng, states)
+                clock += dwell
+                visits += np.bincount(states, minlength=n)
+                time_in_state += np.bincount(states, weights=dwell, minlength=n)
+                states = self._step(rng, states)
+
+        return SimulationResult(
+            states=self.states,
+            tickets=tickets,
+            cycle_times=np.concatenate(cycle_times) if cycle_times else np.zeros(0),
+            visits=visits,
+            time_in_state=time_in_state,
+            ended_in=ended_in,
+            stuck=int(ended_in[~self._terminal].sum()),
+            unfinished=unfinished,
+        )
+
+
+def simulate(
+    workflow: UnifiedWorkflow,
+    tickets: int,
+    probabilities: Optional[Mapping[Tuple[str, str], float]] = None,
+    dwell: Optional[Mapping[str, DwellTime]] = None,
+    seed: Optional[int] = None,
+    **options: Any,
+) -> SimulationResult:
+    """
+    Simulate tickets through a workflow in one call.
+
+    See :class:`TicketFlowSimulator` for the arguments; ``options`` are
+    passed on to :meth:`TicketFlowSimulator.run`.
+    """
+    simulator = TicketFlowSimulator(workflow, probabilities, dwell)
+    return simulator.run(tickets, seed=seed, **options)
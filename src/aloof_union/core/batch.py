@@ -0,0 +1,269 @@
+# aloof_union/core/batch.py
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .inputs import open_input, strip_compression_suffix
+from .instrumentation import StageProfile
+from .models import AutomationType
+from .parsers import get_parser
+from .registry import FormatType
+from .transpiler import WorkflowTranspiler
+
+if TYPE_CHECKING:
+    from .cache import TranspileCache
+
+# File extensions used when walking input trees and naming converted files;
+# other formats use their parser's ``extension``
+FORMAT_EXTENSIONS: Dict[AutomationType, str] = {
+    AutomationType.FRESHSERVICE: ".json",
+    AutomationType.JSM: ".json",
+    AutomationType.MERMAID: ".mmd",
+}
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# One transpiler per worker process, created by the pool initializer
+_worker_transpiler: Optional[WorkflowTranspiler] = None
+_worker_profile = False
+_process_umask: Optional[int] = None
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of converting a single file."""
+
+    source: str
+    target: Optional[str]
+    ok: bool
+    error: Optional[str] = None
+    seconds: float = 0.0
+    #: Per-stage breakdown, when profiling was requested
+    profile: Optional[StageProfile] = None
+
+
+def _umask() -> int:
+    # Reading the umask means setting it; do so once per process
+    global _process_umask
+    if _process_umask is None:
+        _process_umask = os.umask(0o022)
+        os.umask(_process_umask)
+    return _process_umask
+
+
+def convert_file(
+    transpiler: WorkflowTranspiler,
+    input_file: PathLike,
+    output_file: PathLike,
+    from_type: FormatType,
+    to_type: FormatType,
+    validate: bool = True,
+) -> None:
+    """
+    Convert a single workflow file from one format to another.
+
+    The input is read as bytes: gzip and zstd files are decompressed on the
+    fly and uncompressed ones are memory-mapped, see :mod:`.inputs`.
+
+    Args:
+        transpiler: The transpiler used for the conversion
+        input_file: Path of the workflow to read
+        output_file: Path the converted workflow is written to
+        from_type: The source format type
+        to_type: The target format type
+        validate: Whether to validate the workflow during conversion
+
+    Raises:
+        ValueError: If ``output_file`` is ``input_file``
+    """
+    output_path = Path(output_file)
+    if output_path.resolve() == Path(input_file).resolve():
+        raise ValueError(f"Output file {output_file} would overwrite its input")
+
+    # Write to a temporary file first so a failed run leaves any earlier
+    # output intact and readers never see a partial file
+    fd, tmp = tempfile.mkstemp(
+        dir=output_path.parent, prefix=".tmp-", suffix=output_path.suffix
+    )
+    try:
+        # Wrap the descriptor first so it is closed if opening the input fails
+        with os.fdopen(fd, "w") as dst, open_input(input_file) as src:
+            transpiler.transpile_stream(
+                src, from_type=from_type, to_type=to_type, validate=validate, output=dst
+            )
+        # mkstemp creates the file owner-only; give it the usual permissions
+        os.chmod(tmp, 0o666 & ~_umask())
+        os.replace(tmp, output_path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def format_extension(automation_type: FormatType) -> str:
+    """File extension of a format, e.g. ``".mmd"`` for Mermaid."""
+    if automation_type in FORMAT_EXTENSIONS:
+        return FORMAT_EXTENSIONS[automation_type]  # type: ignore[index]
+    return get_parser(automation_type).extension
+
+
+def find_input_files(input_dir: PathLike, pattern: str) -> List[Path]:
+    """Recursively collect files under ``input_dir`` matching ``pattern``."""
+    return sorted(p for p in Path(input_dir).rglob(pattern) if p.is_file())
+
+
+def _init_worker(
+    validation: str = "structural",
+    cache: Optional["TranspileCache"] = None,
+    profile: bool = False,
+) -> None:
+    global _worker_transpiler, _worker_profile
+    _worker_transpiler = WorkflowTranspiler(validation=validation, cache=cache)
+    _worker_profile = profile
+
+
+def _convert_job(
+    job: Tuple[str, str, FormatType, FormatType],
+) -> ConversionResult:
+    source, target, from_type, to_type = job
+    profile = StageProfile() if _worker_profile else None
+    _worker_transpiler.observer = profile
+
+    start = time.perf_counter()
+    try:
+        Path(target).parent.mkdir(parents=True, exist_ok=True)
+        convert_file(_worker_transpiler, source, target, from_type, to_type)
+    except Exception as e:
+        return ConversionResult(
+            source=source,
+            target=None,
+            ok=False,
+            error=f"{type(e).__name__}: {e}",
+            seconds=time.perf_counter() - start,
+            profile=profile,
+        )
+    return ConversionResult(
+        source=source,
+        target=target,
+        ok=True,
+        seconds=time.perf_counter() - start,
+        profile=profile,
+    )
+
+
+def _is_within(path: Path, roots: List[Path]) -> bool:
+    return any(path == root or root in path.parents for root in roots)
+
+
+def convert_directory(
+    input_dir: PathLike,
+    output_dir: PathLike,
+    from_type: FormatType,
+    to_type: FormatType,
+    workers: Optional[int] = None,
+    validation: str = "structural",
+    pattern: Optional[str] = None,
+    cache: Optional["TranspileCache"] = None,
+    profile: bool = False,
+    exclude: Iterable[PathLike] = (),
+) -> List[ConversionResult]:
+    """
+    Convert every workflow file in a directory tree.
+
+    Files are fanned out over a process pool in which each worker reuses a
+    single transpiler. A file that fails to convert is recorded in the
+    results and skipped; it never aborts the run.
+
+    Args:
+        input_dir: Root of the tree to walk
+        output_dir: Directory receiving the converted files, mirroring the
+            layout of ``input_dir``
+        from_type: The source format type
+        to_type: The target format type
+        workers: Number of worker processes; defaults to the CPU count.
+            ``1`` converts in the calling process without a pool
+        validation: Validation level applied to each workflow, see
+            :class:`WorkflowTranspiler`
+        pattern: Glob used to select input files; defaults to the source
+            format's extension. Compressed exports are matched with e.g.
+            ``"*.json.gz"``; the compression suffix is dropped from the
+            converted file's name
+        cache: Optional result cache shared by every worker
+        profile: Record a per-stage :class:`StageProfile` in each result
+        exclude: Files or directories under ``input_dir`` to leave out, such
+            as a summary file. An ``output_dir`` inside ``input_dir`` is
+            always left out, so re-runs don't convert earlier outputs.
+
+    Returns:
+        One result per input file, in sorted path order
+    """
+    input_dir = Path(input_dir)
+    output_dir = Path(output_dir)
+    skipped = [Path(p).resolve() for p in exclude]
+    if output_dir.resolve() != input_dir.resolve():
+        skipped.append(output_dir.resolve())
+    if pattern is None:
+        pattern = f"*{format_extension(from_type)}"
+    suffix = format_extension(to_type)
+
+    jobs = [
+        (
+            str(source),
+            str(
+                strip_compression_suffix(
+                    output_dir / source.relative_to(input_dir)
+                ).with_suffix(suffix)
+            ),
+            from_type,
+            to_type,
+        )
+        for source in find_input_files(input_dir, pattern)
+        if not _is_within(source.resolve(), skipped)
+    ]
+    if not jobs:
+        return []
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    if workers == 1:
+        _init_worker(validation, cache, profile)
+        return [_convert_job(job) for job in jobs]
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    # Imported here so single-file conversions don't pay for multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(validation, cache, profile),
+    ) as pool:
+        return list(pool.map(_convert_job, jobs, chunksize=chunksize))
+
+
+def write_summary(results: List[ConversionResult], path: PathLike) -> Dict[str, Any]:
+    """
+    Write a JSON summary of a batch conversion.
+
+    Args:
+        results: The per-file results of :func:`convert_directory`
+        path: Where to write the summary
+
+    Returns:
+        The summary that was written
+    """
+    failed = sum(1 for r in results if not r.ok)
+    summary = {
+        "total": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "files": [asdict(r) for r in results],
+    }
+    with open(path, "w") as f:
+        json.dump(summary, f, indent=2)
+    return summary
@@ -0,0 +1,256 @@
+# aloof_union/core/binary.py
+"""
+Compact, lossless binary encoding of :class:`UnifiedWorkflow`.
+
+Meant for caches and for handing workflows between processes, where the
+textual formats are slow to re-parse and drop information (Mermaid has no
+actions, JSM no Fresh Service properties). Everything in the unified
+model survives a round trip. That includes ``None`` versus empty values,
+tuples inside condition values, and a compact :class:`TransitionTable`.
+
+An encoded workflow is the magic bytes ``AUWF`` and a format version byte,
+followed by a :mod:`marshal` payload:
+
+* a string table holding each state name, condition field, operator and
+  action type once
+* one record per state, with names given as string table ids
+* transition endpoints as two little-endian ``uint32`` arrays of ids
+* the conditions and actions of each transition as tuples of ids and
+  values, or None where a transition has none
+* the workflow metadata
+
+Values inside conditions, action parameters, state properties and metadata
+must be types :mod:`marshal` supports. That covers everything JSON can
+hold, plus tuples, sets and bytes. Like pickle, the payload must only be
+loaded from trusted sources.
+"""
+
+import gc
+import marshal
+import sys
+from array import array
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from aloof_union.exceptions import ParserError
+
+from .compact import StateTable, TransitionTable
+from .models import (
+    Action,
+    Condition,
+    StateProperties,
+    Transition,
+    UnifiedWorkflow,
+    WorkflowState,
+    _intern,
+)
+
+MAGIC = b"AUWF"
+FORMAT_VERSION = 1
+
+_HEADER = MAGIC + bytes([FORMAT_VERSION])
+# marshal format written; version 4 is read by every supported Python
+_MARSHAL_VERSION = 4
+# Bits of the state flags field
+_INITIAL, _TERMINAL = 1, 2
+
+
+class _Strings:
+    # Assigns each distinct string the next id, in first-seen order
+    __slots__ = ("values", "ids")
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+        self.ids: Dict[Any, int] = {}
+
+    def id_for(self, value: Any) -> int:
+        string_id = self.ids.get(value)
+        if string_id is None:
+            string_id = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return string_id
+
+
+def _ids_to_bytes(ids: "array[int]") -> bytes:
+    if sys.byteorder == "big":
+        ids = array("I", ids)
+        ids.byteswap()
+    return ids.tobytes()
+
+
+def _ids_from_bytes(data: bytes) -> "array[int]":
+    ids = array("I")
+    ids.frombytes(data)
+    if sys.byteorder == "big":
+        ids.byteswap()
+    return ids
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_plain(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_plain(v) for v in value)
+    return value
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Decoding allocates many small objects and no cycles; letting the cyclic
+    # collector run repeatedly meanwhile would more than double the time
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def dumps(workflow: UnifiedWorkflow) -> bytes:
+    """
+    Encode a workflow in the binary format.
+
+    Args:
+        workflow: The workflow to encode
+
+    Returns:
+        The encoded workflow
+
+    Raises:
+        ValueError: If a value in the workflow can't be encoded
+    """
+    strings = _Strings()
+    string_id = strings.id_for
+
+    states = tuple(
+        (
+            string_id(key),
+            string_id(state.name),
+            state.description,
+            (_INITIAL if state.is_initial else 0)
+            | (_TERMINAL if state.is_terminal else 0),
+            # Copy-on-write views are stored, and decode, as plain dicts
+            (
+                dict(state.properties)
+                if isinstance(state.properties, StateProperties)
+                else state.properties
+            ),
+        )
+        for key, state in workflow.states.items()
+    )
+
+    from_ids = array("I")
+    to_ids = array("I")
+    conditions: List[Optional[Tuple[Any, ...]]] = []
+    actions: List[Optional[Tuple[Any, ...]]] = []
+    for transition in workflow.transitions:
+        from_ids.append(string_id(transition.from_state))
+        to_ids.append(string_id(transition.to_state))
+        conditions.append(
+            tuple(
+                (string_id(c.field), string_id(c.operator), c.value)
+                for c in transition.conditions
+            )
+            or None
+        )
+        actions.append(
+            tuple((string_id(a.type), a.parameters) for a in transition.actions) or None
+        )
+
+    payload = (
+        tuple(strings.values),
+        states,
+        _ids_to_bytes(from_ids),
+        _ids_to_bytes(to_ids),
+        tuple(conditions),
+        tuple(actions),
+        workflow.metadata,
+        isinstance(workflow.transitions, TransitionTable),
+    )
+    try:
+        return _HEADER + marshal.dumps(payload, _MARSHAL_VERSION)
+    except ValueError:
+        # marshal only takes exact dicts and lists, not the frozen ones of
+        # an interned workflow; those decode as plain dicts and lists
+        return _HEADER + marshal.dumps(_plain(payload), _MARSHAL_VERSION)
+
+
+def loads(data: bytes) -> UnifiedWorkflow:
+    """
+    Decode a workflow produced by :func:`dumps`.
+
+    Args:
+        data: The encoded workflow
+
+    Returns:
+        A workflow equal to the one that was encoded
+
+    Raises:
+        ParserError: If ``data`` is not a supported binary workflow
+    """
+    if bytes(data[: len(MAGIC)]) != MAGIC:
+        raise ParserError("Not a binary workflow: bad magic bytes")
+    if len(data) <= len(MAGIC) or data[len(MAGIC)] != FORMAT_VERSION:
+        version = data[len(MAGIC)] if len(data) > len(MAGIC) else None
+        raise ParserError(f"Unsupported binary workflow version: {version}")
+
+    try:
+        with _gc_paused():
+            return _decode(memoryview(data)[len(_HEADER) :])
+    except (EOFError, ValueError, TypeError, IndexError) as e:
+        raise ParserError(f"Corrupt binary workflow: {e}")
+
+
+def _decode(payload: memoryview) -> UnifiedWorkflow:
+    (
+        strings,
+        state_records,
+        from_bytes,
+        to_bytes,
+        conditions,
+        actions,
+        metadata,
+        compact,
+    ) = marshal.loads(payload)
+    strings = [_intern(value) for value in strings]
+    states = {
+        strings[key]: WorkflowState(
+            name=strings[name],
+            description=description,
+            is_initial=bool(flags & _INITIAL),
+            is_terminal=bool(flags & _TERMINAL),
+            properties=properties,
+        )
+        for key, name, description, flags, properties in state_records
+    }
+    transitions = [
+        Transition(
+            strings[from_id],
+            strings[to_id],
+            [Condition(strings[f], strings[o], v) for f, o, v in c] if c else [],
+            [Action(strings[t], p) for t, p in a] if a else [],
+        )
+        for from_id, to_id, c, a in zip(
+            _ids_from_bytes(from_bytes),
+            _ids_from_bytes(to_bytes),
+            conditions,
+            actions,
+        )
+    ]
+
+    if compact:
+        transitions = TransitionTable(transitions, StateTable(states))
+    return UnifiedWorkflow(states=states, transitions=transitions, metadata=metadata)
+
+
+def dump(workflow: UnifiedWorkflow, fp: IO[bytes]) -> None:
+    """Encode a workflow with :func:`dumps` and write it to a binary file."""
+    fp.write(dumps(workflow))
+
+
+def load(fp: IO[bytes]) -> UnifiedWorkflow:
+    """Read and decode a workflow written by :func:`dump`."""
+    return loads(fp.read())
@@ -0,0 +1,348 @@
+# aloof_union/core/cache.py
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Optional, Tuple, Union
+
+import aloof_union
+
+from .models import AutomationType
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Marks the kind of result stored in a cache entry
+_DICT_MARKER = "d"
+_TEXT_MARKER = "s"
+
+_HASH_CHUNK_SIZE = 1 << 16
+
+
+def _type_name(automation_type: AutomationType) -> str:
+    return getattr(automation_type, "value", str(automation_type))
+
+
+def encode_result(result: Union[str, dict]) -> str:
+    """
+    Render a transpile result the way ``serialize_to`` writes it.
+
+    Dict results are JSON with two-space indentation and text results are
+    written unchanged.
+    """
+    if isinstance(result, str):
+        return result
+    return json.dumps(result, indent=2)
+
+
+class CacheTee:
+    """
+    File object proxy that also writes everything through it to a new
+    cache entry; see :meth:`TranspileCache.tee`.
+
+    The entry only becomes visible on :meth:`commit`. A filesystem error
+    on the entry side drops the entry but never the write to the output.
+    """
+
+    def __init__(
+        self, cache: "TranspileCache", path: Path, tmp: str, entry: IO, output: IO
+    ):
+        self._cache = cache
+        self._path = path
+        self._tmp = tmp
+        self._entry: Optional[IO] = entry
+        self._output = output
+
+    def write(self, data: str) -> int:
+        written = self._output.write(data)
+        if self._entry is not None:
+            try:
+                self._entry.write(data)
+            except OSError:
+                self.discard()
+        return written
+
+    def commit(self) -> None:
+        """Publish the entry, unless writing it failed."""
+        entry = self._entry
+        if entry is None:
+            return
+        self._entry = None
+        try:
+            entry.flush()
+            size = os.fstat(entry.fileno()).st_size
+            entry.close()
+            os.replace(self._tmp, self._path)
+        except OSError:
+            self._remove()
+            return
+        self._cache._added(size)
+
+    def discard(self) -> None:
+        """Drop the entry, e.g. after a failed conversion."""
+        entry = self._entry
+        self._entry = None
+        if entry is not None:
+            try:
+                entry.close()
+            except OSError:
+                pass
+            self._remove()
+
+    def _remove(self) -> None:
+        try:
+            os.unlink(self._tmp)
+        except OSError:
+            pass
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._output, name)
+
+
+class TranspileCache:
+    """
+    Content-addressed on-disk cache of transpile results.
+
+    Entries are keyed by a hash of the normalized input, the source and
+    target formats, the validation checks that were run and the library
+    version, so a release or a stricter validation level never serves a
+    stale result. Each entry is one file holding the serialized output;
+    reading it back is a hit's only cost after hashing the input.
+
+    When ``max_bytes`` is set the least recently used entries are evicted
+    once the cache grows past it. Hits refresh an entry's modification
+    time, which is what eviction orders by. Any filesystem error is treated
+    as a miss, so a broken cache never fails a conversion.
+    """
+
+    def __init__(self, directory: PathLike, max_bytes: Optional[int] = None):
+        """
+        Args:
+            directory: Directory holding the cache entries; created on demand
+            max_bytes: Size limit of the cache, or None for no limit
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        # Approximate total size, computed on the first write
+        self._size: Optional[int] = None
+
+    def _key(
+        self,
+        digest: Any,
+        from_type: AutomationType,
+        to_type: AutomationType,
+        checks: Iterable[str],
+    ) -> str:
+        header = "\0".join(
+            [
+                aloof_union.__version__,
+                _type_name(from_type),
+                _type_name(to_type),
+                ",".join(checks),
+            ]
+        )
+        digest.update(b"\0" + header.encode("utf-8"))
+        return digest.hexdigest()
+
+    def key(
+        self,
+        content: Union[str, dict],
+        from_type: AutomationType,
+        to_type: AutomationType,
+        checks: Iterable[str] = (),
+    ) -> Optional[str]:
+        """
+        Compute the cache key of a transpile call.
+
+        Dict content is normalized to canonical JSON, so key order doesn't
+        matter; text content is hashed as is.
+
+        Args:
+            content: The workflow content to transpile
+            from_type: The source format type
+            to_type: The target format type
+            checks: Validation check groups the conversion runs
+
+        Returns:
+            The key, or None if the content can't be normalized
+        """
+        if isinstance(content, str):
+            data = b"s" + content.encode("utf-8")
+        else:
+            try:
+                normalized = json.dumps(
+                    content, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+                )
+            except (TypeError, ValueError):
+                return None
+            data = b"d" + normalized.encode("utf-8")
+        return self._key(hashlib.sha256(data), from_type, to_type, checks)
+
+    def key_stream(
+        self,
+        fp: IO,
+        from_type: AutomationType,
+        to_type: AutomationType,
+        checks: Iterable[str] = (),
+    ) -> Optional[str]:
+        """
+        Compute the cache key of a file's raw content.
+
+        The file is read in chunks and rewound to where it started.
+
+        Returns:
+            The key, or None if the file can't be rewound
+        """
+        try:
+            if not fp.seekable():
+                return None
+            start = fp.tell()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+        # Text and binary files hash alike, and like the same content as a str
+        digest = hashlib.sha256(b"s")
+        while True:
+            chunk = fp.read(_HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+        fp.seek(start)
+        return self._key(digest, from_type, to_type, checks)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get_text(self, key: str) -> Optional[str]:
+        """Return the serialized result stored under ``key``, if any."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return data[1:] if data[:1] in (_DICT_MARKER, _TEXT_MARKER) else None
+
+    def get(self, key: str) -> Optional[Union[str, dict]]:
+        """Return the result stored under ``key``, if any."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                marker = f.read(1)
+                if marker == _DICT_MARKER:
+                    result: Union[str, dict] = json.load(f)
+                elif marker == _TEXT_MARKER:
+                    result = f.read()
+                else:
+                    return None
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return result
+
+    def put(self, key: str, result: Union[str, dict]) -> None:
+        """
+        Store a result under ``key``, evicting old entries if needed.
+
+        Results that can't be encoded as JSON are not cached.
+        """
+        try:
+            marker = _TEXT_MARKER if isinstance(result, str) else _DICT_MARKER
+            data = (marker + encode_result(result)).encode("utf-8")
+        except (TypeError, ValueError):
+            return
+
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see partial entries
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError:
+            return
+
+        self._added(len(data))
+
+    def tee(self, key: str, output: IO, text: bool) -> Optional[CacheTee]:
+        """
+        Store a result under ``key`` as it is being written to ``output``.
+
+        Write the result through the returned proxy, then call its
+        :meth:`CacheTee.commit`, so a large result is never held in memory
+        just to be cached.
+
+        Args:
+            key: Key to store the result under
+            output: Text file object the result is written to
+            text: Whether the result is text rather than a dict rendered as
+                JSON by :func:`encode_result`
+
+        Returns:
+            The proxy, or None if the entry can't be created
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        except OSError:
+            return None
+        entry = os.fdopen(fd, "w", encoding="utf-8", newline="")
+        entry.write(_TEXT_MARKER if text else _DICT_MARKER)
+        return CacheTee(self, path, tmp, entry, output)
+
+    def _added(self, size: int) -> None:
+        # Account for a new entry of ``size`` bytes, evicting if needed
+        if self.max_bytes is not None:
+            if self._size is None:
+                self._size = self.size()
+            else:
+                self._size += size
+            if self._size > self.max_bytes:
+                self.evict()
+
+    def _entries(self) -> Iterator[Tuple[Path, os.stat_result]]:
+        try:
+            for path in self.directory.glob("??/*"):
+                if path.name.startswith(".tmp-"):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                yield path, stat
+        except OSError:
+            return
+
+    def size(self) -> int:
+        """Total size of the cache entries in bytes."""
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits ``max_bytes``."""
+        entries = sorted(self._entries(), key=lambda e: e[1].st_mtime)
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if self.max_bytes is None or total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= stat.st_size
+        self._size = total
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        for path, _ in list(self._entries()):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._size = 0
@@ -0,0 +1,155 @@
+# aloof_union/core/compact.py
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, MutableSequence, Optional, Union
+
+from .models import Action, Condition, Transition, UnifiedWorkflow, _edited, _intern
+
+
+class StateTable:
+    """Bidirectional mapping between interned state names and integer ids."""
+
+    __slots__ = ("names", "ids")
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+        for name in names:
+            self.id_for(name)
+
+    def id_for(self, name: str) -> int:
+        """Return the id of ``name``, assigning the next free id if it is new."""
+        state_id = self.ids.get(name)
+        if state_id is None:
+            name = _intern(name)
+            state_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return state_id
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+class TransitionTable(MutableSequence[Transition]):
+    """
+    List of transitions backed by integer state ids.
+
+    Endpoints are stored in two ``array('i')`` columns and conditions and
+    actions in parallel lists, with empty lists stored as None. Indexing
+    materializes a fresh :class:`Transition`, so changes made to a returned
+    transition must be written back with item assignment.
+    """
+
+    __slots__ = ("states", "_from", "_to", "_conditions", "_actions")
+
+    def __init__(
+        self,
+        transitions: Iterable[Transition] = (),
+        states: Optional[StateTable] = None,
+    ):
+        self.states = states if states is not None else StateTable()
+        self._from = array("i")
+        self._to = array("i")
+        self._conditions: List[Optional[List[Condition]]] = []
+        self._actions: List[Optional[List[Action]]] = []
+        for transition in transitions:
+            self.append(transition)
+
+    @property
+    def from_ids(self) -> "array[int]":
+        """Source state id of every transition."""
+        return self._from
+
+    @property
+    def to_ids(self) -> "array[int]":
+        """Target state id of every transition."""
+        return self._to
+
+    def _materialize(self, index: int) -> Transition:
+        names = self.states.names
+        return Transition(
+            from_state=names[self._from[index]],
+            to_state=names[self._to[index]],
+            conditions=self._conditions[index] or [],
+            actions=self._actions[index] or [],
+        )
+
+    def __len__(self) -> int:
+        return len(self._from)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._materialize(i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("transition index out of range")
+        return self._materialize(index)
+
+    def __iter__(self) -> Iterator[Transition]:
+        names = self.states.names
+        for from_id, to_id, conditions, actions in zip(
+            self._from, self._to, self._conditions, self._actions
+        ):
+            yield Transition(
+                names[from_id], names[to_id], conditions or [], actions or []
+            )
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            transitions = list(self)
+            transitions[index] = value
+            del self[:]
+            self.extend(transitions)
+            return
+
+        if index < 0:
+            index += len(self)
+        self._from[index] = self.states.id_for(value.from_state)
+        self._to[index] = self.states.id_for(value.to_state)
+        self._conditions[index] = value.conditions or None
+        self._actions[index] = value.actions or None
+        _edited()
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del self._from[index]
+        del self._to[index]
+        del self._conditions[index]
+        del self._actions[index]
+        _edited()
+
+    def insert(self, index: int, value: Transition) -> None:
+        self._from.insert(index, self.states.id_for(value.from_state))
+        self._to.insert(index, self.states.id_for(value.to_state))
+        self._conditions.insert(index, value.conditions or None)
+        self._actions.insert(index, value.actions or None)
+        _edited()
+
+    def append(self, value: Transition) -> None:
+        self._from.append(self.states.id_for(value.from_state))
+        self._to.append(self.states.id_for(value.to_state))
+        self._conditions.append(value.conditions or None)
+        self._actions.append(value.actions or None)
+        _edited()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (list, tuple, TransitionTable)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"TransitionTable({list(self)!r})"
+
+
+def compact_workflow(workflow: UnifiedWorkflow) -> UnifiedWorkflow:
+    """
+    Return a copy of ``workflow`` whose transitions are a
+    :class:`TransitionTable` keyed by the workflow's state ids.
+
+    States, conditions and actions are shared with the original workflow.
+    """
+    states = StateTable(workflow.states)
+    return UnifiedWorkflow(
+        states=dict(workflow.states),
+        transitions=TransitionTable(workflow.transitions, states),
+        metadata=dict(workflow.metadata),
+    )
@@ -0,0 +1,104 @@
+# aloof_union/core/index.py
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .models import Transition, UnifiedWorkflow
+
+
+class WorkflowIndex:
+    """
+    Graph index over a workflow, built in a single pass.
+
+    Obtain one through :attr:`UnifiedWorkflow.index`, which caches it and
+    rebuilds it after the workflow changes, or construct one directly for a
+    snapshot of the workflow as it is now.
+    """
+
+    def __init__(self, workflow: "UnifiedWorkflow"):
+        outgoing: Dict[str, List["Transition"]] = {name: [] for name in workflow.states}
+        incoming: Dict[str, List["Transition"]] = {name: [] for name in workflow.states}
+        by_pair: Dict[Tuple[str, str], List["Transition"]] = {}
+
+        for trans in workflow.transitions:
+            from_state, to_state = trans.from_state, trans.to_state
+            outgoing.setdefault(from_state, []).append(trans)
+            incoming.setdefault(to_state, []).append(trans)
+            by_pair.setdefault((from_state, to_state), []).append(trans)
+
+        #: Transitions leaving each state, in workflow order
+        self.outgoing = outgoing
+        #: Transitions entering each state, in workflow order
+        self.incoming = incoming
+        #: Transitions for each ``(from_state, to_state)`` pair
+        self.by_pair = by_pair
+        #: Names of the initial states, in state order
+        self.initial: Tuple[str, ...] = tuple(
+            name for name, state in workflow.states.items() if state.is_initial
+        )
+        #: Names of the terminal states, in state order
+        self.terminal: Tuple[str, ...] = tuple(
+            name for name, state in workflow.states.items() if state.is_terminal
+        )
+
+        self._names: List[str] = list(workflow.states)
+        self._ids: Optional[Dict[str, int]] = None
+        self._adjacency: Optional[List[List[int]]] = None
+        self._reverse_adjacency: Optional[List[List[int]]] = None
+
+    def successors(self, state: str) -> List[str]:
+        """Distinct target states of the transitions leaving ``state``."""
+        return list(dict.fromkeys(t.to_state for t in self.outgoing.get(state, ())))
+
+    def predecessors(self, state: str) -> List[str]:
+        """Distinct source states of the transitions entering ``state``."""
+        return list(dict.fromkeys(t.from_state for t in self.incoming.get(state, ())))
+
+    def transitions_between(self, from_state: str, to_state: str) -> List["Transition"]:
+        """Transitions going directly from ``from_state`` to ``to_state``."""
+        return self.by_pair.get((from_state, to_state), [])
+
+    @property
+    def names(self) -> List[str]:
+        """State names in state order; position is the state's integer id."""
+        return self._names
+
+    @property
+    def ids(self) -> Dict[str, int]:
+        """Integer id of every declared state."""
+        if self._ids is None:
+            self._ids = {name: i for i, name in enumerate(self._names)}
+        return self._ids
+
+    @property
+    def adjacency(self) -> List[List[int]]:
+        """
+        Distinct successor ids of every state, indexed by state id.
+
+        Transitions referencing undeclared states are left out.
+        """
+        if self._adjacency is None:
+            ids = self.ids
+            adjacency = []
+            for name in self._names:
+                targets = (ids.get(t.to_state) for t in self.outgoing[name])
+                adjacency.append(
+                    list(dict.fromkeys(i for i in targets if i is not None))
+                )
+            self._adjacency = adjacency
+        return self._adjacency
+
+    @property
+    def reverse_adjacency(self) -> List[List[int]]:
+        """
+        Distinct predecessor ids of every state, indexed by state id.
+
+        Transitions referencing undeclared states are left out.
+        """
+        if self._reverse_adjacency is None:
+            ids = self.ids
+            reverse = []
+            for name in self._names:
+                sources = (ids.get(t.from_state) for t in self.incoming[name])
+                reverse.append(list(dict.fromkeys(i for i in sources if i is not None)))
+            self._reverse_adjacency = reverse
+        return self._reverse_adjacency
@@ -0,0 +1,144 @@
+# aloof_union/core/inputs.py
+"""
+Opening workflow exports for reading, compressed or not.
+
+Inputs are opened in binary mode and handed to the parsers as bytes. The
+JSON decoder and the Mermaid tokenizer decode them themselves, so no
+full-size decoded copy of the file is ever held next to the parsed
+workflow. Uncompressed files are read through a memory map. Gzip and zstd
+files are decompressed on the fly, and are recognised by their magic
+bytes whatever their name. Zstd needs the optional ``zstandard`` package
+(``pip install aloof-union[zstd]``).
+"""
+
+import gzip
+import io
+import mmap
+import os
+from pathlib import Path
+from typing import IO, Optional, Union
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+#: File name suffixes of compressed exports, stripped when naming outputs
+COMPRESSION_SUFFIXES = (".gz", ".zst")
+
+
+class MappedFile(io.BufferedIOBase):
+    """
+    Read-only binary file backed by a memory map.
+
+    Reads are served straight from the page cache without buffered read
+    calls. :meth:`getbuffer` exposes the whole file without copying it.
+    """
+
+    def __init__(self, path: PathLike):
+        super().__init__()
+        with open(path, "rb") as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._map.read(size)
+
+    read1 = read
+
+    def readinto(self, buffer: bytearray) -> int:  # type: ignore[override]
+        data = self._map.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        start = self._map.tell()
+        line = self._map.readline()
+        if size is not None and 0 <= size < len(line):
+            self._map.seek(start + size)
+            line = line[:size]
+        return line
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._map.seek(offset, whence)
+        return self._map.tell()
+
+    def tell(self) -> int:
+        return self._map.tell()
+
+    def getbuffer(self) -> memoryview:
+        """Zero-copy view of the whole file."""
+        return memoryview(self._map)
+
+    def close(self) -> None:
+        if not self.closed:
+            self._map.close()
+        super().close()
+
+
+def detect_compression(head: bytes) -> Optional[str]:
+    """
+    Identify the compression of a file from its first bytes.
+
+    Returns:
+        ``"gzip"``, ``"zstd"`` or None for uncompressed content
+    """
+    if head.startswith(GZIP_MAGIC):
+        return "gzip"
+    if head.startswith(ZSTD_MAGIC):
+        return "zstd"
+    return None
+
+
+def open_input(path: PathLike, use_mmap: bool = True) -> IO[bytes]:
+    """
+    Open a workflow export for binary reading, decompressing it if needed.
+
+    Args:
+        path: The file to open
+        use_mmap: Read uncompressed files through a memory map
+
+    Returns:
+        A binary file object, to be closed by the caller
+
+    Raises:
+        ImportError: If the file is zstd-compressed and ``zstandard`` is
+            not installed
+    """
+    with open(path, "rb") as fp:
+        compression = detect_compression(fp.read(len(ZSTD_MAGIC)))
+
+    if compression == "gzip":
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+    if compression == "zstd":
+        if zstandard is None:
+            raise ImportError(
+                f"{os.fspath(path)} is zstd-compressed; install the zstandard "
+                "package (pip install aloof-union[zstd]) to read it"
+            )
+        raw = open(path, "rb")
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        # Buffered so that Mermaid input can be read line by line
+        return io.BufferedReader(reader)  # type: ignore[arg-type]
+
+    if use_mmap and os.path.getsize(path) > 0:
+        # Empty files can't be mapped
+        return MappedFile(path)  # type: ignore[return-value]
+    return open(path, "rb")
+
+
+def strip_compression_suffix(path: Path) -> Path:
+    """Drop a ``.gz`` or ``.zst`` suffix, e.g. ``a.json.gz`` -> ``a.json``."""
+    if path.suffix.lower() in COMPRESSION_SUFFIXES:
+        return path.with_suffix("")
+    return path
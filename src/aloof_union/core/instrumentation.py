@@ -0,0 +1,222 @@
+# aloof_union/core/instrumentation.py
+import time
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, Iterator, List, NamedTuple, Optional, Union
+
+from .models import UnifiedWorkflow
+
+#: Stages reported by WorkflowTranspiler, in pipeline order. "direct" is a
+#: format-to-format conversion that replaces parse and serialize, and
+#: "cache" is hashing the input and looking it up.
+STAGES = ("cache", "parse", "direct", "transform", "validate", "serialize")
+
+
+class WorkflowCounts(NamedTuple):
+    """Sizes of a parsed workflow."""
+
+    states: int
+    transitions: int
+    conditions: int
+    actions: int
+
+    @classmethod
+    def of(cls, workflow: UnifiedWorkflow) -> "WorkflowCounts":
+        conditions = actions = 0
+        for trans in workflow.transitions:
+            conditions += len(trans.conditions)
+            actions += len(trans.actions)
+        return cls(len(workflow.states), len(workflow.transitions), conditions, actions)
+
+
+class TranspileObserver:
+    """
+    Receives instrumentation events from a :class:`WorkflowTranspiler`.
+
+    Every hook does nothing by default; subclass and override the ones you
+    need. Hooks run synchronously inside the conversion, so they should be
+    cheap. Transpilers without an observer skip all of this bookkeeping.
+    """
+
+    def stage_started(self, stage: str) -> None:
+        """Called when ``stage`` (one of :data:`STAGES`) begins."""
+
+    def stage_finished(self, stage: str, seconds: float) -> None:
+        """Called when ``stage`` ends, even if it raised."""
+
+    def workflow_parsed(self, counts: WorkflowCounts) -> None:
+        """Called with the sizes of each workflow once it is parsed."""
+
+    def transpile_finished(
+        self, input_bytes: Optional[int], output_bytes: Optional[int]
+    ) -> None:
+        """
+        Called after a successful conversion.
+
+        Sizes are the UTF-8 encoded length of text and the raw length of
+        bytes read or written. They are None for dict content, which has no
+        serialized size.
+        """
+
+
+class _Stage:
+    __slots__ = ("observer", "stage", "start")
+
+    def __init__(self, observer: TranspileObserver, stage: str):
+        self.observer = observer
+        self.stage = stage
+
+    def __enter__(self) -> None:
+        self.observer.stage_started(self.stage)
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.observer.stage_finished(self.stage, time.perf_counter() - self.start)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info: Any) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def stage(observer: Optional[TranspileObserver], name: str) -> Any:
+    """Context manager reporting the ``name`` stage to ``observer``, if any."""
+    return _NULL_STAGE if observer is None else _Stage(observer, name)
+
+
+def content_size(content: Any) -> Optional[int]:
+    """Encoded size of text or bytes content; None for anything else."""
+    if isinstance(content, str):
+        return len(content.encode("utf-8"))
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+    return None
+
+
+class CountingReader:
+    """File object proxy counting the size of everything read through it."""
+
+    def __init__(self, fp: IO):
+        self._fp = fp
+        self.size = 0
+
+    def read(self, *args: Any) -> Union[str, bytes]:
+        data = self._fp.read(*args)
+        self.size += content_size(data) or 0
+        return data
+
+    def readline(self, *args: Any) -> Union[str, bytes]:
+        line = self._fp.readline(*args)
+        self.size += content_size(line) or 0
+        return line
+
+    def __iter__(self) -> Iterator[Union[str, bytes]]:
+        for line in self._fp:
+            self.size += content_size(line) or 0
+            yield line
+
+    def getbuffer(self) -> memoryview:
+        buffer = self._fp.getbuffer()
+        self.size += buffer.nbytes - self._fp.tell()
+        return buffer
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fp, name)
+
+
+class CountingWriter:
+    """File object proxy counting the size of everything written through it."""
+
+    def __init__(self, fp: IO):
+        self._fp = fp
+        self.size = 0
+
+    def write(self, data: Union[str, bytes]) -> int:
+        self.size += content_size(data) or 0
+        return self._fp.write(data)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._fp, name)
+
+
+@dataclass
+class StageProfile(TranspileObserver):
+    """
+    Observer accumulating a per-stage breakdown over any number of conversions.
+    """
+
+    seconds: Dict[str, float] = field(default_factory=dict)
+    calls: Dict[str, int] = field(default_factory=dict)
+    conversions: int = 0
+    states: int = 0
+    transitions: int = 0
+    conditions: int = 0
+    actions: int = 0
+    input_bytes: int = 0
+    output_bytes: int = 0
+
+    def stage_finished(self, stage: str, seconds: float) -> None:
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+
+    def workflow_parsed(self, counts: WorkflowCounts) -> None:
+        self.states += counts.states
+        self.transitions += counts.transitions
+        self.conditions += counts.conditions
+        self.actions += counts.actions
+
+    def transpile_finished(
+        self, input_bytes: Optional[int], output_bytes: Optional[int]
+    ) -> None:
+        self.conversions += 1
+        self.input_bytes += input_bytes or 0
+        self.output_bytes += output_bytes or 0
+
+    def merge(self, other: "StageProfile") -> None:
+        """Add the totals of another profile, e.g. one from a worker process."""
+        for stage_name, seconds in other.seconds.items():
+            self.seconds[stage_name] = self.seconds.get(stage_name, 0.0) + seconds
+            self.calls[stage_name] = (
+                self.calls.get(stage_name, 0) + other.calls[stage_name]
+            )
+        for name in (
+            "conversions",
+            "states",
+            "transitions",
+            "conditions",
+            "actions",
+            "input_bytes",
+            "output_bytes",
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def format(self) -> str:
+        """Render the breakdown as a plain-text table."""
+        total = sum(self.seconds.values())
+        lines: List[str] = [
+            f"{'stage':<10} {'calls':>7} {'seconds':>10} {'share':>7}",
+        ]
+        ordered = [s for s in STAGES if s in self.seconds]
+        ordered += [s for s in self.seconds if s not in STAGES]
+        for stage_name in ordered:
+            seconds = self.seconds[stage_name]
+            share = seconds / total if total else 0.0
+            lines.append(
+                f"{stage_name:<10} {self.calls[stage_name]:>7} "
+                f"{seconds:>10.4f} {share:>7.1%}"
+            )
+        lines.append(f"{'total':<10} {'':>7} {total:>10.4f}")
+        lines.append(
+            f"{self.conversions} conversions: {self.states} states, "
+            f"{self.transitions} transitions, {self.conditions} conditions, "
+            f"{self.actions} actions; {self.input_bytes} bytes in, "
+            f"{self.output_bytes} bytes out"
+        )
+        return "\n".join(lines)
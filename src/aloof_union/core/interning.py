@@ -0,0 +1,331 @@
+# aloof_union/core/interning.py
+"""
+Flyweight sharing of conditions and actions across transitions.
+
+Exports often repeat the same few conditions and post-function
+configurations on many transitions. A :class:`FlyweightPool` hands out one
+immutable :class:`FrozenCondition` or :class:`FrozenAction` per distinct
+value, and freezes the values and parameters they hold. Transitions with the
+same conditions or actions also share one read-only list of them. A
+workflow built through a pool therefore holds each configuration once,
+however many transitions use it.
+
+Interning is opt-in: pass a pool to :class:`FreshServiceParser` or
+:class:`JSMParser`, or run :func:`intern_workflow` on a workflow that is
+already built. Frozen objects compare equal to their mutable counterparts
+and serialize identically, but they cannot be changed in place. Replace a
+transition's condition or action instead.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from .models import Action, Condition, UnifiedWorkflow
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> Any:
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+
+class FrozenDict(dict):
+    """
+    Read-only, hashable ``dict``.
+
+    It subclasses ``dict`` so that JSON encoding, ``isinstance`` checks and
+    comparisons with plain dicts keep working unchanged.
+    """
+
+    __slots__ = ("_hash",)
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(frozenset(self.items()))
+            return self._hash
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (dict(self),))
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        return self
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """Read-only, hashable ``list``; see :class:`FrozenDict`."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(tuple(self))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (list(self),))
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenList":
+        return self
+
+    def __repr__(self) -> str:
+        return f"FrozenList({list.__repr__(self)})"
+
+
+class _Frozen:
+    # Mixin blocking attribute assignment once __init__ has run
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    __delattr__ = __setattr__  # type: ignore[assignment]
+
+
+class FrozenCondition(_Frozen, Condition):
+    """Immutable, hashable :class:`Condition` that can be shared."""
+
+    __slots__ = ()
+
+    def __init__(self, field: str, operator: str, value: Any):
+        object.__setattr__(self, "field", field)
+        object.__setattr__(self, "operator", operator)
+        object.__setattr__(self, "value", value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Condition):
+            return NotImplemented
+        return (self.field, self.operator, self.value) == (
+            other.field,
+            other.operator,
+            other.value,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.field, self.operator, self.value))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (self.field, self.operator, self.value))
+
+
+class FrozenAction(_Frozen, Action):
+    """Immutable, hashable :class:`Action` that can be shared."""
+
+    __slots__ = ()
+
+    def __init__(self, type: str, parameters: Dict[str, Any]):
+        object.__setattr__(self, "type", type)
+        object.__setattr__(self, "parameters", parameters)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Action):
+            return NotImplemented
+        return (self.type, self.parameters) == (other.type, other.parameters)
+
+    def __hash__(self) -> int:
+        return hash((self.type, self.parameters))
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self), (self.type, self.parameters))
+
+
+def value_identity(value: Any) -> Hashable:
+    """
+    Hashable key for a condition value or action parameters.
+
+    Unlike the value itself, the key tells apart values that compare equal
+    but serialize differently: ``True`` vs ``1`` vs ``1.0``, and dicts
+    with the same items in a different order.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple((k, value_identity(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(value_identity(v) for v in value))
+    return (type(value), value)
+
+
+@dataclass
+class InternStats:
+    """How many objects a :class:`FlyweightPool` was asked for and kept."""
+
+    conditions: int = 0
+    unique_conditions: int = 0
+    actions: int = 0
+    unique_actions: int = 0
+    values: int = 0
+    unique_values: int = 0
+    lists: int = 0
+    unique_lists: int = 0
+
+    @staticmethod
+    def _ratio(total: int, unique: int) -> float:
+        return total / unique if unique else 1.0
+
+    @property
+    def condition_ratio(self) -> float:
+        """Conditions requested per distinct condition kept."""
+        return self._ratio(self.conditions, self.unique_conditions)
+
+    @property
+    def action_ratio(self) -> float:
+        """Actions requested per distinct action kept."""
+        return self._ratio(self.actions, self.unique_actions)
+
+    @property
+    def value_ratio(self) -> float:
+        """Condition values and parameter mappings per distinct one kept."""
+        return self._ratio(self.values, self.unique_values)
+
+    @property
+    def list_ratio(self) -> float:
+        """Condition and action lists per distinct list kept."""
+        return self._ratio(self.lists, self.unique_lists)
+
+    def format(self) -> str:
+        """Render the counts and dedup ratios as a small text table."""
+        rows = [
+            ("conditions", self.conditions, self.unique_conditions),
+            ("actions", self.actions, self.unique_actions),
+            ("values", self.values, self.unique_values),
+            ("lists", self.lists, self.unique_lists),
+        ]
+        lines = [f"{'':<12}{'requested':>10}{'kept':>10}{'ratio':>10}"]
+        lines.extend(
+            f"{label:<12}{total:>10}{unique:>10}{self._ratio(total, unique):>9.1f}x"
+            for label, total, unique in rows
+        )
+        return "\n".join(lines)
+
+
+class FlyweightPool:
+    """
+    Hands out one shared, frozen instance per distinct condition or action.
+
+    Keys are type- and order-sensitive, so interning never changes how a
+    workflow serializes. A pool can be reused across workflows to share
+    instances between them too.
+    """
+
+    def __init__(self) -> None:
+        self._conditions: Dict[Hashable, FrozenCondition] = {}
+        self._actions: Dict[Hashable, FrozenAction] = {}
+        self._values: Dict[Hashable, Any] = {}
+        self._lists: Dict[Tuple[int, ...], FrozenList] = {}
+        self.stats = InternStats()
+
+    def freeze(self, value: Any) -> Any:
+        """
+        Return a shared, read-only equivalent of a value.
+
+        Dicts and lists become :class:`FrozenDict` and :class:`FrozenList`
+        and tuples are frozen item by item, recursively; other values are
+        returned unchanged.
+        """
+        if isinstance(value, tuple):
+            return tuple(self.freeze(v) for v in value)
+        if not isinstance(value, (dict, list)):
+            return value
+        self.stats.values += 1
+        key = value_identity(value)
+        frozen = self._values.get(key)
+        if frozen is None:
+            if isinstance(value, dict):
+                frozen = FrozenDict((k, self.freeze(v)) for k, v in value.items())
+            else:
+                frozen = FrozenList(self.freeze(v) for v in value)
+            self._values[key] = frozen
+            self.stats.unique_values += 1
+        return frozen
+
+    def condition(self, field: str, operator: str, value: Any) -> FrozenCondition:
+        """Shared condition equal to ``Condition(field, operator, value)``."""
+        self.stats.conditions += 1
+        key = (field, operator, value_identity(value))
+        condition = self._conditions.get(key)
+        if condition is None:
+            condition = FrozenCondition(field, operator, self.freeze(value))
+            self._conditions[key] = condition
+            self.stats.unique_conditions += 1
+        return condition
+
+    def action(self, type: str, parameters: Dict[str, Any]) -> FrozenAction:
+        """Shared action equal to ``Action(type, parameters)``."""
+        self.stats.actions += 1
+        key = (type, value_identity(parameters))
+        action = self._actions.get(key)
+        if action is None:
+            action = FrozenAction(type, self.freeze(parameters))
+            self._actions[key] = action
+            self.stats.unique_actions += 1
+        return action
+
+    def share(self, items: List[Any]) -> FrozenList:
+        """
+        Shared, read-only list of pooled conditions or actions.
+
+        Transitions with the same conditions, or the same actions, then
+        hold a single list between them.
+
+        Args:
+            items: Instances obtained from this pool
+        """
+        self.stats.lists += 1
+        # Pooled instances live as long as the pool, so their ids are stable
+        key = tuple(map(id, items))
+        shared = self._lists.get(key)
+        if shared is None:
+            shared = self._lists[key] = FrozenList(items)
+            self.stats.unique_lists += 1
+        return shared
+
+    def __len__(self) -> int:
+        return len(self._conditions) + len(self._actions)
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from self._conditions.values()
+        yield from self._actions.values()
+
+
+def intern_workflow(
+    workflow: UnifiedWorkflow, pool: Optional[FlyweightPool] = None
+) -> FlyweightPool:
+    """
+    Replace the conditions and actions of a workflow with shared instances.
+
+    Transitions are updated in place, so this also works on a
+    :class:`TransitionTable`.
+
+    Args:
+        workflow: The workflow to intern
+        pool: Pool to draw instances from; a new one is created if omitted
+
+    Returns:
+        The pool used, whose ``stats`` report the dedup ratios
+    """
+    if pool is None:
+        pool = FlyweightPool()
+    transitions = workflow.transitions
+    for i, transition in enumerate(transitions):
+        transition.conditions = pool.share(
+            [
+                pool.condition(c.field, c.operator, c.value)
+                for c in transition.conditions
+            ]
+        )
+        transition.actions = pool.share(
+            [pool.action(a.type, a.parameters) for a in transition.actions]
+        )
+        transitions[i] = transition
+    return pool
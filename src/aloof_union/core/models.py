@@ -1,7 +1,25 @@
 # aloof_union/core/models.py
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .index import WorkflowIndex
+
+if TYPE_CHECKING:
+    from .analysis.paths import Costs, PathAnalysis
 
 
 class AutomationType(Enum):
@@ -10,6 +28,188 @@ class AutomationType(Enum):
     MERMAID = "mermaid"
 
 
+def _slotted(cls: type) -> type:
+    """
+    Rebuild a dataclass with ``__slots__`` and no per-instance ``__dict__``.
+
+    Equivalent to ``@dataclass(slots=True)``, which needs Python 3.10.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    # Field defaults live on the class and would clash with the slots; the
+    # generated __init__ already carries them
+    for name in names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    namespace["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+# Count of edits made to any workflow. A cached index remembers the count
+# it was built at and is rebuilt once it has moved on.
+_edits = 0
+
+
+def _edited() -> None:
+    global _edits
+    _edits += 1
+
+
+def _counting(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a container method so every call counts as an edit."""
+
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        _edited()
+        return result
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class _Watched:
+    # Mixin counting attribute assignments made after __init__ as edits
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        _edited()
+
+    def __delattr__(self, name: str) -> None:
+        object.__delattr__(self, name)
+        _edited()
+
+
+def _slot_setters(cls: type) -> Tuple[Callable[[Any, Any], None], ...]:
+    """
+    Raw setters of a slotted dataclass's fields, in field order.
+
+    ``__init__`` fills in a new object through these: it is not an edit,
+    and they are faster than ``object.__setattr__``.
+    """
+    return tuple(cls.__dict__[f.name].__set__ for f in fields(cls))
+
+
+class _WatchedDict(dict):
+    """``dict`` counting every change to its items as an edit."""
+
+    __slots__ = ()
+
+    __setitem__ = _counting(dict.__setitem__)
+    __delitem__ = _counting(dict.__delitem__)
+    __ior__ = _counting(dict.__ior__)
+    clear = _counting(dict.clear)
+    pop = _counting(dict.pop)
+    popitem = _counting(dict.popitem)
+    setdefault = _counting(dict.setdefault)
+    update = _counting(dict.update)
+
+
+class _WatchedList(list):
+    """``list`` counting every change to its items as an edit."""
+
+    __slots__ = ()
+
+    __setitem__ = _counting(list.__setitem__)
+    __delitem__ = _counting(list.__delitem__)
+    __iadd__ = _counting(list.__iadd__)
+    __imul__ = _counting(list.__imul__)
+    append = _counting(list.append)
+    clear = _counting(list.clear)
+    extend = _counting(list.extend)
+    insert = _counting(list.insert)
+    pop = _counting(list.pop)
+    remove = _counting(list.remove)
+    reverse = _counting(list.reverse)
+    sort = _counting(list.sort)
+
+
+class StateProperties(MutableMapping[str, Any]):
+    """
+    Copy-on-write view over a state's raw properties mapping.
+
+    The raw mapping is kept by reference and never modified. Writes and
+    deletions are recorded in a small overlay, so parsers can hand their
+    input straight to the model without copying it, and editing a parsed
+    state never changes the document it was parsed from.
+    """
+
+    __slots__ = ("_base", "_changes", "_removed")
+
+    def __init__(self, base: Optional[Mapping[str, Any]] = None):
+        self._base: Mapping[str, Any] = {} if base is None else base
+        self._changes: Dict[str, Any] = {}
+        self._removed: Set[str] = set()
+
+    @property
+    def base(self) -> Mapping[str, Any]:
+        """The raw mapping underneath the overlay."""
+        return self._base
+
+    @property
+    def modified(self) -> bool:
+        """Whether any key was set or deleted since the view was created."""
+        return bool(self._changes or self._removed)
+
+    def __getitem__(self, key: str) -> Any:
+        changes = self._changes
+        if key in changes:
+            return changes[key]
+        if key in self._removed:
+            raise KeyError(key)
+        return self._base[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._changes[key] = value
+        self._removed.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        self._changes.pop(key, None)
+        if key in self._base:
+            self._removed.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._changes:
+            return True
+        return key not in self._removed and key in self._base
+
+    def __iter__(self) -> Iterator[str]:
+        changes, removed = self._changes, self._removed
+        if not (changes or removed):
+            return iter(self._base)
+        return self._iter_modified()
+
+    def _iter_modified(self) -> Iterator[str]:
+        # Raw keys keep their position, like assignments to a dict would
+        removed = self._removed
+        base = self._base
+        yield from (key for key in base if key not in removed)
+        yield from (key for key in self._changes if key not in base)
+
+    def __len__(self) -> int:
+        if not self.modified:
+            return len(self._base)
+        return sum(1 for _ in self._iter_modified())
+
+    def copy(self) -> "StateProperties":
+        """Shallow copy sharing the same raw mapping."""
+        clone = StateProperties(self._base)
+        clone._changes.update(self._changes)
+        clone._removed.update(self._removed)
+        return clone
+
+    __copy__ = copy
+
+    def __repr__(self) -> str:
+        return f"StateProperties({dict(self.items())!r})"
+
+
+@_slotted
 @dataclass
 class Condition:
     field: str
@@ -17,31 +217,155 @@ class Condition:
     value: Any
 
 
+@_slotted
 @dataclass
 class Action:
     type: str
     parameters: Dict[str, Any]
 
 
+@_slotted
 @dataclass
-class Transition:
+class Transition(_Watched):
     from_state: str
     to_state: str
     conditions: List[Condition]
     actions: List[Action]
 
+    def __init__(
+        self,
+        from_state: str,
+        to_state: str,
+        conditions: List[Condition],
+        actions: List[Action],
+    ):
+        # State names repeat across many transitions; share one copy each
+        set_from, set_to, set_conditions, set_actions = _TRANSITION_SLOTS
+        set_from(self, _intern(from_state))
+        set_to(self, _intern(to_state))
+        set_conditions(self, conditions)
+        set_actions(self, actions)
+
 
+@_slotted
 @dataclass
-class WorkflowState:
+class WorkflowState(_Watched):
     name: str
     description: Optional[str] = None
     is_initial: bool = False
     is_terminal: bool = False
     properties: Dict[str, Any] = None
 
+    def __init__(
+        self,
+        name: str,
+        description: Optional[str] = None,
+        is_initial: bool = False,
+        is_terminal: bool = False,
+        properties: Dict[str, Any] = None,
+    ):
+        set_name, set_description, set_initial, set_terminal, set_properties = (
+            _STATE_SLOTS
+        )
+        set_name(self, _intern(name))
+        set_description(self, description)
+        set_initial(self, is_initial)
+        set_terminal(self, is_terminal)
+        set_properties(self, properties)
+
+
+_TRANSITION_SLOTS = _slot_setters(Transition)
+_STATE_SLOTS = _slot_setters(WorkflowState)
+
 
 @dataclass
 class UnifiedWorkflow:
     states: Dict[str, WorkflowState]
     transitions: List[Transition]
     metadata: Dict[str, Any]
+
+    def __post_init__(self) -> None:
+        # Derived caches; plain attributes rather than fields so asdict(),
+        # fields(), repr and comparisons only see the workflow itself
+        self._index: Optional[WorkflowIndex] = None
+        self._index_key: Optional[Tuple[Any, int, Any, int, int]] = None
+        self._paths: Optional["PathAnalysis"] = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Plain containers are swapped for watched copies, so edits to
+        # their items reach the index cache
+        if name == "states" and type(value) is dict:
+            value = _WatchedDict(value)
+        elif name == "transitions" and type(value) is list:
+            value = _WatchedList(value)
+        object.__setattr__(self, name, value)
+
+    @property
+    def index(self) -> WorkflowIndex:
+        """
+        Cached graph index of the workflow.
+
+        The index is rebuilt after the workflow is edited: when ``states``
+        or ``transitions`` is replaced, items are added to, removed from or
+        replaced in either, or an attribute of a state or transition is
+        assigned. Edits to any workflow count, so an edit elsewhere costs a
+        rebuild but never leaves the index stale. Containers other than a
+        ``dict`` of states and a list or :class:`TransitionTable` of
+        transitions are only watched for size changes; call
+        :meth:`invalidate_index` after replacing one of their items.
+        """
+        states, transitions = self.states, self.transitions
+        key = self._index_key
+        if (
+            self._index is None
+            or key[0] is not states
+            or key[1] != len(states)
+            or key[2] is not transitions
+            or key[3] != len(transitions)
+            or key[4] != _edits
+        ):
+            # Read the count first: an edit made during the build moves it on
+            edits = _edits
+            self._index = WorkflowIndex(self)
+            self._index_key = (
+                states,
+                len(states),
+                transitions,
+                len(transitions),
+                edits,
+            )
+        return self._index
+
+    def paths(
+        self, costs: Optional["Costs"] = None, default_cost: float = 1.0
+    ) -> "PathAnalysis":
+        """
+        Shortest and critical path analysis of the workflow.
+
+        The hop-count analysis, without ``costs``, is cached alongside the
+        index together with every search it has run.
+
+        Args:
+            costs: Cost of each transition, see :class:`PathAnalysis`
+            default_cost: Cost of transitions missing from a ``costs``
+                mapping
+        """
+        from .analysis.paths import PathAnalysis
+
+        if costs is not None:
+            return PathAnalysis(self, costs, default_cost)
+        if self._paths is None or self._paths.index is not self.index:
+            self._paths = PathAnalysis(self)
+        return self._paths
+
+    def invalidate_index(self) -> None:
+        """Drop the cached graph index so the next access rebuilds it."""
+        self._index = None
+        self._index_key = None
+        self._paths = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The index is derived data; don't ship it through pickle
+        state = dict(self.__dict__)
+        state["_index"] = state["_index_key"] = state["_paths"] = None
+        return state
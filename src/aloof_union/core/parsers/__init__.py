@@ -1,7 +1,55 @@
 # aloof_union/parsers/__init__.py
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+from ..registry import BUILTIN_PARSERS, FormatType, registry
 from .base import WorkflowParser
-from .freshservice import FreshServiceParser
-from .jsm import JSMParser
-from .mermaid import MermaidParser
 
-__all__ = ["WorkflowParser", "FreshServiceParser", "JSMParser", "MermaidParser"]
+if TYPE_CHECKING:
+    from .freshservice import FreshServiceParser
+    from .jsm import JSMParser
+    from .mermaid import MermaidParser
+
+# "module:Class" reference of each built-in parser class, from the registry.
+# Modules are imported on first use so that a run touching one format never
+# loads the others.
+_LAZY_CLASSES = {spec.rpartition(":")[2]: spec for spec in BUILTIN_PARSERS.values()}
+
+
+def _load(name: str) -> Any:
+    module, _, attr = _LAZY_CLASSES[name].partition(":")
+    value = getattr(import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_CLASSES:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_CLASSES])
+
+
+def get_parser(automation_type: FormatType) -> WorkflowParser:
+    """
+    Return the shared parser for a format, creating it on first use.
+
+    Formats are looked up in the default :class:`ParserRegistry`, so names,
+    aliases such as ``"fs"`` and plugin formats are accepted too.
+
+    Raises:
+        KeyError: If no parser handles ``automation_type``
+    """
+    return registry.get(automation_type)
+
+
+__all__ = [
+    "WorkflowParser",
+    "FreshServiceParser",
+    "JSMParser",
+    "MermaidParser",
+    "get_parser",
+]
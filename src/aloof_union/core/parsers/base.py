@@ -1,17 +1,38 @@
 # aloof_union/parsers/base.py
+import json
 from abc import ABC, abstractmethod
-from typing import Union
+from typing import IO, Union
 
 from aloof_union.core.models import UnifiedWorkflow
 
 
 class WorkflowParser(ABC):
+    #: File extension of the format, used when converting directory trees
+    extension = ".json"
+    #: Whether :meth:`serialize` returns text rather than a dict
+    text_output = False
+
     @abstractmethod
     def parse(self, content: Union[str, dict]) -> UnifiedWorkflow:
         """Parse content into unified workflow format."""
         pass
 
+    def parse_stream(self, fp: IO) -> UnifiedWorkflow:
+        """Parse content read from a text or binary file object."""
+        content = fp.read()
+        if isinstance(content, bytes):
+            content = content.decode("utf-8-sig")
+        return self.parse(content)
+
     @abstractmethod
     def serialize(self, workflow: UnifiedWorkflow) -> Union[str, dict]:
         """Serialize unified workflow to target format."""
         pass
+
+    def serialize_to(self, workflow: UnifiedWorkflow, fp: IO) -> None:
+        """Serialize unified workflow to target format, writing it to a file."""
+        result = self.serialize(workflow)
+        if isinstance(result, str):
+            fp.write(result)
+        else:
+            json.dump(result, fp, indent=2)
@@ -1,18 +1,50 @@
 # aloof_union/parsers/freshservice.py
 # from typing import Dict
+import io
+import json
+from typing import IO, Any, Optional
+
+from aloof_union.core.interning import FlyweightPool
 from aloof_union.core.models import (
     Action,
     Condition,
+    StateProperties,
     Transition,
     UnifiedWorkflow,
     WorkflowState,
 )
 from aloof_union.exceptions import ParserError
 
+from . import jsonstream
 from .base import WorkflowParser
+from .jsonstream import LazyArray, LazyObject
+
+
+def _load_json(fp: IO) -> Any:
+    try:
+        buffer = fp.getbuffer()
+    except (AttributeError, io.UnsupportedOperation):
+        # Binary files hand their bytes straight to the decoder
+        return json.load(fp)
+    # Memory-mapped input is decoded from the mapped pages, without first
+    # copying the whole file into a bytes object
+    with buffer, buffer[fp.tell() :] as pending:
+        return json.loads(str(pending, "utf-8-sig"))
+
+
+# State keys the model stores as WorkflowState attributes
+_STATE_FIELDS = ("description", "is_initial", "is_terminal")
 
 
 class FreshServiceParser(WorkflowParser):
+    def __init__(self, pool: Optional[FlyweightPool] = None):
+        """
+        Args:
+            pool: Optional flyweight pool; when given, conditions and actions
+                are shared, frozen instances drawn from it
+        """
+        self.pool = pool
+
     def parse(self, content: dict) -> UnifiedWorkflow:
         try:
             states = {}
@@ -25,20 +57,30 @@ class FreshServiceParser(WorkflowParser):
                     description=state_data.get("description"),
                     is_initial=state_data.get("is_initial", False),
                     is_terminal=state_data.get("is_terminal", False),
-                    properties=state_data,
+                    # Shares the input rather than copying it; edits to the
+                    # state's properties go to an overlay
+                    properties=StateProperties(state_data),
                 )
 
             # Parse transitions
+            pool = self.pool
+            make_condition = pool.condition if pool is not None else Condition
+            make_action = pool.action if pool is not None else Action
             for trans in content["transitions"]:
                 conditions = [
-                    Condition(c.get("field", ""), c.get("operator", ""), c.get("value"))
+                    make_condition(
+                        c.get("field", ""), c.get("operator", ""), c.get("value")
+                    )
                     for c in trans.get("conditions", [])
                 ]
 
                 actions = [
-                    Action(a.get("type", ""), a.get("parameters", {}))
+                    make_action(a.get("type", ""), a.get("parameters", {}))
                     for a in trans.get("actions", [])
                 ]
+                if pool is not None:
+                    conditions = pool.share(conditions)
+                    actions = pool.share(actions)
 
                 transitions.append(
                     Transition(
@@ -56,33 +98,86 @@ class FreshServiceParser(WorkflowParser):
         except Exception as e:
             raise ParserError(f"Error parsing Fresh Service workflow: {e}")
 
+    def load(self, fp: IO) -> dict:
+        """
+        Read a Fresh Service export from a file object without parsing it.
+
+        Args:
+            fp: Text or binary file object containing the export
+
+        Returns:
+            The decoded export
+
+        Raises:
+            ParserError: If the file is not valid JSON
+        """
+        try:
+            return _load_json(fp)
+        except ValueError as e:
+            raise ParserError(f"Error parsing Fresh Service workflow: {e}")
+
+    def parse_stream(self, fp: IO) -> UnifiedWorkflow:
+        return self.parse(self.load(fp))
+
+    def _serialize_state(self, state: WorkflowState) -> dict:
+        result = {
+            "description": state.description,
+            "is_initial": state.is_initial,
+            "is_terminal": state.is_terminal,
+        }
+        # The state's attributes are authoritative for the normalized keys;
+        # every other property is passed through by reference
+        for key, value in (state.properties or {}).items():
+            if key not in _STATE_FIELDS:
+                result[key] = value
+        return result
+
+    def _serialize_transition(self, trans: Transition) -> dict:
+        return {
+            "from_state": trans.from_state,
+            "to_state": trans.to_state,
+            "conditions": [
+                {"field": c.field, "operator": c.operator, "value": c.value}
+                for c in trans.conditions
+            ],
+            "actions": [
+                {"type": a.type, "parameters": a.parameters} for a in trans.actions
+            ],
+        }
+
     def serialize(self, workflow: UnifiedWorkflow) -> dict:
         try:
             return {
                 "states": {
-                    state_name: {
-                        "description": state.description,
-                        "is_initial": state.is_initial,
-                        "is_terminal": state.is_terminal,
-                        **(state.properties or {}),
-                    }
+                    state_name: self._serialize_state(state)
                     for state_name, state in workflow.states.items()
                 },
                 "transitions": [
-                    {
-                        "from_state": trans.from_state,
-                        "to_state": trans.to_state,
-                        "conditions": [
-                            {"field": c.field, "operator": c.operator, "value": c.value}
-                            for c in trans.conditions
-                        ],
-                        "actions": [
-                            {"type": a.type, "parameters": a.parameters}
-                            for a in trans.actions
-                        ],
-                    }
-                    for trans in workflow.transitions
+                    self._serialize_transition(trans) for trans in workflow.transitions
                 ],
             }
         except Exception as e:
             raise ParserError(f"Error serializing to Fresh Service format: {e}")
+
+    def serialize_to(self, workflow: UnifiedWorkflow, fp: IO) -> None:
+        try:
+            document = LazyObject(
+                [
+                    (
+                        "states",
+                        LazyObject(
+                            (state_name, self._serialize_state(state))
+                            for state_name, state in workflow.states.items()
+                        ),
+                    ),
+                    (
+                        "transitions",
+                        LazyArray(
+                            map(self._serialize_transition, workflow.transitions)
+                        ),
+                    ),
+                ]
+            )
+            jsonstream.dump(document, fp)
+        except Exception as e:
+            raise ParserError(f"Error serializing to Fresh Service format: {e}")
@@ -1,5 +1,8 @@
 # aloof_union/parsers/jsm.py
 # from typing import Dict, List
+from typing import IO, Optional
+
+from aloof_union.core.interning import FlyweightPool
 from aloof_union.core.models import (
     Action,
     Condition,
@@ -9,10 +12,70 @@ from aloof_union.core.models import (
 )
 from aloof_union.exceptions import ParserError
 
+from . import jsonstream
 from .base import WorkflowParser
+from .jsonstream import DEFAULT_CHUNK_SIZE, LazyArray, LazyObject, iter_members
 
 
 class JSMParser(WorkflowParser):
+    def __init__(self, pool: Optional[FlyweightPool] = None):
+        """
+        Args:
+            pool: Optional flyweight pool; when given, conditions and actions
+                are shared, frozen instances drawn from it
+        """
+        self.pool = pool
+
+    def _parse_status(self, status: dict) -> WorkflowState:
+        properties = {
+            "statusCategory": status.get("statusCategory", "TO_DO"),
+            "jsmId": status.get("id"),
+            "jsmType": status.get("statusType"),
+        }
+
+        return WorkflowState(
+            name=status["name"],
+            description=status.get("description"),
+            is_initial=status.get("initial", False),
+            is_terminal=status.get("statusCategory") == "DONE",
+            properties=properties,
+        )
+
+    def _parse_rule(self, rule: dict) -> Transition:
+        pool = self.pool
+        make_condition = pool.condition if pool is not None else Condition
+        make_action = pool.action if pool is not None else Action
+
+        conditions = []
+        for jsm_condition in rule.get("conditions", []):
+            conditions.append(
+                make_condition(
+                    field=jsm_condition.get("field", {}).get("name", ""),
+                    operator=jsm_condition.get("operator", ""),
+                    value=jsm_condition.get("value"),
+                )
+            )
+
+        actions = []
+        for post_function in rule.get("postFunctions", []):
+            actions.append(
+                make_action(
+                    type=post_function.get("type", ""),
+                    parameters=post_function.get("configuration", {}),
+                )
+            )
+
+        if pool is not None:
+            conditions = pool.share(conditions)
+            actions = pool.share(actions)
+
+        return Transition(
+            from_state=rule["fromStatus"],
+            to_state=rule["toStatus"],
+            conditions=conditions,
+            actions=actions,
+        )
+
     def parse(self, content: dict) -> UnifiedWorkflow:
         try:
             states = {}
@@ -20,49 +83,50 @@ class JSMParser(WorkflowParser):
 
             # Parse JSM statuses to states
             for status in content.get("statuses", []):
-                properties = {
-                    "statusCategory": status.get("statusCategory", "TO_DO"),
-                    "jsmId": status.get("id"),
-                    "jsmType": status.get("statusType"),
-                }
-
-                states[status["name"]] = WorkflowState(
-                    name=status["name"],
-                    description=status.get("description"),
-                    is_initial=status.get("initial", False),
-                    is_terminal=status.get("statusCategory") == "DONE",
-                    properties=properties,
-                )
+                state = self._parse_status(status)
+                states[state.name] = state
 
             # Parse JSM rules to transitions
             for rule in content.get("rules", []):
-                conditions = []
-                for jsm_condition in rule.get("conditions", []):
-                    conditions.append(
-                        Condition(
-                            field=jsm_condition.get("field", {}).get("name", ""),
-                            operator=jsm_condition.get("operator", ""),
-                            value=jsm_condition.get("value"),
-                        )
-                    )
-
-                actions = []
-                for post_function in rule.get("postFunctions", []):
-                    actions.append(
-                        Action(
-                            type=post_function.get("type", ""),
-                            parameters=post_function.get("configuration", {}),
-                        )
-                    )
-
-                transitions.append(
-                    Transition(
-                        from_state=rule["fromStatus"],
-                        to_state=rule["toStatus"],
-                        conditions=conditions,
-                        actions=actions,
-                    )
-                )
+                transitions.append(self._parse_rule(rule))
+
+            return UnifiedWorkflow(states, transitions, {"source": "jsm"})
+
+        except KeyError as e:
+            raise ParserError(f"Missing required field in JSM workflow: {e}")
+        except Exception as e:
+            raise ParserError(f"Error parsing JSM workflow: {e}")
+
+    def parse_stream(
+        self, fp: IO, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> UnifiedWorkflow:
+        """
+        Parse a JSM export incrementally from a file object.
+
+        Statuses and rules are decoded one element at a time and converted
+        straight into the unified model, so the raw export is never held in
+        memory as a whole.
+
+        Args:
+            fp: Text or binary file object containing the JSM export
+            chunk_size: Number of characters or bytes read per refill
+
+        Returns:
+            The parsed workflow
+
+        Raises:
+            ParserError: If the export is malformed
+        """
+        try:
+            states = {}
+            transitions = []
+
+            for key, item in iter_members(fp, ("statuses", "rules"), chunk_size):
+                if key == "statuses":
+                    state = self._parse_status(item)
+                    states[state.name] = state
+                elif key == "rules":
+                    transitions.append(self._parse_rule(item))
 
             return UnifiedWorkflow(states, transitions, {"source": "jsm"})
 
@@ -71,41 +135,63 @@ class JSMParser(WorkflowParser):
         except Exception as e:
             raise ParserError(f"Error parsing JSM workflow: {e}")
 
+    def _serialize_state(self, state: WorkflowState) -> dict:
+        properties = state.properties or {}
+        return {
+            "name": state.name,
+            "description": state.description,
+            "initial": state.is_initial,
+            "statusCategory": properties.get("statusCategory", "TO_DO"),
+            "id": properties.get("jsmId"),
+            "statusType": properties.get("jsmType"),
+        }
+
+    def _serialize_transition(self, trans: Transition) -> dict:
+        return {
+            "fromStatus": trans.from_state,
+            "toStatus": trans.to_state,
+            "conditions": [
+                {
+                    "field": {"name": c.field},
+                    "operator": c.operator,
+                    "value": c.value,
+                }
+                for c in trans.conditions
+            ],
+            "postFunctions": [
+                {"type": a.type, "configuration": a.parameters} for a in trans.actions
+            ],
+        }
+
     def serialize(self, workflow: UnifiedWorkflow) -> dict:
         try:
             return {
                 "statuses": [
-                    {
-                        "name": state.name,
-                        "description": state.description,
-                        "initial": state.is_initial,
-                        "statusCategory": state.properties.get(
-                            "statusCategory", "TO_DO"
-                        ),
-                        "id": state.properties.get("jsmId"),
-                        "statusType": state.properties.get("jsmType"),
-                    }
-                    for state in workflow.states.values()
+                    self._serialize_state(state) for state in workflow.states.values()
                 ],
                 "rules": [
-                    {
-                        "fromStatus": trans.from_state,
-                        "toStatus": trans.to_state,
-                        "conditions": [
-                            {
-                                "field": {"name": c.field},
-                                "operator": c.operator,
-                                "value": c.value,
-                            }
-                            for c in trans.conditions
-                        ],
-                        "postFunctions": [
-                            {"type": a.type, "configuration": a.parameters}
-                            for a in trans.actions
-                        ],
-                    }
-                    for trans in workflow.transitions
+                    self._serialize_transition(trans) for trans in workflow.transitions
                 ],
             }
         except Exception as e:
             raise ParserError(f"Error serializing to JSM format: {e}")
+
+    def serialize_to(self, workflow: UnifiedWorkflow, fp: IO) -> None:
+        try:
+            document = LazyObject(
+                [
+                    (
+                        "statuses",
+                        LazyArray(map(self._serialize_state, workflow.states.values())),
+                    ),
+                    (
+                        "rules",
+                        LazyArray(
+                            map(self._serialize_transition, workflow.transitions)
+                        ),
+                    ),
+                ]
+            )
+            jsonstream.dump(document, fp)
+        except Exception as e:
+            raise ParserError(f"Error serializing to JSM format: {e}")
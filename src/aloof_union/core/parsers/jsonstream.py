@@ -0,0 +1,186 @@
+# aloof_union/parsers/jsonstream.py
+import codecs
+import json
+from typing import IO, Any, Collection, Iterable, Iterator, Optional, Tuple, Union
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE = " \t\n\r"
+
+
+class _StreamReader:
+    """Buffered reader that decodes one JSON value at a time from a file."""
+
+    def __init__(self, fp: IO, chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder: Optional[codecs.IncrementalDecoder] = None
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> None:
+        # Drop the consumed prefix so the buffer only holds pending text
+        self._buffer = self._buffer[self._pos :]
+        self._pos = 0
+
+        chunk: Union[str, bytes] = self._fp.read(size)
+        if not chunk:
+            self._eof = True
+        if isinstance(chunk, bytes):
+            if self._text_decoder is None:
+                self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+            chunk = self._text_decoder.decode(chunk, final=self._eof)
+        self._buffer += chunk
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            buffer = self._buffer
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or self._eof:
+                return
+            self._fill(self._chunk_size)
+
+    def peek(self) -> str:
+        self._skip_whitespace()
+        if self._pos >= len(self._buffer):
+            raise ValueError("Unexpected end of JSON input")
+        return self._buffer[self._pos]
+
+    def expect(self, *chars: str) -> str:
+        char = self.peek()
+        if char not in chars:
+            expected = " or ".join(repr(c) for c in chars)
+            raise ValueError(f"Expected {expected} but found {char!r}")
+        self._pos += 1
+        return char
+
+    def value(self) -> Any:
+        self._skip_whitespace()
+        size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A value running up to the end of the buffer may be a
+                # truncated number or literal, so read on before trusting it
+                if end < len(self._buffer) or self._eof:
+                    self._pos = end
+                    return value
+            # Grow reads geometrically so huge values decode in O(n) retries
+            self._fill(size)
+            size *= 2
+
+
+def iter_members(
+    fp: IO,
+    stream_keys: Collection[str] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally read the members of a top-level JSON object.
+
+    Members whose key is in ``stream_keys`` must hold arrays; their elements
+    are yielded one at a time as ``(key, element)`` so the array is never
+    materialized. Every other member is yielded whole as ``(key, value)``.
+
+    Args:
+        fp: Text or binary (UTF-8) file object positioned at the document
+        stream_keys: Keys whose array elements are streamed individually
+        chunk_size: Number of characters or bytes read per refill
+
+    Raises:
+        ValueError: If the document is not a well-formed JSON object
+    """
+    reader = _StreamReader(fp, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+
+    while True:
+        key = reader.value()
+        if not isinstance(key, str):
+            raise ValueError(f"Expected object key but found {key!r}")
+        reader.expect(":")
+
+        if key in stream_keys:
+            reader.expect("[")
+            if reader.peek() == "]":
+                reader.expect("]")
+            else:
+                while True:
+                    yield key, reader.value()
+                    if reader.expect(",", "]") == "]":
+                        break
+        else:
+            yield key, reader.value()
+
+        if reader.expect(",", "}") == "}":
+            return
+
+
+class LazyObject:
+    """JSON object whose members are produced on demand while encoding."""
+
+    def __init__(self, members: Iterable[Tuple[str, Any]]):
+        self.members = members
+
+
+class LazyArray:
+    """JSON array whose elements are produced on demand while encoding."""
+
+    def __init__(self, items: Iterable[Any]):
+        self.items = items
+
+
+def iter_encode(value: Any, indent: int = 2, level: int = 0) -> Iterator[str]:
+    """
+    Encode ``value`` as JSON in chunks.
+
+    :class:`LazyObject` and :class:`LazyArray` containers are expanded one
+    member at a time; any other value is encoded whole. The concatenated
+    output is identical to ``json.dumps(value, indent=indent)`` with the lazy
+    containers replaced by a dict and a list.
+
+    Args:
+        value: The value to encode
+        indent: Number of spaces per indentation level
+        level: Indentation level the value starts at
+    """
+    if isinstance(value, LazyObject):
+        entries: Iterable[Any] = value.members
+        opening, closing = "{", "}"
+    elif isinstance(value, LazyArray):
+        entries = value.items
+        opening, closing = "[", "]"
+    else:
+        text = json.dumps(value, indent=indent)
+        yield text.replace("\n", "\n" + " " * (indent * level)) if level else text
+        return
+
+    inner = "\n" + " " * (indent * (level + 1))
+    separator = opening + inner
+    for entry in entries:
+        yield separator
+        separator = "," + inner
+        if opening == "{":
+            key, entry = entry
+            yield json.dumps(key) + ": "
+        yield from iter_encode(entry, indent, level + 1)
+
+    if separator == opening + inner:
+        yield opening + closing
+    else:
+        yield "\n" + " " * (indent * level) + closing
+
+
+def dump(value: Any, fp: IO, indent: int = 2) -> None:
+    """Write ``value`` to ``fp`` as JSON, expanding lazy containers in chunks."""
+    write = fp.write
+    for chunk in iter_encode(value, indent):
+        write(chunk)
@@ -1,5 +1,8 @@
 # aloof_union/parsers/mermaid.py
-from typing import List, Tuple
+import io
+import re
+from enum import Enum
+from typing import IO, Iterable, Iterator, List, NamedTuple, Optional, Union
 
 from aloof_union.core.models import (  # Action,
     Condition,
@@ -12,70 +15,118 @@ from aloof_union.exceptions import ParserError
 from .base import WorkflowParser
 
 
-class MermaidParser(WorkflowParser):
-    def _parse_transition_line(self, line: str) -> Tuple[str, str, List[str]]:
-        """Parse a Mermaid transition line into components."""
-        try:
-            # Split on arrow
-            parts = line.split("-->")
-            if len(parts) != 2:
-                raise ParserError(f"Invalid transition line: {line}")
+class TokenKind(Enum):
+    HEADER = "header"
+    STATE = "state"
+    NOTE_START = "note_start"
+    NOTE_TEXT = "note_text"
+    NOTE_END = "note_end"
+    TRANSITION = "transition"
+    OTHER = "other"
+
+
+class Token(NamedTuple):
+    kind: TokenKind
+    lineno: int
+    text: str
+    # STATE: (name,); NOTE_START: (state, inline_text); TRANSITION:
+    # (from_state, to_state, condition_strs or None)
+    args: tuple = ()
+
+
+# Header, state and note lines are classified by a single match
+_DECLARATION_RE = re.compile(
+    r"""
+    (?P<header>stateDiagram)
+    | state\s*"(?P<state>[^"]*)"
+    | note\s+(?:(?:left|right)\s+of\s+(?P<note_of>[^:]*?)|[^:]*?)
+      \s*(?::\s*(?P<note_text>.*))?$
+    """,
+    re.VERBOSE,
+)
+
 
-            from_state = parts[0].strip()
+def tokenize(lines: Union[str, Iterable[Union[str, bytes]]]) -> Iterator[Token]:
+    """
+    Lazily classify the lines of a Mermaid state diagram.
+
+    Args:
+        lines: Diagram text, or any iterable of lines such as a file object
+
+    Yields:
+        One token per non-blank line, carrying its 1-based source line number
+
+    Raises:
+        ParserError: If a transition line is malformed
+    """
+    if isinstance(lines, str):
+        lines = io.StringIO(lines)
+
+    in_note = False
+    for lineno, line in enumerate(lines, 1):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.strip()
+        if not line:
+            continue
+
+        if in_note:
+            if line == "end note":
+                in_note = False
+                yield Token(TokenKind.NOTE_END, lineno, line)
+            else:
+                yield Token(TokenKind.NOTE_TEXT, lineno, line)
+            continue
+
+        # Declarations are the only lines starting with "s" or "n" that need
+        # the regex; everything else is either a transition or ignored
+        match = _DECLARATION_RE.match(line) if line[0] in "sn" else None
+        if match is not None:
+            group = match.lastgroup
+            if group == "header":
+                yield Token(TokenKind.HEADER, lineno, line)
+            elif group == "state":
+                yield Token(TokenKind.STATE, lineno, line, (match["state"],))
+            else:
+                note_text = match["note_text"]
+                in_note = note_text is None
+                yield Token(
+                    TokenKind.NOTE_START, lineno, line, (match["note_of"], note_text)
+                )
+            continue
 
-            # Split destination and label
-            to_parts = parts[1].split(":")
-            to_state = to_parts[0].strip()
+        from_state, arrow, rest = line.partition("-->")
+        if not arrow:
+            yield Token(TokenKind.OTHER, lineno, line)
+            continue
 
-            # Parse conditions if they exist
-            conditions = []
-            if len(to_parts) > 1:
-                label = to_parts[1].strip()
-                conditions = [cond.strip() for cond in label.split("&&")]
+        from_state = from_state.rstrip()
+        to_state, colon, label = rest.partition(":")
+        to_state = to_state.strip()
+        if not from_state or "-->" in to_state:
+            raise ParserError(f"Line {lineno}: Invalid transition line: {line}")
+        conditions = [c.strip() for c in label.split("&&")] if colon else None
+        yield Token(
+            TokenKind.TRANSITION, lineno, line, (from_state, to_state, conditions)
+        )
 
-            return from_state, to_state, conditions
 
-        except Exception as e:
-            raise ParserError(f"Error parsing Mermaid transition: {e}")
+class MermaidParser(WorkflowParser):
+    extension = ".mmd"
+    text_output = True
 
-    def parse(self, content: str) -> UnifiedWorkflow:
+    def parse(self, content: Union[str, Iterable[str]]) -> UnifiedWorkflow:
         try:
             states = {}
             transitions = []
-            current_note = None
-            current_state = None
-
-            lines = content.split("\n")
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith("stateDiagram"):
-                    continue
+            current_note: Optional[List[str]] = None
+            current_state: Optional[str] = None
 
-                # Handle state declarations
-                if line.startswith("state"):
-                    parts = line.split('"')
-                    if len(parts) >= 3:
-                        state_name = parts[1]
-                        states[state_name] = WorkflowState(name=state_name)
-
-                # Handle notes
-                elif line.startswith("note"):
-                    current_note = []
-                    if "of" in line:
-                        current_state = line.split("of")[1].strip()
-                elif line == "end note" and current_note and current_state:
-                    if current_state in states:
-                        states[current_state].description = "\n".join(current_note)
-                    current_note = None
-                    current_state = None
-                elif current_note is not None:
-                    current_note.append(line)
+            for token in tokenize(content):
+                kind = token.kind
 
-                # Handle transitions
-                elif "-->" in line:
-                    from_state, to_state, condition_strs = self._parse_transition_line(
-                        line
-                    )
+                if kind is TokenKind.TRANSITION:
+                    from_state, to_state, condition_strs = token.args
 
                     # Handle initial and terminal states
                     if from_state == "[*]":
@@ -95,7 +146,7 @@ class MermaidParser(WorkflowParser):
                     # Create transition
                     conditions = [
                         Condition("condition", "equals", cond)
-                        for cond in condition_strs
+                        for cond in condition_strs or ()
                     ]
 
                     transitions.append(
@@ -107,53 +158,81 @@ class MermaidParser(WorkflowParser):
                         )
                     )
 
+                # Handle state declarations
+                elif kind is TokenKind.STATE:
+                    state_name = token.args[0]
+                    states[state_name] = WorkflowState(name=state_name)
+
+                # Handle notes
+                elif kind is TokenKind.NOTE_TEXT:
+                    current_note.append(token.text)
+                elif kind is TokenKind.NOTE_START:
+                    current_state, inline_text = token.args
+                    current_note = [] if inline_text is None else [inline_text]
+                    # A single-line note closes immediately
+                    if inline_text is not None:
+                        kind = TokenKind.NOTE_END
+                if kind is TokenKind.NOTE_END:
+                    if current_note and current_state in states:
+                        states[current_state].description = "\n".join(current_note)
+                    current_note = None
+                    current_state = None
+
             return UnifiedWorkflow(states, transitions, {"source": "mermaid"})
 
         except Exception as e:
             raise ParserError(f"Error parsing Mermaid diagram: {e}")
 
+    def parse_stream(self, fp: IO) -> UnifiedWorkflow:
+        return self.parse(fp)
+
+    def _iter_lines(self, workflow: UnifiedWorkflow) -> Iterator[str]:
+        index = workflow.index
+        yield "stateDiagram-v2"
+
+        # Add initial states
+        for name in index.initial:
+            yield f"    [*] --> {name}"
+
+        # Add state descriptions as notes
+        for state in workflow.states.values():
+            if state.description:
+                yield f"    note right of {state.name}"
+                yield f"        {state.description}"
+                yield "    end note"
+
+        # Add transitions
+        for trans in workflow.transitions:
+            # Combine conditions into label
+            label = " && ".join(
+                f"{c.field} {c.operator} {c.value}"
+                for c in trans.conditions
+                if c.field == "condition"  # Only use condition-type conditions
+            )
+
+            if label:
+                yield f"    {trans.from_state} --> {trans.to_state}: {label}"
+            else:
+                yield f"    {trans.from_state} --> {trans.to_state}"
+
+        # Add terminal states
+        for name in index.terminal:
+            yield f"    {name} --> [*]"
+
     def serialize(self, workflow: UnifiedWorkflow) -> str:
         try:
-            lines = ["stateDiagram-v2"]
-
-            # Add initial states
-            initial_states = [s for s in workflow.states.values() if s.is_initial]
-            for state in initial_states:
-                lines.append(f"    [*] --> {state.name}")
-
-            # Add state descriptions as notes
-            for state in workflow.states.values():
-                if state.description:
-                    lines.extend(
-                        [
-                            f"    note right of {state.name}",
-                            f"        {state.description}",
-                            "    end note",
-                        ]
-                    )
+            return "\n".join(self._iter_lines(workflow))
 
-            # Add transitions
-            for trans in workflow.transitions:
-                # Combine conditions into label
-                label = " && ".join(
-                    f"{c.field} {c.operator} {c.value}"
-                    for c in trans.conditions
-                    if c.field == "condition"  # Only use condition-type conditions
-                )
-
-                if label:
-                    lines.append(
-                        f"    {trans.from_state} --> {trans.to_state}: {label}"
-                    )
-                else:
-                    lines.append(f"    {trans.from_state} --> {trans.to_state}")
-
-            # Add terminal states
-            terminal_states = [s for s in workflow.states.values() if s.is_terminal]
-            for state in terminal_states:
-                lines.append(f"    {state.name} --> [*]")
+        except Exception as e:
+            raise ParserError(f"Error serializing to Mermaid format: {e}")
 
-            return "\n".join(lines)
+    def serialize_to(self, workflow: UnifiedWorkflow, fp: IO) -> None:
+        try:
+            write = fp.write
+            separator = ""
+            for line in self._iter_lines(workflow):
+                write(separator + line)
+                separator = "\n"
 
         except Exception as e:
             raise ParserError(f"Error serializing to Mermaid format: {e}")
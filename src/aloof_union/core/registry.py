@@ -0,0 +1,232 @@
+# aloof_union/core/registry.py
+"""
+Registry of workflow formats and the parsers that read and write them.
+
+A format is named by an :class:`AutomationType` or, for formats contributed
+by other packages, a plain string. Parsers are recorded as ``"module:Class"``
+references and imported the first time their format is used, so registering
+many formats costs nothing at startup.
+
+Other packages add formats through the ``aloof_union.parsers`` entry point
+group, without touching this package::
+
+    [options.entry_points]
+    aloof_union.parsers =
+        servicenow = acme_formats.servicenow:ServiceNowParser
+
+Installed entry points are only scanned when a name is not one of the
+registered formats, or when every format is listed.
+"""
+
+from importlib import import_module
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .models import AutomationType
+
+if TYPE_CHECKING:
+    from .parsers.base import WorkflowParser
+
+ENTRY_POINT_GROUP = "aloof_union.parsers"
+
+#: A format as accepted by the transpiler: a built-in type or a registered name
+FormatType = Union[AutomationType, str]
+
+#: How a parser is registered: a ``"module:Class"`` reference, or a class or
+#: other callable returning a parser
+ParserSpec = Union[str, Callable[[], "WorkflowParser"]]
+
+# Built-in formats, their parsers and short aliases
+BUILTIN_PARSERS: Dict[AutomationType, str] = {
+    AutomationType.FRESHSERVICE: (
+        "aloof_union.core.parsers.freshservice:FreshServiceParser"
+    ),
+    AutomationType.JSM: "aloof_union.core.parsers.jsm:JSMParser",
+    AutomationType.MERMAID: "aloof_union.core.parsers.mermaid:MermaidParser",
+}
+BUILTIN_ALIASES: Dict[str, AutomationType] = {"fs": AutomationType.FRESHSERVICE}
+
+
+def _load_spec(spec: str) -> Any:
+    module, _, attr = spec.partition(":")
+    value = import_module(module)
+    for part in attr.split(".") if attr else ():
+        value = getattr(value, part)
+    return value
+
+
+def _entry_points(group: str) -> Sequence[Any]:
+    # Imported here: importlib.metadata is slow to import and rarely needed
+    from importlib import metadata
+
+    eps = metadata.entry_points()
+    if hasattr(eps, "select"):
+        return eps.select(group=group)
+    # Python < 3.10 returns a dict keyed by group
+    return eps.get(group, ())
+
+
+class ParserRegistry:
+    """
+    Maps format names to lazily created, shared parser instances.
+
+    Built-in formats resolve to their :class:`AutomationType`; every other
+    format resolves to its registered name.
+    """
+
+    def __init__(self, entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
+        """
+        Args:
+            entry_point_group: Entry point group scanned for plugin formats,
+                or None to only use explicitly registered formats
+        """
+        self._specs: Dict[FormatType, ParserSpec] = {}
+        self._names: Dict[str, FormatType] = {}
+        self._parsers: Dict[FormatType, "WorkflowParser"] = {}
+        self._group = entry_point_group
+        self._discovered = entry_point_group is None
+
+    def register(
+        self,
+        name: FormatType,
+        parser: ParserSpec,
+        aliases: Iterable[str] = (),
+        replace: bool = False,
+    ) -> None:
+        """
+        Register the parser for a format.
+
+        Args:
+            name: An :class:`AutomationType` or the format's name
+            parser: ``"module:Class"`` reference, or a class or other
+                callable returning a parser; references are imported on
+                first use
+            aliases: Other names the format may be given by
+            replace: Whether to replace an existing registration
+
+        Raises:
+            ValueError: If the name or an alias is already taken and
+                ``replace`` is False
+        """
+        key = name if isinstance(name, AutomationType) else name.lower()
+        names = [key.value if isinstance(key, AutomationType) else key]
+        names += [alias.lower() for alias in aliases]
+        if not replace:
+            taken = [n for n in names if self._names.get(n, key) != key]
+            if key in self._specs or taken:
+                raise ValueError(
+                    f"Format {(taken or names)[0]!r} is already registered"
+                )
+        self._specs[key] = parser
+        self._parsers.pop(key, None)
+        for n in names:
+            self._names[n] = key
+
+    def resolve(self, name: FormatType) -> FormatType:
+        """
+        Return the canonical form of a format name or alias.
+
+        Raises:
+            KeyError: If the format is not registered
+        """
+        if isinstance(name, AutomationType):
+            if name in self._specs:
+                return name
+        elif isinstance(name, str):
+            key = self._names.get(name.lower())
+            if key is None and not self._discovered:
+                self.discover()
+                key = self._names.get(name.lower())
+            if key is not None:
+                return key
+        raise KeyError(name)
+
+    def get(self, name: FormatType) -> "WorkflowParser":
+        """
+        Return the shared parser for a format, creating it on first use.
+
+        Raises:
+            KeyError: If the format is not registered
+        """
+        key = self.resolve(name)
+        parser = self._parsers.get(key)
+        if parser is None:
+            spec = self._specs[key]
+            if isinstance(spec, str):
+                spec = _load_spec(spec)
+            parser = self._parsers[key] = spec()
+        return parser
+
+    def names(self, aliases: bool = False) -> List[str]:
+        """
+        List the registered formats, including any installed plugins.
+
+        Args:
+            aliases: Whether to include aliases as well as canonical names
+        """
+        self.discover()
+        if aliases:
+            return list(self._names)
+        return [getattr(key, "value", key) for key in self._specs]
+
+    def discover(self) -> None:
+        """
+        Register the formats advertised by installed entry points.
+
+        Only the entry point metadata is read; plugin modules are imported
+        when their format is first used. Formats already registered under
+        the same name take precedence.
+        """
+        if self._discovered:
+            return
+        self._discovered = True
+        for ep in _entry_points(self._group):
+            if ep.name.lower() not in self._names:
+                self.register(ep.name, lambda ep=ep: ep.load()())
+
+    def __contains__(self, name: object) -> bool:
+        try:
+            self.resolve(name)  # type: ignore[arg-type]
+        except KeyError:
+            return False
+        return True
+
+
+def _default_registry() -> ParserRegistry:
+    default = ParserRegistry()
+    for automation_type, spec in BUILTIN_PARSERS.items():
+        aliases = [a for a, t in BUILTIN_ALIASES.items() if t is automation_type]
+        default.register(automation_type, spec, aliases)
+    return default
+
+
+#: The registry used by :func:`get_parser` and the transpilers
+registry = _default_registry()
+
+
+def register_parser(
+    name: FormatType,
+    parser: ParserSpec,
+    aliases: Iterable[str] = (),
+    replace: bool = False,
+) -> None:
+    """
+    Register a format with the default registry.
+
+    See :meth:`ParserRegistry.register`.
+    """
+    registry.register(name, parser, aliases, replace)
+
+
+def resolve_format(name: FormatType) -> FormatType:
+    """Canonical form of a format name in the default registry."""
+    return registry.resolve(name)
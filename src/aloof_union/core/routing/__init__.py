@@ -0,0 +1,51 @@
+# aloof_union/core/routing/__init__.py
+"""
+Routing live tickets through a workflow.
+
+A :class:`RoutingEngine` compiles the conditions of a workflow's
+transitions once, then tells for any ticket which transitions out of its
+current state are enabled. A :class:`ColumnarRouter` does the same for
+columns of tickets held in NumPy arrays; it is imported on first use.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+from .engine import RoutingEngine
+from .operators import (
+    OPERATORS,
+    OperatorFactory,
+    Predicate,
+    compile_condition,
+    register_operator,
+)
+
+if TYPE_CHECKING:
+    from .columnar import COLUMN_OPERATORS, ColumnarRouter
+
+# Names from the NumPy-backed module, loaded on first access
+_LAZY_NAMES = {"ColumnarRouter": "columnar", "COLUMN_OPERATORS": "columnar"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_NAMES:
+        value = getattr(import_module(f".{_LAZY_NAMES[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_NAMES])
+
+
+__all__ = [
+    "RoutingEngine",
+    "ColumnarRouter",
+    "COLUMN_OPERATORS",
+    "OPERATORS",
+    "OperatorFactory",
+    "Predicate",
+    "compile_condition",
+    "register_operator",
+]
@@ -0,0 +1,446 @@
+# aloof_union/core/routing/columnar.py
+"""
+Vectorized evaluation of transition conditions over columns of tickets.
+
+Backfills over historical tickets hold one NumPy array per field rather
+than one mapping per ticket. :class:`ColumnarRouter` evaluates the
+conditions of a workflow against such columns with whole-array
+operations. It yields a boolean mask per transition, or the next state
+of every ticket, without a Python-level loop over tickets.
+
+Tickets are grouped by current state once, and each state's transitions
+are evaluated on that group only. The work is therefore proportional to
+tickets times the transitions out of their state, not times all
+transitions. Later conditions of a transition only look at the rows the
+earlier ones let through.
+
+Operators from :data:`COLUMN_OPERATORS` run as array expressions when the
+column's dtype suits them: numbers, booleans and fixed-width unicode
+strings.
+Anything else, such as object columns, ``matches`` or operators added
+or replaced with :func:`register_operator`, falls back to the row
+predicate of :mod:`.operators` applied per value. Results agree with
+:class:`RoutingEngine`, except that a missing value is None in object
+columns and NaN in float columns. A field with no column reads as
+missing for every ticket.
+
+NumPy is an optional dependency (``pip install aloof-union[simulation]``).
+"""
+
+import operator as op
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from aloof_union.exceptions import RoutingError
+
+from ..models import Condition, UnifiedWorkflow
+from .operators import (
+    Predicate,
+    compile_condition,
+    is_builtin_operator,
+    normalize_operator,
+)
+
+#: Evaluates a condition over a column; None when the dtype isn't supported
+ColumnTest = Callable[[Any], Optional[Any]]
+#: Builds the column test of a condition from its value
+ColumnFactory = Callable[[Any], ColumnTest]
+
+_NUMERIC = "biuf"
+# Only unicode strings: bytes never equal or order against a str value, and
+# np.char rejects a str argument on a bytes column
+_STRING = "U"
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, str)
+
+
+def _missing(column: Any) -> Any:
+    kind = column.dtype.kind
+    if kind == "f":
+        return np.isnan(column)
+    if kind == "O":
+        return np.equal(column, None).astype(bool)
+    return np.zeros(len(column), dtype=bool)
+
+
+def _negate(factory: ColumnFactory) -> ColumnFactory:
+    def negated(value: Any) -> ColumnTest:
+        test = factory(value)
+
+        def column_test(column: Any) -> Optional[Any]:
+            result = test(column)
+            return None if result is None else ~result
+
+        return column_test
+
+    return negated
+
+
+def _equals(value: Any) -> ColumnTest:
+    if value is None:
+        return _missing
+
+    def column_test(column: Any) -> Optional[Any]:
+        kind = column.dtype.kind
+        if (kind in _NUMERIC and _is_number(value)) or (
+            kind in _STRING and isinstance(value, str)
+        ):
+            return np.asarray(column == value, dtype=bool)
+        if kind in _NUMERIC + _STRING:
+            # A string never equals a number
+            return np.zeros(len(column), dtype=bool)
+        return None
+
+    return column_test
+
+
+def _in(value: Any) -> ColumnTest:
+    values = (
+        list(value) if isinstance(value, (list, tuple, set, frozenset)) else [value]
+    )
+    # A column only ever holds values of its own kind; the others never match
+    numbers = [v for v in values if _is_number(v)]
+    strings = [v for v in values if isinstance(v, str)]
+
+    def column_test(column: Any) -> Optional[Any]:
+        kind = column.dtype.kind
+        if kind in _NUMERIC:
+            return np.isin(column, numbers)
+        if kind in _STRING:
+            return np.isin(column, strings)
+        return None
+
+    return column_test
+
+
+def _string_test(function: Callable[[Any, str], Any]) -> ColumnFactory:
+    def factory(value: Any) -> ColumnTest:
+        def column_test(column: Any) -> Optional[Any]:
+            kind = column.dtype.kind
+            if kind in _STRING and isinstance(value, str):
+                return np.asarray(function(column, value), dtype=bool)
+            if kind in _NUMERIC:
+                # Numbers never contain, start or end with anything
+                return np.zeros(len(column), dtype=bool)
+            return None
+
+        return column_test
+
+    return factory
+
+
+def _exists(value: Any) -> ColumnTest:
+    if value is False:
+        return _missing
+    return lambda column: ~_missing(column)
+
+
+def _is_empty(value: Any) -> ColumnTest:
+    def column_test(column: Any) -> Optional[Any]:
+        kind = column.dtype.kind
+        if kind in _STRING:
+            return np.char.str_len(column) == 0
+        if kind in _NUMERIC:
+            return _missing(column)
+        return None
+
+    return column_test
+
+
+def _ordering(compare: Callable[[Any, Any], Any]) -> ColumnFactory:
+    def factory(value: Any) -> ColumnTest:
+        def column_test(column: Any) -> Optional[Any]:
+            kind = column.dtype.kind
+            if (kind in _NUMERIC and _is_number(value)) or (
+                kind in _STRING and isinstance(value, str)
+            ):
+                # NaN compares false, like a missing value in a ticket
+                return np.asarray(compare(column, value), dtype=bool)
+            if kind in _NUMERIC + _STRING:
+                # Numbers and strings don't order against each other
+                return np.zeros(len(column), dtype=bool)
+            return None
+
+        return column_test
+
+    return factory
+
+
+_contains = _string_test(lambda column, value: np.char.find(column, value) >= 0)
+_greater = _ordering(op.gt)
+_greater_equal = _ordering(op.ge)
+_less = _ordering(op.lt)
+_less_equal = _ordering(op.le)
+
+#: Vectorized operators by normalized name; others use their row predicate
+COLUMN_OPERATORS: Dict[str, ColumnFactory] = {
+    "equals": _equals,
+    "is": _equals,
+    "==": _equals,
+    "=": _equals,
+    "not equals": _negate(_equals),
+    "is not": _negate(_equals),
+    "!=": _negate(_equals),
+    "in": _in,
+    "not in": _negate(_in),
+    "contains": _contains,
+    "not contains": _negate(_contains),
+    "does not contain": _negate(_contains),
+    "exists": _exists,
+    "is empty": _is_empty,
+    "is not empty": _negate(_is_empty),
+    "greater than": _greater,
+    ">": _greater,
+    "greater than or equals": _greater_equal,
+    ">=": _greater_equal,
+    "less than": _less,
+    "<": _less,
+    "less than or equals": _less_equal,
+    "<=": _less_equal,
+    "starts with": _string_test(
+        lambda column, value: np.char.startswith(column, value)
+    ),
+    "ends with": _string_test(lambda column, value: np.char.endswith(column, value)),
+}
+
+
+class _CompiledCondition:
+    """A condition's column test, with its row predicate as fallback."""
+
+    __slots__ = ("field", "test", "predicate")
+
+    def __init__(self, condition: Condition):
+        self.field = condition.field
+        self.predicate: Predicate = compile_condition(
+            condition.field, condition.operator, condition.value
+        )
+        # A replaced built-in operator no longer matches its array version
+        factory = None
+        if is_builtin_operator(condition.operator):
+            factory = COLUMN_OPERATORS.get(normalize_operator(condition.operator))
+        self.test: Optional[ColumnTest] = factory(condition.value) if factory else None
+
+    def __call__(self, columns: Mapping[str, Any], rows: Any) -> Any:
+        column = columns.get(self.field)
+        if column is None:
+            return np.full(len(rows), self.predicate({}), dtype=bool)
+        values = column[rows]
+        result = self.test(values) if self.test is not None else None
+        if result is not None:
+            return result
+        field, predicate = self.field, self.predicate
+        return np.fromiter(
+            (predicate({field: v}) for v in values.tolist()), bool, len(values)
+        )
+
+
+_Route = Tuple[int, int, Tuple[_CompiledCondition, ...]]
+
+
+class ColumnarRouter:
+    """
+    Evaluates a workflow's transitions over columns of tickets.
+
+    Columns are a mapping from field name to a NumPy array, all of the
+    same length. Current states are given as an array of state names, or
+    of integer ids indexing :attr:`names`.
+
+    The router is a snapshot: build a new one after editing the workflow.
+    """
+
+    def __init__(self, workflow: UnifiedWorkflow):
+        """
+        Args:
+            workflow: The workflow whose transitions route tickets
+
+        Raises:
+            ImportError: If NumPy is not installed
+            RoutingError: If a condition uses an unknown operator or a
+                value its operator rejects
+        """
+        if np is None:
+            raise ImportError(
+                "Columnar routing needs the numpy package "
+                "(pip install aloof-union[simulation])"
+            )
+        index = workflow.index
+        names = list(index.names)
+        ids = dict(index.ids)
+        for transition in workflow.transitions:
+            for name in (transition.from_state, transition.to_state):
+                if name not in ids:
+                    ids[name] = len(names)
+                    names.append(name)
+        #: State names; position is the id used in state and next-state arrays
+        self.names: List[str] = names
+        self.ids: Dict[str, int] = ids
+        # Sorted names and their ids, to look up name arrays by bisection
+        order = sorted(ids)
+        self._sorted_names = np.array(order, dtype=str)
+        self._sorted_ids = np.array([ids[name] for name in order], dtype=np.intp)
+
+        compiled: Dict[Any, _CompiledCondition] = {}
+
+        def compile_one(condition: Condition) -> _CompiledCondition:
+            key = (condition.field, condition.operator, repr(condition.value))
+            if key not in compiled:
+                compiled[key] = _CompiledCondition(condition)
+            return compiled[key]
+
+        # Per source state id: (transition position, target id, conditions)
+        groups: Dict[int, List[_Route]] = {}
+        for position, transition in enumerate(workflow.transitions):
+            try:
+                conditions = tuple(compile_one(c) for c in transition.conditions)
+            except RoutingError as e:
+                raise RoutingError(
+                    f"Transition {transition.from_state} -> "
+                    f"{transition.to_state}: {e}"
+                ) from e
+            groups.setdefault(ids[transition.from_state], []).append(
+                (position, ids[transition.to_state], conditions)
+            )
+        self._groups = groups
+        self._transitions = len(workflow.transitions)
+
+    def state_ids(self, states: Any) -> Any:
+        """
+        Integer ids of an array of state names; integer arrays pass through.
+
+        Raises:
+            RoutingError: If a state is unknown
+        """
+        states = np.asarray(states)
+        if states.dtype.kind in "iu":
+            if len(states) and (states.min() < 0 or states.max() >= len(self.names)):
+                raise RoutingError("State id out of range")
+            return states.astype(np.intp, copy=False)
+        names = self._sorted_names
+        if not len(names):
+            if len(states):
+                raise RoutingError(f"Ticket is in unknown state {states.tolist()[0]!r}")
+            return np.zeros(0, dtype=np.intp)
+        if states.dtype.kind not in _STRING:
+            # Fixed-width strings compare in C; object arrays one by one
+            names = names.astype(object)
+        try:
+            positions = np.searchsorted(names, states)
+        except TypeError:
+            raise RoutingError("States must be state names or integer ids") from None
+        np.minimum(positions, len(names) - 1, out=positions)
+        found = names[positions] == states
+        if not found.all():
+            first = np.flatnonzero(~found)[0]
+            unknown = states[first : first + 1].tolist()[0]
+            raise RoutingError(f"Ticket is in unknown state {unknown!r}")
+        return self._sorted_ids[positions]
+
+    def _by_state(self, states: Any) -> List[Tuple[int, Any]]:
+        # Rows of each state with outgoing transitions, from one stable sort
+        ids = self.state_ids(states)
+        order = np.argsort(ids, kind="stable")
+        bounds = np.searchsorted(ids[order], np.arange(len(self.names) + 1))
+        return [
+            (state, order[bounds[state] : bounds[state + 1]])
+            for state in self._groups
+            if bounds[state + 1] > bounds[state]
+        ]
+
+    @staticmethod
+    def _passing(
+        conditions: Sequence[_CompiledCondition],
+        columns: Mapping[str, Any],
+        rows: Any,
+    ) -> Any:
+        # Each condition only sees the rows the previous ones let through
+        for condition in conditions:
+            if not len(rows):
+                break
+            rows = rows[condition(columns, rows)]
+        return rows
+
+    def _check(self, columns: Mapping[str, Any], states: Any) -> int:
+        size = len(states)
+        for field, column in columns.items():
+            if len(column) != size:
+                raise ValueError(
+                    f"Column {field!r} has {len(column)} rows, expected {size}"
+                )
+        return size
+
+    def masks(
+        self,
+        columns: Mapping[str, Any],
+        states: Any,
+        transitions: Optional[Sequence[int]] = None,
+    ) -> Dict[int, Any]:
+        """
+        Boolean mask of the tickets each transition is enabled for.
+
+        A transition is enabled for a ticket in its source state whose
+        field values satisfy all of its conditions.
+
+        Args:
+            columns: Field values, one array per field
+            states: Current state of every ticket
+            transitions: Positions in ``workflow.transitions`` to evaluate;
+                all by default. Each mask holds one byte per ticket.
+
+        Returns:
+            Mask of every requested transition, keyed by its position
+
+        Raises:
+            RoutingError: If a ticket is in an unknown state
+            ValueError: If a column's length differs from ``states``
+        """
+        size = self._check(columns, states)
+        wanted = range(self._transitions) if transitions is None else transitions
+        result = {position: np.zeros(size, dtype=bool) for position in wanted}
+        for state, rows in self._by_state(states):
+            for position, _, conditions in self._groups[state]:
+                if position in result:
+                    result[position][self._passing(conditions, columns, rows)] = True
+        return result
+
+    def next_states(self, columns: Mapping[str, Any], states: Any) -> Any:
+        """
+        Target of the first enabled transition of every ticket.
+
+        Transitions are tried in workflow order, each on the tickets no
+        earlier transition of their state took.
+
+        Args:
+            columns: Field values, one array per field
+            states: Current state of every ticket
+
+        Returns:
+            Integer array of target state ids, indexing :attr:`names`; -1
+            where no transition is enabled
+
+        Raises:
+            RoutingError: If a ticket is in an unknown state
+            ValueError: If a column's length differs from ``states``
+        """
+        size = self._check(columns, states)
+        result = np.full(size, -1, dtype=np.intp)
+        for state, rows in self._by_state(states):
+            for _, target, conditions in self._groups[state]:
+                taken = self._passing(conditions, columns, rows)
+                if len(taken):
+                    result[taken] = target
+                    rows = rows[result[rows] < 0]
+                    if not len(rows):
+                        break
+        return result
+
+    def next_state_names(self, columns: Mapping[str, Any], states: Any) -> Any:
+        """Like :meth:`next_states`, as an object array of names or None."""
+        targets = self.next_states(columns, states)
+        names = np.array(self.names + [None], dtype=object)
+        return names[targets]
@@ -0,0 +1,157 @@
+# aloof_union/core/routing/engine.py
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+from aloof_union.exceptions import RoutingError
+
+from ..interning import value_identity
+from ..models import Condition, Transition, UnifiedWorkflow
+from .operators import Predicate, compile_condition, normalize_operator
+
+
+def _always(ticket: Mapping[str, Any]) -> bool:
+    return True
+
+
+def _all_of(predicates: Tuple[Predicate, ...]) -> Predicate:
+    def predicate(ticket: Mapping[str, Any]) -> bool:
+        for check in predicates:
+            if not check(ticket):
+                return False
+        return True
+
+    return predicate
+
+
+class RoutingEngine:
+    """
+    Decides which transitions a live ticket can take from its current state.
+
+    The conditions of every transition are compiled once, when the engine
+    is built, into one predicate per transition (see
+    :mod:`aloof_union.core.routing.operators`). Conditions of a transition
+    must all hold for it to be enabled; a transition without conditions is
+    always enabled. Equal conditions and condition lists are compiled once
+    and shared between transitions.
+
+    The engine is a snapshot: build a new one after editing the workflow.
+    """
+
+    def __init__(self, workflow: UnifiedWorkflow, state_field: str = "status"):
+        """
+        Args:
+            workflow: The workflow whose transitions route tickets
+            state_field: Ticket field holding the ticket's current state
+
+        Raises:
+            RoutingError: If a condition uses an unknown operator or a
+                value its operator rejects
+        """
+        self.state_field = state_field
+        self._conditions: Dict[Hashable, Predicate] = {}
+        self._lists: Dict[Tuple[Any, ...], Predicate] = {}
+        self._routes: Dict[str, Tuple[Tuple[Transition, Predicate], ...]] = {
+            name: tuple(
+                (transition, self._compile_transition(transition))
+                for transition in transitions
+            )
+            for name, transitions in workflow.index.outgoing.items()
+        }
+
+    def _compile_condition(self, condition: Condition) -> Tuple[Any, Predicate]:
+        operator = normalize_operator(condition.operator)
+        try:
+            key: Any = (condition.field, operator, value_identity(condition.value))
+            hash(key)
+        except TypeError:
+            key = None
+        predicate = self._conditions.get(key) if key is not None else None
+        if predicate is None:
+            predicate = compile_condition(
+                condition.field, condition.operator, condition.value
+            )
+            if key is not None:
+                self._conditions[key] = predicate
+        return key, predicate
+
+    def _compile_transition(self, transition: Transition) -> Predicate:
+        try:
+            compiled = [self._compile_condition(c) for c in transition.conditions]
+        except RoutingError as e:
+            raise RoutingError(
+                f"Transition {transition.from_state} -> {transition.to_state}: {e}"
+            ) from e
+
+        if not compiled:
+            return _always
+        if len(compiled) == 1:
+            return compiled[0][1]
+        keys = tuple(key for key, _ in compiled)
+        if None in keys:
+            return _all_of(tuple(predicate for _, predicate in compiled))
+        predicate = self._lists.get(keys)
+        if predicate is None:
+            predicate = _all_of(tuple(predicate for _, predicate in compiled))
+            self._lists[keys] = predicate
+        return predicate
+
+    def _state(self, ticket: Mapping[str, Any]) -> Any:
+        try:
+            return ticket[self.state_field]
+        except KeyError:
+            raise RoutingError(f"Ticket has no {self.state_field!r} field") from None
+
+    def _table(self, state: Any) -> Tuple[Tuple[Transition, Predicate], ...]:
+        try:
+            return self._routes[state]
+        except (KeyError, TypeError):
+            raise RoutingError(f"Ticket is in unknown state {state!r}") from None
+
+    def enabled(
+        self, ticket: Mapping[str, Any], state: Optional[str] = None
+    ) -> List[Transition]:
+        """
+        Transitions enabled for a ticket, in workflow order.
+
+        Args:
+            ticket: Field values of the ticket
+            state: Current state; read from the ticket's ``state_field`` if
+                omitted
+
+        Raises:
+            RoutingError: If the ticket has no state or an unknown one
+        """
+        if state is None:
+            state = self._state(ticket)
+        return [
+            transition
+            for transition, predicate in self._table(state)
+            if predicate(ticket)
+        ]
+
+    def route(self, tickets: Iterable[Mapping[str, Any]]) -> List[List[Transition]]:
+        """
+        Enabled transitions of many tickets at once.
+
+        Args:
+            tickets: Tickets, each holding its current state in
+                ``state_field``
+
+        Returns:
+            The enabled transitions of each ticket, in ticket order
+
+        Raises:
+            RoutingError: If a ticket has no state or an unknown one
+        """
+        routes = self._routes
+        field = self.state_field
+        result = []
+        for ticket in tickets:
+            try:
+                table = routes[ticket[field]]
+            except (KeyError, TypeError):
+                # Raises the matching RoutingError
+                table = self._table(self._state(ticket))
+            result.append(
+                [transition for transition, predicate in table if predicate(ticket)]
+            )
+        return result
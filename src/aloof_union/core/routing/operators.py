@@ -0,0 +1,228 @@
+# aloof_union/core/routing/operators.py
+"""
+Table of condition operators and the predicates they compile to.
+
+Each operator is a factory taking a condition's ``field`` and ``value`` and
+returning a predicate over a ticket mapping. All lookups a condition
+needs, such as its field name or a set of accepted values, are bound
+when the predicate is built, so evaluating it is a single call. A field
+missing from the ticket reads as None.
+
+Operator names are matched case-insensitively, with underscores read as
+spaces, so ``"IS_NOT_EMPTY"`` and ``"is not empty"`` are the same operator.
+"""
+
+import re
+from typing import Any, Callable, Dict, Mapping
+
+from aloof_union.exceptions import RoutingError
+
+#: Decides whether a ticket satisfies a condition
+Predicate = Callable[[Mapping[str, Any]], bool]
+#: Builds the predicate of a condition from its field and value
+OperatorFactory = Callable[[str, Any], Predicate]
+
+
+def normalize_operator(name: str) -> str:
+    """Canonical spelling of an operator name, e.g. ``"NOT_IN"`` -> ``"not in"``."""
+    return " ".join(name.replace("_", " ").lower().split())
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    try:
+        return len(value) == 0
+    except TypeError:
+        return False
+
+
+def _accepted(value: Any) -> Any:
+    # Set lookups when every accepted value is hashable, a sequence otherwise
+    values = value if isinstance(value, (list, tuple, set, frozenset)) else (value,)
+    try:
+        return frozenset(values)
+    except TypeError:
+        return tuple(values)
+
+
+def _equals(field: str, value: Any) -> Predicate:
+    return lambda ticket: ticket.get(field) == value
+
+
+def _not_equals(field: str, value: Any) -> Predicate:
+    return lambda ticket: ticket.get(field) != value
+
+
+def _in(field: str, value: Any) -> Predicate:
+    accepted = _accepted(value)
+
+    def predicate(ticket: Mapping[str, Any]) -> bool:
+        try:
+            return ticket.get(field) in accepted
+        except TypeError:
+            # Unhashable ticket value against a set of accepted values
+            return False
+
+    return predicate
+
+
+def _not_in(field: str, value: Any) -> Predicate:
+    is_in = _in(field, value)
+    return lambda ticket: not is_in(ticket)
+
+
+def _contains(field: str, value: Any) -> Predicate:
+    def predicate(ticket: Mapping[str, Any]) -> bool:
+        actual = ticket.get(field)
+        try:
+            return actual is not None and value in actual
+        except TypeError:
+            return False
+
+    return predicate
+
+
+def _not_contains(field: str, value: Any) -> Predicate:
+    contains = _contains(field, value)
+    return lambda ticket: not contains(ticket)
+
+
+def _exists(field: str, value: Any) -> Predicate:
+    # "exists" with a false value asks for the field to be absent
+    if value is False:
+        return lambda ticket: ticket.get(field) is None
+    return lambda ticket: ticket.get(field) is not None
+
+
+def _is_empty_op(field: str, value: Any) -> Predicate:
+    return lambda ticket: _is_empty(ticket.get(field))
+
+
+def _is_not_empty(field: str, value: Any) -> Predicate:
+    return lambda ticket: not _is_empty(ticket.get(field))
+
+
+def _ordering(compare: Callable[[Any, Any], bool]) -> OperatorFactory:
+    def factory(field: str, value: Any) -> Predicate:
+        def predicate(ticket: Mapping[str, Any]) -> bool:
+            actual = ticket.get(field)
+            try:
+                return actual is not None and compare(actual, value)
+            except TypeError:
+                return False
+
+        return predicate
+
+    return factory
+
+
+def _matches(field: str, value: Any) -> Predicate:
+    try:
+        search = re.compile(value).search
+    except (re.error, TypeError) as e:
+        raise RoutingError(f"Invalid pattern {value!r} for field {field}: {e}")
+
+    def predicate(ticket: Mapping[str, Any]) -> bool:
+        actual = ticket.get(field)
+        return actual is not None and search(str(actual)) is not None
+
+    return predicate
+
+
+def _starts_with(field: str, value: Any) -> Predicate:
+    def predicate(ticket: Mapping[str, Any]) -> bool:
+        actual = ticket.get(field)
+        return isinstance(actual, str) and actual.startswith(value)
+
+    return predicate
+
+
+def _ends_with(field: str, value: Any) -> Predicate:
+    def predicate(ticket: Mapping[str, Any]) -> bool:
+        actual = ticket.get(field)
+        return isinstance(actual, str) and actual.endswith(value)
+
+    return predicate
+
+
+_greater = _ordering(lambda a, b: a > b)
+_greater_equal = _ordering(lambda a, b: a >= b)
+_less = _ordering(lambda a, b: a < b)
+_less_equal = _ordering(lambda a, b: a <= b)
+
+#: Operator factories by normalized name; extend with :func:`register_operator`
+OPERATORS: Dict[str, OperatorFactory] = {
+    "equals": _equals,
+    "is": _equals,
+    "==": _equals,
+    "=": _equals,
+    "not equals": _not_equals,
+    "is not": _not_equals,
+    "!=": _not_equals,
+    "in": _in,
+    "not in": _not_in,
+    "contains": _contains,
+    "not contains": _not_contains,
+    "does not contain": _not_contains,
+    "exists": _exists,
+    "is empty": _is_empty_op,
+    "is not empty": _is_not_empty,
+    "greater than": _greater,
+    ">": _greater,
+    "greater than or equals": _greater_equal,
+    ">=": _greater_equal,
+    "less than": _less,
+    "<": _less,
+    "less than or equals": _less_equal,
+    "<=": _less_equal,
+    "matches": _matches,
+    "starts with": _starts_with,
+    "ends with": _ends_with,
+}
+
+# The table as shipped, to tell built-in operators from replaced ones
+_BUILTIN_OPERATORS = dict(OPERATORS)
+
+
+def is_builtin_operator(name: str) -> bool:
+    """
+    Whether operator ``name`` still has its built-in meaning, i.e. it has
+    not been replaced through :func:`register_operator`.
+    """
+    key = normalize_operator(name)
+    factory = _BUILTIN_OPERATORS.get(key)
+    return factory is not None and OPERATORS.get(key) is factory
+
+
+def register_operator(
+    name: str, factory: OperatorFactory, replace: bool = False
+) -> None:
+    """
+    Add an operator to the table.
+
+    Args:
+        name: Operator name as it appears in conditions
+        factory: Builds a predicate from a condition's field and value
+        replace: Allow replacing an existing operator
+
+    Raises:
+        ValueError: If the operator exists and ``replace`` is False
+    """
+    key = normalize_operator(name)
+    if key in OPERATORS and not replace:
+        raise ValueError(f"Operator {name!r} is already registered")
+    OPERATORS[key] = factory
+
+
+def compile_condition(field: str, operator: str, value: Any) -> Predicate:
+    """
+    Build the predicate of a single condition.
+
+    Raises:
+        RoutingError: If the operator is unknown or rejects the value
+    """
+    factory = OPERATORS.get(normalize_operator(operator))
+    if factory is None:
+        raise RoutingError(f"Unknown condition operator {operator!r}")
+    return factory(field, value)
@@ -1,6 +1,39 @@
 # aloof_union/transpilers/__init__.py
+from typing import TYPE_CHECKING, Any, List
+
 from .base import BaseTranspiler
-from .validation import WorkflowValidator
+from .validation import Severity, ValidationReport, Violation, WorkflowValidator
 from .workflow import WorkflowTranspiler
 
-__all__ = ["BaseTranspiler", "WorkflowTranspiler", "WorkflowValidator"]
+if TYPE_CHECKING:
+    from .asynchronous import AsyncWorkflowTranspiler, TranspileResult
+
+# The asyncio front end pulls in asyncio and concurrent.futures, so it is only
+# imported when first used
+_LAZY = {"AsyncWorkflowTranspiler", "TranspileResult"}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        from . import asynchronous
+
+        value = getattr(asynchronous, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY])
+
+
+__all__ = [
+    "BaseTranspiler",
+    "WorkflowTranspiler",
+    "AsyncWorkflowTranspiler",
+    "TranspileResult",
+    "WorkflowValidator",
+    "ValidationReport",
+    "Violation",
+    "Severity",
+]
@@ -0,0 +1,338 @@
+# aloof_union/transpilers/asynchronous.py
+import asyncio
+import os
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+from aloof_union.core.models import AutomationType
+from aloof_union.exceptions import TranspilerError
+
+from ..cache import TranspileCache
+from .validation import WorkflowValidator
+from .workflow import Transform, WorkflowTranspiler
+
+EXECUTOR_KINDS = ("thread", "process")
+
+# One transpiler per worker process, created by the pool initializer
+_worker_transpiler: Optional[WorkflowTranspiler] = None
+
+
+def _init_worker(options: Dict[str, Any]) -> None:
+    global _worker_transpiler
+    _worker_transpiler = WorkflowTranspiler(**options)
+
+
+def _transpile_job(
+    content: Union[str, dict],
+    from_type: AutomationType,
+    to_type: AutomationType,
+    validate: bool,
+) -> Union[str, dict]:
+    return _worker_transpiler.transpile(content, from_type, to_type, validate)
+
+
+@dataclass
+class TranspileResult:
+    """Outcome of one item of :meth:`AsyncWorkflowTranspiler.transpile_many`."""
+
+    #: Position of the item in the input
+    index: int
+    result: Optional[Union[str, dict]] = None
+    error: Optional[BaseException] = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class AsyncWorkflowTranspiler:
+    """
+    Asyncio front end of :class:`WorkflowTranspiler`.
+
+    Conversions run in a bounded executor so a large workflow never blocks
+    the event loop. With a thread executor every conversion shares one
+    transpiler; with a process executor each worker builds its own, so
+    transforms and validators must then be picklable.
+
+    A timed-out conversion is abandoned rather than interrupted; its
+    worker runs on, and still counts against ``max_concurrency``, until the
+    conversion finishes.
+    """
+
+    def __init__(
+        self,
+        validation: str = "structural",
+        transforms: Sequence[Transform] = (),
+        validator: Optional[WorkflowValidator] = None,
+        cache: Optional[TranspileCache] = None,
+        executor: Union[str, Executor] = "thread",
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            validation: Validation level, see :class:`WorkflowTranspiler`
+            transforms: Stages applied between parse and validate
+            validator: Validator to use instead of one built for ``validation``
+            cache: Optional on-disk cache of results
+            executor: ``"thread"``, ``"process"`` or an executor to run
+                conversions in; executors passed in are not shut down by
+                :meth:`aclose`
+            max_workers: Size of the executor created for ``"thread"`` or
+                ``"process"``; defaults to the executor's own default
+            max_concurrency: Most conversions in flight at once; defaults
+                to ``max_workers``, or unlimited if that is not set either
+            timeout: Default per-item timeout in seconds
+        """
+        if isinstance(executor, str) and executor not in EXECUTOR_KINDS:
+            raise ValueError(
+                f"Unknown executor {executor!r}; expected one of "
+                f"{', '.join(EXECUTOR_KINDS)} or an Executor"
+            )
+        # Also used to build the transpiler of each worker process
+        self._options: Dict[str, Any] = {
+            "validation": validation,
+            "transforms": transforms,
+            "validator": validator,
+            "cache": cache,
+        }
+        self.transpiler = WorkflowTranspiler(**self._options)
+        self.max_concurrency = max_concurrency or max_workers
+        self.timeout = timeout
+
+        self._kind = executor if isinstance(executor, str) else None
+        self._max_workers = max_workers
+        self._executor = None if isinstance(executor, str) else executor
+        self._owns_executor = isinstance(executor, str)
+        # One per event loop, since a semaphore binds to the loop it first
+        # waits on; created on first use
+        self._semaphores: MutableMapping[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._kind == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    initializer=_init_worker,
+                    initargs=(self._options,),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="aloof-union",
+                )
+        return self._executor
+
+    def _window(self) -> int:
+        # Items transpile_many pulls ahead: max_concurrency, else one per
+        # worker of the executor, using the executors' own default sizes
+        if self.max_concurrency:
+            return self.max_concurrency
+        workers = getattr(self._executor, "_max_workers", None)
+        if workers:
+            return workers
+        if self._kind == "process":
+            return os.cpu_count() or 1
+        return min(32, (os.cpu_count() or 1) + 4)
+
+    def _get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        if not self.max_concurrency:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    def _submit(
+        self,
+        content: Union[str, dict],
+        from_type: AutomationType,
+        to_type: AutomationType,
+        validate: bool,
+    ) -> "asyncio.Future[Union[str, dict]]":
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        if self._kind == "process":
+            return loop.run_in_executor(
+                executor, _transpile_job, content, from_type, to_type, validate
+            )
+        return loop.run_in_executor(
+            executor, self.transpiler.transpile, content, from_type, to_type, validate
+        )
+
+    async def transpile(
+        self,
+        content: Union[str, dict],
+        from_type: AutomationType,
+        to_type: AutomationType,
+        validate: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Union[str, dict]:
+        """
+        Transpile from one workflow format to another in the executor.
+
+        Args:
+            content: The workflow content to transpile
+            from_type: The source format type
+            to_type: The target format type
+            validate: Whether to validate during transpilation
+            timeout: Seconds to wait for the result; defaults to the
+                transpiler's ``timeout``
+
+        Returns:
+            The transpiled workflow content
+
+        Raises:
+            TranspilerError: If transpilation fails or times out
+            ParserError: If the content cannot be parsed
+            ValidationError: If workflow validation fails
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        semaphore = self._get_semaphore()
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            future = self._submit(content, from_type, to_type, validate)
+        except BaseException:
+            if semaphore is not None:
+                semaphore.release()
+            raise
+        if semaphore is not None:
+            # Hold the slot until the conversion itself ends: a timed-out
+            # conversion keeps its worker busy
+            future.add_done_callback(lambda _: semaphore.release())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            # Nobody will read the abandoned result; don't log its error
+            future.add_done_callback(_consume)
+            raise TranspilerError(f"Transpilation timed out after {timeout}s")
+
+    async def _outcome(
+        self,
+        index: int,
+        content: Union[str, dict],
+        from_type: AutomationType,
+        to_type: AutomationType,
+        validate: bool,
+        timeout: Optional[float],
+    ) -> TranspileResult:
+        start = time.perf_counter()
+        try:
+            result = await self.transpile(
+                content, from_type, to_type, validate, timeout
+            )
+        except Exception as e:
+            return TranspileResult(index, error=e, seconds=time.perf_counter() - start)
+        return TranspileResult(index, result, seconds=time.perf_counter() - start)
+
+    async def transpile_many(
+        self,
+        contents: Union[Iterable[Union[str, dict]], AsyncIterable[Union[str, dict]]],
+        from_type: AutomationType,
+        to_type: AutomationType,
+        validate: bool = True,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[TranspileResult]:
+        """
+        Transpile many workflows concurrently, yielding results as they finish.
+
+        Inputs are pulled lazily, so an async iterator fetching exports from
+        storage overlaps its I/O with the conversions already running. At
+        most ``max_concurrency`` items are pulled ahead of their results, or
+        one per executor worker when it is not set.
+        Failures are reported in the results and never stop the run.
+
+        Args:
+            contents: Workflow contents, as an iterable or async iterable
+            from_type: The source format type
+            to_type: The target format type
+            validate: Whether to validate during transpilation
+            timeout: Per-item timeout in seconds; defaults to the
+                transpiler's ``timeout``
+
+        Yields:
+            One result per item, in completion order; ``index`` gives the
+            item's position in ``contents``
+        """
+        if isinstance(contents, AsyncIterable):
+            source = contents.__aiter__()
+        else:
+            source = _aiter(contents)
+
+        window = self._window()
+        pending: Set["asyncio.Task[TranspileResult]"] = set()
+        index = 0
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < window:
+                    try:
+                        content = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending.add(
+                        asyncio.ensure_future(
+                            self._outcome(
+                                index, content, from_type, to_type, validate, timeout
+                            )
+                        )
+                    )
+                    index += 1
+
+                if not pending:
+                    return
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def aclose(self) -> None:
+        """Shut down the executor this transpiler created, if any."""
+        executor, self._executor = self._executor, None
+        if executor is not None and self._owns_executor:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, executor.shutdown)
+
+    async def __aenter__(self) -> "AsyncWorkflowTranspiler":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+
+def _consume(future: "asyncio.Future[Any]") -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+async def _aiter(items: Iterable[Any]) -> AsyncIterator[Any]:
+    for item in items:
+        yield item
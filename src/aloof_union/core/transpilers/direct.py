@@ -0,0 +1,134 @@
+# aloof_union/transpilers/direct.py
+"""
+Direct Fresh Service <-> JSM converters.
+
+These map one format's dict straight onto the other's without building a
+:class:`UnifiedWorkflow`. Their output is identical to parsing into the
+unified model and serializing it again; any input they can't handle raises,
+and callers fall back to the full pipeline to get the proper error.
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from aloof_union.core.models import AutomationType
+
+
+def _is_structurally_valid(
+    initial_flags: List[Any], transitions: List[Tuple[Any, Any]], names: Any
+) -> bool:
+    # Mirrors the "states" and "transitions" checks of WorkflowValidator
+    if not names or not any(initial_flags):
+        return False
+    return all(f in names and t in names for f, t in transitions)
+
+
+def freshservice_is_valid(content: dict) -> bool:
+    """Whether a Fresh Service dict passes the structural validation checks."""
+    states = content["states"]
+    return _is_structurally_valid(
+        [data.get("is_initial", False) for data in states.values()],
+        [(t["from_state"], t["to_state"]) for t in content["transitions"]],
+        states,
+    )
+
+
+def jsm_is_valid(content: dict) -> bool:
+    """Whether a JSM dict passes the structural validation checks."""
+    statuses = {status["name"]: status for status in content.get("statuses", [])}
+    return _is_structurally_valid(
+        [status.get("initial", False) for status in statuses.values()],
+        [(r["fromStatus"], r["toStatus"]) for r in content.get("rules", [])],
+        statuses,
+    )
+
+
+def freshservice_to_jsm(content: dict) -> dict:
+    """Convert a Fresh Service dict straight to a JSM dict."""
+    states = content["states"]
+    statuses = [
+        {
+            "name": name,
+            "description": data.get("description"),
+            "initial": data.get("is_initial", False),
+            "statusCategory": data.get("statusCategory", "TO_DO"),
+            "id": data.get("jsmId"),
+            "statusType": data.get("jsmType"),
+        }
+        for name, data in states.items()
+    ]
+    rules = [
+        {
+            "fromStatus": trans["from_state"],
+            "toStatus": trans["to_state"],
+            "conditions": [
+                {
+                    "field": {"name": c.get("field", "")},
+                    "operator": c.get("operator", ""),
+                    "value": c.get("value"),
+                }
+                for c in trans.get("conditions", [])
+            ],
+            "postFunctions": [
+                {"type": a.get("type", ""), "configuration": a.get("parameters", {})}
+                for a in trans.get("actions", [])
+            ],
+        }
+        for trans in content["transitions"]
+    ]
+    return {"statuses": statuses, "rules": rules}
+
+
+def jsm_to_freshservice(content: dict) -> dict:
+    """Convert a JSM dict straight to a Fresh Service dict."""
+    # Later statuses with the same name replace earlier ones, as in the parser
+    statuses: Dict[str, dict] = {}
+    for status in content.get("statuses", []):
+        statuses[status["name"]] = status
+
+    states = {
+        name: {
+            "description": status.get("description"),
+            "is_initial": status.get("initial", False),
+            "is_terminal": status.get("statusCategory") == "DONE",
+            "statusCategory": status.get("statusCategory", "TO_DO"),
+            "jsmId": status.get("id"),
+            "jsmType": status.get("statusType"),
+        }
+        for name, status in statuses.items()
+    }
+    transitions = [
+        {
+            "from_state": rule["fromStatus"],
+            "to_state": rule["toStatus"],
+            "conditions": [
+                {
+                    "field": c.get("field", {}).get("name", ""),
+                    "operator": c.get("operator", ""),
+                    "value": c.get("value"),
+                }
+                for c in rule.get("conditions", [])
+            ],
+            "actions": [
+                {"type": p.get("type", ""), "parameters": p.get("configuration", {})}
+                for p in rule.get("postFunctions", [])
+            ],
+        }
+        for rule in content.get("rules", [])
+    ]
+    return {"states": states, "transitions": transitions}
+
+
+class DirectConverter(NamedTuple):
+    convert: Callable[[dict], dict]
+    #: Structural validation of the raw input
+    is_valid: Callable[[dict], bool]
+
+
+DIRECT_CONVERTERS: Dict[Tuple[AutomationType, AutomationType], DirectConverter] = {
+    (AutomationType.FRESHSERVICE, AutomationType.JSM): DirectConverter(
+        freshservice_to_jsm, freshservice_is_valid
+    ),
+    (AutomationType.JSM, AutomationType.FRESHSERVICE): DirectConverter(
+        jsm_to_freshservice, jsm_is_valid
+    ),
+}
@@ -1,111 +1,320 @@
 # aloof_union/transpilers/validation.py
-from typing import Set
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from aloof_union.core.analysis.cycles import condense
+from aloof_union.core.analysis.reachability import reachable_ids
 from aloof_union.core.models import UnifiedWorkflow
 from aloof_union.exceptions import ValidationError
 
 
+class Severity(Enum):
+    ERROR = "error"
+    WARNING = "warning"
+
+
+@dataclass(frozen=True)
+class Violation:
+    """A single problem found in a workflow."""
+
+    rule: str
+    message: str
+    states: Tuple[str, ...] = ()
+    severity: Severity = Severity.ERROR
+
+
+@dataclass
+class ValidationReport:
+    """Every violation found by one validation run, in check order."""
+
+    violations: List[Violation] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[Violation]:
+        return [v for v in self.violations if v.severity is Severity.ERROR]
+
+    @property
+    def warnings(self) -> List[Violation]:
+        return [v for v in self.violations if v.severity is Severity.WARNING]
+
+    @property
+    def ok(self) -> bool:
+        """True when the report holds no errors (warnings are allowed)."""
+        return not self.errors
+
+    def raise_for_errors(self, first_only: bool = False) -> None:
+        """
+        Raise if the report holds any errors.
+
+        Args:
+            first_only: Use only the first error as the exception message
+
+        Raises:
+            ValidationError: Describing the errors, with this report attached
+        """
+        errors = self.errors
+        if errors:
+            messages = [e.message for e in (errors[:1] if first_only else errors)]
+            raise ValidationError("; ".join(messages), report=self)
+
+
+# Check groups in the order their violations are reported
+ALL_CHECKS: Tuple[str, ...] = (
+    "states",
+    "initial",
+    "transitions",
+    "reachability",
+    "cycles",
+    "terminal",
+    "conditions",
+)
+# Cheap checks that don't need a graph traversal. Like the original
+# transpiler they accept several initial states; "initial" rejects them.
+STRUCTURAL_CHECKS: Tuple[str, ...] = ("states", "transitions")
+
+
 class WorkflowValidator:
     """Handles workflow validation rules and checks."""
 
+    def __init__(self, checks: Optional[Iterable[str]] = None):
+        """
+        Args:
+            checks: Check groups to run, from :data:`ALL_CHECKS`; defaults to
+                all of them
+        """
+        if checks is None:
+            checks = ALL_CHECKS
+        unknown = set(checks) - set(ALL_CHECKS)
+        if unknown:
+            raise ValueError(f"Unknown validation checks: {', '.join(sorted(unknown))}")
+        self.checks = tuple(c for c in ALL_CHECKS if c in set(checks))
+
+    @staticmethod
+    def _collect(workflow: UnifiedWorkflow, checks: Iterable[str]) -> ValidationReport:
+        """Run the requested check groups in one pass over the workflow."""
+        checks = set(checks)
+        found: Dict[str, List[Violation]] = {c: [] for c in ALL_CHECKS if c in checks}
+        states = workflow.states
+        index = workflow.index
+
+        if "states" in checks:
+            if not states:
+                found["states"].append(
+                    Violation("states.empty", "Workflow must have at least one state")
+                )
+            if not index.initial:
+                found["states"].append(
+                    Violation(
+                        "states.no-initial", "Workflow must have an initial state"
+                    )
+                )
+
+        if "initial" in checks and len(index.initial) > 1:
+            found["initial"].append(
+                Violation(
+                    "initial.multiple",
+                    "Workflow cannot have multiple initial states",
+                    index.initial,
+                )
+            )
+
+        # Fused pass over transitions for every per-transition check
+        check_refs = "transitions" in checks
+        check_terminal = "terminal" in checks
+        check_conditions = "conditions" in checks
+        if check_refs or check_terminal or check_conditions:
+            terminal = set(index.terminal)
+            terminal_reported: Set[str] = set()
+            for trans in workflow.transitions:
+                from_state, to_state = trans.from_state, trans.to_state
+
+                if check_refs:
+                    if from_state not in states:
+                        found["transitions"].append(
+                            Violation(
+                                "transitions.unknown-from",
+                                f"Invalid from_state in transition: {from_state}",
+                                (from_state,),
+                            )
+                        )
+                    if to_state not in states:
+                        found["transitions"].append(
+                            Violation(
+                                "transitions.unknown-to",
+                                f"Invalid to_state in transition: {to_state}",
+                                (to_state,),
+                            )
+                        )
+
+                if (
+                    check_terminal
+                    and from_state in terminal
+                    and from_state not in terminal_reported
+                ):
+                    terminal_reported.add(from_state)
+                    found["terminal"].append(
+                        Violation(
+                            "terminal.outgoing",
+                            f"Terminal state {from_state} cannot have "
+                            "outgoing transitions",
+                            (from_state,),
+                        )
+                    )
+
+                if check_conditions and len(trans.conditions) > 1:
+                    field_operators = set()
+                    for condition in trans.conditions:
+                        field_op = (condition.field, condition.operator)
+                        if field_op in field_operators:
+                            found["conditions"].append(
+                                Violation(
+                                    "conditions.conflict",
+                                    f"Conflicting conditions for {condition.field} "
+                                    f"in transition {from_state} -> {to_state}",
+                                    (from_state, to_state),
+                                )
+                            )
+                        field_operators.add(field_op)
+
+        # One condensation serves both graph groups; with it, cyclic states
+        # that never terminate are reported once, as cycles, not as traps
+        condensation = None
+        if "cycles" in checks and index.terminal:
+            condensation = condense(workflow)
+
+        if "reachability" in checks and index.initial:
+            # Linear sweeps; Reachability's full closure would cost O(V²)
+            adjacency = index.adjacency
+            ids = index.ids
+            reachable = reachable_ids(adjacency, (ids[s] for s in index.initial))
+
+            unreachable = tuple(
+                name for name, seen in zip(index.names, reachable) if not seen
+            )
+            if unreachable:
+                found["reachability"].append(
+                    Violation(
+                        "reachability.unreachable",
+                        f"Following states are unreachable: {', '.join(unreachable)}",
+                        unreachable,
+                    )
+                )
+
+            terminal_ids = [ids[s] for s in index.terminal]
+            if condensation is None:
+                can_terminate = reachable_ids(index.reverse_adjacency, terminal_ids)
+                in_cycle = [False] * len(can_terminate)
+            else:
+                component_of = condensation.component_of
+                can_terminate = [
+                    condensation.terminates[component_of[name]] for name in index.names
+                ]
+                in_cycle = [
+                    condensation.cyclic[component_of[name]] for name in index.names
+                ]
+            dead_ends = []
+            traps = []
+            for name, seen, successors, finishes, cyclic in zip(
+                index.names, reachable, adjacency, can_terminate, in_cycle
+            ):
+                if not seen or finishes:
+                    continue
+                if not successors:
+                    if not states[name].is_terminal:
+                        dead_ends.append(name)
+                elif terminal_ids and not cyclic:
+                    traps.append(name)
+            if dead_ends:
+                found["reachability"].append(
+                    Violation(
+                        "reachability.dead-end",
+                        "Following non-terminal states have no outgoing "
+                        f"transitions: {', '.join(dead_ends)}",
+                        tuple(dead_ends),
+                        Severity.WARNING,
+                    )
+                )
+            if traps:
+                found["reachability"].append(
+                    Violation(
+                        "reachability.trap",
+                        "Following states can never reach a terminal state: "
+                        f"{', '.join(traps)}",
+                        tuple(traps),
+                        Severity.WARNING,
+                    )
+                )
+
+        if condensation is not None:
+            for cycle in condensation.non_terminating_cycles():
+                found["cycles"].append(
+                    Violation(
+                        "cycles.non-terminating",
+                        f"Cycle through {', '.join(cycle)} can never reach a "
+                        "terminal state",
+                        cycle,
+                        Severity.WARNING,
+                    )
+                )
+
+        return ValidationReport([v for group in found.values() for v in group])
+
+    @classmethod
+    def _raise_first(cls, workflow: UnifiedWorkflow, *checks: str) -> None:
+        cls._collect(workflow, checks).raise_for_errors(first_only=True)
+
     @staticmethod
     def validate_states(workflow: UnifiedWorkflow) -> None:
         """Validate workflow states."""
-        if not workflow.states:
-            raise ValidationError("Workflow must have at least one state")
-
-        # Check for initial state
-        initial_states = [s for s in workflow.states.values() if s.is_initial]
-        if not initial_states:
-            raise ValidationError("Workflow must have an initial state")
-        if len(initial_states) > 1:
-            raise ValidationError("Workflow cannot have multiple initial states")
+        WorkflowValidator._raise_first(workflow, "states", "initial")
 
     @staticmethod
     def validate_transitions(workflow: UnifiedWorkflow) -> None:
         """Validate workflow transitions."""
-        state_names = set(workflow.states.keys())
-
-        for transition in workflow.transitions:
-            # Check for valid state references
-            if transition.from_state not in state_names:
-                raise ValidationError(
-                    f"Invalid from_state in transition: {transition.from_state}"
-                )
-            if transition.to_state not in state_names:
-                raise ValidationError(
-                    f"Invalid to_state in transition: {transition.to_state}"
-                )
+        WorkflowValidator._raise_first(workflow, "transitions")
 
     @staticmethod
     def validate_reachability(workflow: UnifiedWorkflow) -> None:
-        """Validate that all states are reachable."""
-        initial_states = [s.name for s in workflow.states.values() if s.is_initial]
-        if not initial_states:
-            return  # Already checked in validate_states
-
-        # Build adjacency list
-        adjacency: Dict[str, Set[str]] = {state: set() for state in workflow.states}
-        for trans in workflow.transitions:
-            adjacency[trans.from_state].add(trans.to_state)
-
-        # Perform DFS from initial state
-        visited = set()
-
-        def dfs(state: str) -> None:
-            visited.add(state)
-            for next_state in adjacency[state]:
-                if next_state not in visited:
-                    dfs(next_state)
-
-        dfs(initial_states[0])
-
-        # Check for unreachable states
-        unreachable = set(workflow.states.keys()) - visited
-        if unreachable:
-            raise ValidationError(
-                f"Following states are unreachable: {', '.join(unreachable)}"
-            )
+        """Validate that every state is reachable from an initial state."""
+        WorkflowValidator._raise_first(workflow, "reachability")
 
     @staticmethod
     def validate_terminal_states(workflow: UnifiedWorkflow) -> None:
         """Validate terminal states configuration."""
-        terminal_states = set(s.name for s in workflow.states.values() if s.is_terminal)
-
-        # Check that terminal states have no outgoing transitions
-        for trans in workflow.transitions:
-            if trans.from_state in terminal_states:
-                raise ValidationError(
-                    f"Terminal state {trans.from_state} cannot have outgoing transitions"
-                )
+        WorkflowValidator._raise_first(workflow, "terminal")
 
     @staticmethod
     def validate_conditions(workflow: UnifiedWorkflow) -> None:
         """Validate transition conditions."""
-        for trans in workflow.transitions:
-            # Check for conflicting conditions
-            field_operators = set()
-            for condition in trans.conditions:
-                field_op = (condition.field, condition.operator)
-                if field_op in field_operators:
-                    raise ValidationError(
-                        f"Conflicting conditions for {condition.field} "
-                        f"in transition {trans.from_state} -> {trans.to_state}"
-                    )
-                field_operators.add(field_op)
+        WorkflowValidator._raise_first(workflow, "conditions")
+
+    def check(self, workflow: UnifiedWorkflow) -> ValidationReport:
+        """
+        Run every configured check and report all violations at once.
+
+        Args:
+            workflow: The workflow to validate
+
+        Returns:
+            A report listing every violation; it never raises for an
+            invalid workflow
+        """
+        return self._collect(workflow, self.checks)
 
-    def validate_workflow(self, workflow: UnifiedWorkflow) -> None:
+    def validate_workflow(
+        self, workflow: UnifiedWorkflow, fail_fast: bool = True
+    ) -> None:
         """
         Run all validation checks on a workflow.
 
         Args:
             workflow: The workflow to validate
+            fail_fast: Raise with the first error only, as earlier versions
+                did. When False the error lists every problem found.
 
         Raises:
-            ValidationError: If any validation check fails
+            ValidationError: If any validation check fails; its ``report``
+                attribute holds the full :class:`ValidationReport`
         """
-        self.validate_states(workflow)
-        self.validate_transitions(workflow)
-        self.validate_reachability(workflow)
-        self.validate_terminal_states(workflow)
-        self.validate_conditions(workflow)
+        self.check(workflow).raise_for_errors(first_only=fail_fast)
@@ -1,26 +1,128 @@
 # aloof_union/transpilers/workflow.py
-from typing import Dict, Union
+import json
+from typing import IO, TYPE_CHECKING, Callable, Optional, Sequence, Union
 
-from aloof_union.core.models import AutomationType, UnifiedWorkflow
-from aloof_union.exceptions import TranspilerError
+from aloof_union.core.models import UnifiedWorkflow
+from aloof_union.exceptions import ParserError, TranspilerError, ValidationError
 
-from ..parsers import FreshServiceParser, JSMParser, MermaidParser, WorkflowParser
+from ..instrumentation import (
+    CountingReader,
+    CountingWriter,
+    TranspileObserver,
+    WorkflowCounts,
+    content_size,
+    stage,
+)
+from ..parsers import WorkflowParser, get_parser
+from ..registry import FormatType, resolve_format
 from .base import BaseTranspiler
-from .validation import WorkflowValidator
+from .direct import DIRECT_CONVERTERS, DirectConverter
+from .validation import ALL_CHECKS, STRUCTURAL_CHECKS, WorkflowValidator
+
+if TYPE_CHECKING:
+    from ..cache import TranspileCache
+
+#: A transform stage; it may return a new workflow or None after editing in place
+Transform = Callable[[UnifiedWorkflow], Optional[UnifiedWorkflow]]
+
+# Check groups run for each validation level
+VALIDATION_LEVELS = {
+    "full": ALL_CHECKS,
+    "structural": STRUCTURAL_CHECKS,
+    "none": (),
+}
 
 
 class WorkflowTranspiler(BaseTranspiler):
     """
     Main transpiler class for converting between workflow formats.
+
+    A conversion runs four explicit stages: :meth:`parse`, :meth:`transform`,
+    :meth:`validate` and :meth:`serialize`. Each stage can also be called on
+    its own. Parsers are created on first use and shared by every
+    transpiler; stages that have nothing to do are skipped entirely.
+
+    Fresh Service <-> JSM conversions of dict content, and of Fresh Service
+    files, skip the unified model altogether when no transforms are
+    configured and at most structural validation is needed; see
+    :mod:`.direct`. With a :class:`TranspileCache`
+    unchanged inputs are served from disk without running any stage.
+
+    An optional :class:`TranspileObserver` is told the duration of every
+    stage, the size of each parsed workflow and the input and output byte
+    sizes of each conversion.
     """
 
-    def __init__(self):
-        self._validator = WorkflowValidator()
-        self._parsers: Dict[AutomationType, WorkflowParser] = {
-            AutomationType.FRESHSERVICE: FreshServiceParser(),
-            AutomationType.JSM: JSMParser(),
-            AutomationType.MERMAID: MermaidParser(),
-        }
+    def __init__(
+        self,
+        validation: str = "structural",
+        transforms: Sequence[Transform] = (),
+        validator: Optional[WorkflowValidator] = None,
+        cache: Optional["TranspileCache"] = None,
+        observer: Optional[TranspileObserver] = None,
+    ):
+        """
+        Args:
+            validation: Validation level: ``"structural"``, the default,
+                runs only the cheap state and transition checks, ``"full"``
+                runs every check and ``"none"`` skips validation
+            transforms: Stages applied in order between parse and validate
+            validator: Validator to use instead of one built for ``validation``
+            cache: Optional on-disk cache of results; it is bypassed when
+                transforms are configured, since their effect can't be hashed
+            observer: Optional receiver of instrumentation events
+        """
+        if validation not in VALIDATION_LEVELS:
+            raise ValueError(
+                f"Unknown validation level {validation!r}; expected one of "
+                f"{', '.join(VALIDATION_LEVELS)}"
+            )
+        self.validation = validation
+        self.transforms = tuple(transforms)
+        self._validator = validator
+        self._custom_validator = validator is not None
+        self.cache = cache
+        self.observer = observer
+
+    @property
+    def validator(self) -> Optional[WorkflowValidator]:
+        """The validator for this transpiler, or None if validation is off."""
+        if self._validator is None and VALIDATION_LEVELS[self.validation]:
+            self._validator = WorkflowValidator(VALIDATION_LEVELS[self.validation])
+        return self._validator
+
+    @staticmethod
+    def _parser(automation_type: FormatType) -> WorkflowParser:
+        try:
+            return get_parser(automation_type)
+        except (KeyError, TypeError):
+            raise TranspilerError(f"Unsupported format type: {automation_type!r}")
+
+    @staticmethod
+    def _format(automation_type: FormatType) -> FormatType:
+        # Canonical form, so aliases share direct converters and cache entries
+        try:
+            return resolve_format(automation_type)
+        except (KeyError, TypeError):
+            raise TranspilerError(f"Unsupported format type: {automation_type!r}")
+
+    def parse(
+        self, content: Union[str, dict], from_type: FormatType
+    ) -> UnifiedWorkflow:
+        """Parse stage: read content into the unified model."""
+        return self._parser(from_type).parse(content)
+
+    def parse_stream(self, fp: IO, from_type: FormatType) -> UnifiedWorkflow:
+        """Parse stage reading from a file object."""
+        return self._parser(from_type).parse_stream(fp)
+
+    def transform(self, workflow: UnifiedWorkflow) -> UnifiedWorkflow:
+        """Transform stage: apply every configured transform in order."""
+        for transform in self.transforms:
+            result = transform(workflow)
+            if result is not None:
+                workflow = result
+        return workflow
 
     def validate(self, workflow: UnifiedWorkflow) -> None:
         """
@@ -32,13 +134,81 @@ class WorkflowTranspiler(BaseTranspiler):
         Raises:
             ValidationError: If validation fails
         """
-        self._validator.validate_workflow(workflow)
+        validator = self.validator
+        if validator is not None:
+            validator.validate_workflow(workflow)
+
+    # Kept for callers of the former aloof_union.WorkflowTranspiler
+    validate_workflow = validate
+
+    def serialize(
+        self, workflow: UnifiedWorkflow, to_type: FormatType
+    ) -> Union[str, dict]:
+        """Serialize stage: render the unified model in the target format."""
+        return self._parser(to_type).serialize(workflow)
+
+    def serialize_to(
+        self, workflow: UnifiedWorkflow, to_type: FormatType, fp: IO
+    ) -> None:
+        """Serialize stage writing incrementally to a file object."""
+        self._parser(to_type).serialize_to(workflow, fp)
+
+    def _direct_converter(
+        self, from_type: FormatType, to_type: FormatType, validate: bool
+    ) -> Optional[DirectConverter]:
+        # A custom validator or the graph checks need the unified model
+        if self.transforms or (
+            validate and (self._custom_validator or self.validation == "full")
+        ):
+            return None
+        return DIRECT_CONVERTERS.get((from_type, to_type))
+
+    def _cache_checks(self, validate: bool) -> Optional[Sequence[str]]:
+        # Validation checks identifying a cached result, or None to bypass the cache
+        if self.cache is None or self.transforms:
+            return None
+        validator = self.validator if validate else None
+        return getattr(validator, "checks", ()) if validator is not None else ()
+
+    def _run(
+        self,
+        parse: Callable[[], UnifiedWorkflow],
+        to_type: FormatType,
+        validate: bool,
+        output: Optional[IO] = None,
+    ) -> Union[str, dict, None]:
+        observer = self.observer
+        try:
+            # Resolve the target first so an unknown format fails before parsing
+            self._parser(to_type)
+
+            with stage(observer, "parse"):
+                unified = parse()
+            if observer is not None:
+                observer.workflow_parsed(WorkflowCounts.of(unified))
+            if self.transforms:
+                with stage(observer, "transform"):
+                    unified = self.transform(unified)
+            if validate:
+                with stage(observer, "validate"):
+                    self.validate(unified)
+
+            with stage(observer, "serialize"):
+                if output is not None:
+                    self.serialize_to(unified, to_type, output)
+                    return None
+                return self.serialize(unified, to_type)
+
+        except (TranspilerError, ValidationError, ParserError):
+            raise
+        except Exception as e:
+            raise TranspilerError(f"Error during transpilation: {e}")
 
     def transpile(
         self,
         content: Union[str, dict],
-        from_type: AutomationType,
-        to_type: AutomationType,
+        from_type: FormatType,
+        to_type: FormatType,
         validate: bool = True,
     ) -> Union[str, dict]:
         """
@@ -46,8 +216,8 @@ class WorkflowTranspiler(BaseTranspiler):
 
         Args:
             content: The workflow content to transpile
-            from_type: The source format type
-            to_type: The target format type
+            from_type: The source format: a type, or a registered name or alias
+            to_type: The target format: a type, or a registered name or alias
             validate: Whether to validate during transpilation
 
         Returns:
@@ -55,24 +225,171 @@ class WorkflowTranspiler(BaseTranspiler):
 
         Raises:
             TranspilerError: If transpilation fails
+            ParserError: If the content cannot be parsed
             ValidationError: If workflow validation fails
         """
-        try:
-            # Get appropriate parsers
-            source_parser = self._parsers[from_type]
-            target_parser = self._parsers[to_type]
+        from_type, to_type = self._format(from_type), self._format(to_type)
+        observer = self.observer
+        result = None
+        key = None
+        checks = self._cache_checks(validate)
+        if checks is not None:
+            with stage(observer, "cache"):
+                key = self.cache.key(content, from_type, to_type, checks)
+                if key is not None:
+                    result = self.cache.get(key)
 
-            # Parse to unified format
-            unified = source_parser.parse(content)
+        if result is None:
+            result = self._transpile(content, from_type, to_type, validate)
+            if key is not None:
+                self.cache.put(key, result)
 
-            # Validate if requested
-            if validate:
-                self.validate(unified)
+        if observer is not None:
+            observer.transpile_finished(content_size(content), content_size(result))
+        return result
 
-            # Convert to target format
-            return target_parser.serialize(unified)
+    def _transpile(
+        self,
+        content: Union[str, dict],
+        from_type: FormatType,
+        to_type: FormatType,
+        validate: bool,
+    ) -> Union[str, dict]:
+        direct = self._direct_converter(from_type, to_type, validate)
+        if direct is not None and isinstance(content, dict):
+            observer = self.observer
+            try:
+                if validate and self.validator:
+                    with stage(observer, "validate"):
+                        valid = direct.is_valid(content)
+                else:
+                    valid = True
+                if valid:
+                    with stage(observer, "direct"):
+                        return direct.convert(content)
+            except Exception:
+                # Malformed input; the full pipeline reports the proper error
+                pass
 
-        except KeyError as e:
-            raise TranspilerError(f"Unsupported format type: {e}")
-        except Exception as e:
-            raise TranspilerError(f"Error during transpilation: {e}")
+        return self._run(lambda: self.parse(content, from_type), to_type, validate)
+
+    def transpile_stream(
+        self,
+        fp: IO,
+        from_type: FormatType,
+        to_type: FormatType,
+        validate: bool = True,
+        output: Optional[IO] = None,
+    ) -> Union[str, dict, None]:
+        """
+        Transpile a workflow read from a file object.
+
+        The source parser consumes the file directly, so formats that
+        support incremental parsing never hold the whole raw input in
+        memory. When ``output`` is given the target parser writes to it
+        incrementally instead of building the result in memory.
+
+        With a cache configured, seekable files are hashed and rewound
+        first; a hit is copied to ``output`` and a miss is stored as it is
+        written.
+
+        Args:
+            fp: File object containing the input workflow content
+            from_type: The source format: a type, or a registered name or alias
+            to_type: The target format: a type, or a registered name or alias
+            validate: Whether to validate the workflow during conversion
+            output: Optional file object the result is written to
+
+        Returns:
+            The workflow in the target format, or None if it was written
+            to ``output``
+
+        Raises:
+            TranspilerError: If transpilation fails
+            ParserError: If the content cannot be parsed
+            ValidationError: If workflow validation fails
+        """
+        from_type, to_type = self._format(from_type), self._format(to_type)
+        observer = self.observer
+        checks = self._cache_checks(validate)
+        key = None
+        if checks is not None:
+            with stage(observer, "cache"):
+                key = self.cache.key_stream(fp, from_type, to_type, checks)
+
+        if observer is None:
+            return self._transpile_stream(fp, from_type, to_type, validate, output, key)
+
+        reader = CountingReader(fp)
+        writer = CountingWriter(output) if output is not None else None
+        result = self._transpile_stream(
+            reader, from_type, to_type, validate, writer, key
+        )
+        observer.transpile_finished(
+            reader.size or None,
+            writer.size if writer is not None else content_size(result),
+        )
+        return result
+
+    def _transpile_stream(
+        self,
+        fp: IO,
+        from_type: FormatType,
+        to_type: FormatType,
+        validate: bool,
+        output: Optional[IO],
+        key: Optional[str],
+    ) -> Union[str, dict, None]:
+        if key is None:
+            return self._run_stream(fp, from_type, to_type, validate, output)
+
+        if output is None:
+            with stage(self.observer, "cache"):
+                cached = self.cache.get(key)
+            if cached is None:
+                cached = self._run_stream(fp, from_type, to_type, validate)
+                self.cache.put(key, cached)
+            return cached
+
+        with stage(self.observer, "cache"):
+            text = self.cache.get_text(key)
+        if text is not None:
+            output.write(text)
+            return None
+
+        # Store the result as it streams out rather than building it in memory
+        tee = self.cache.tee(key, output, self._parser(to_type).text_output)
+        if tee is None:
+            return self._run_stream(fp, from_type, to_type, validate, output)
+        try:
+            self._run_stream(fp, from_type, to_type, validate, tee)
+        except BaseException:
+            tee.discard()
+            raise
+        tee.commit()
+        return None
+
+    def _run_stream(
+        self,
+        fp: IO,
+        from_type: FormatType,
+        to_type: FormatType,
+        validate: bool,
+        output: Optional[IO] = None,
+    ) -> Union[str, dict, None]:
+        source = self._parser(from_type)
+        # Only sources that decode to a dict anyway can take the direct path;
+        # incremental parsers keep streaming into the unified model
+        load = getattr(source, "load", None)
+        if load is None or self._direct_converter(from_type, to_type, validate) is None:
+            return self._run(
+                lambda: self.parse_stream(fp, from_type), to_type, validate, output
+            )
+
+        with stage(self.observer, "parse"):
+            content = load(fp)
+        result = self._transpile(content, from_type, to_type, validate)
+        if output is None:
+            return result
+        json.dump(result, output, indent=2)
+        return None
@@ -14,10 +14,19 @@ class ParserError(AloofUnionError):
 class ValidationError(AloofUnionError):
     """Raised when workflow validation fails."""
 
-    pass
+    def __init__(self, message: str = "", report=None):
+        super().__init__(message)
+        #: The full ValidationReport, when the validator collected one
+        self.report = report
 
 
 class TranspilerError(AloofUnionError):
     """Raised when workflow transpilation fails."""
 
     pass
+
+
+class RoutingError(AloofUnionError):
+    """Raised when compiling routing conditions or routing a ticket fails."""
+
+    pass
@@ -10,6 +10,28 @@ from aloof_union.core.models import (
 )
 
 
+def make_workflow(edges, initial=(), terminal=()):
+    """
+    Workflow from ``(from, to)`` or ``(from, to, cost)`` edges.
+
+    States are created in the order edges first mention them, followed by
+    any initial or terminal state no edge mentions. A cost becomes a
+    ``set_cost`` action on its transition.
+    """
+    states = {}
+    transitions = []
+    for edge in edges:
+        for name in edge[:2]:
+            states.setdefault(name, WorkflowState(name))
+        actions = [Action("set_cost", {"cost": edge[2]})] if len(edge) > 2 else []
+        transitions.append(Transition(edge[0], edge[1], [], actions))
+    for name in initial:
+        states.setdefault(name, WorkflowState(name)).is_initial = True
+    for name in terminal:
+        states.setdefault(name, WorkflowState(name)).is_terminal = True
+    return UnifiedWorkflow(states, transitions, {})
+
+
 @pytest.fixture
 def simple_fs_workflow():
     """Simple Fresh Service workflow fixture."""
@@ -0,0 +1,155 @@
+# aloof_union/tests/synthetic.py
+"""
+Seeded generator of synthetic workflows for tests and benchmarks.
+
+Generated workflows always pass full validation: ``State0`` is the only
+initial state, the last state is the only terminal one, a chain of
+transitions through every state in order keeps them all reachable, and
+the remaining transitions join random non-terminal states to random
+states. Each transition carries ``k`` conditions on distinct fields and
+``k`` actions.
+"""
+
+import random
+from typing import List, Optional, Union
+
+from aloof_union.core.models import (
+    Action,
+    AutomationType,
+    Condition,
+    Transition,
+    UnifiedWorkflow,
+    WorkflowState,
+)
+from aloof_union.core.parsers import get_parser
+
+OPERATORS = ("equals", "not equals", "is", "is not", "contains")
+ACTION_TYPES = ("notify", "assign", "set_field", "webhook")
+
+
+def state_name(i: int) -> str:
+    return f"State{i}"
+
+
+def synthetic_workflow(
+    n_states: int,
+    n_transitions: Optional[int] = None,
+    k: int = 1,
+    seed: int = 0,
+) -> UnifiedWorkflow:
+    """
+    Build a synthetic workflow.
+
+    Args:
+        n_states: Number of states
+        n_transitions: Number of transitions; defaults to three per state
+        k: Conditions and actions per transition
+        seed: Seed of the random generator; equal arguments always give
+            equal workflows
+
+    Returns:
+        The generated workflow
+
+    Raises:
+        ValueError: If there are too few transitions to reach every state
+    """
+    if n_states < 1:
+        raise ValueError("A workflow needs at least one state")
+    if n_transitions is None:
+        n_transitions = 3 * n_states
+    if n_transitions < n_states - 1:
+        raise ValueError(
+            f"{n_states} states need at least {n_states - 1} transitions "
+            "to all be reachable"
+        )
+
+    rng = random.Random(seed)
+    last = n_states - 1
+    states = {}
+    for i in range(n_states):
+        terminal = i == last and n_states > 1
+        states[state_name(i)] = WorkflowState(
+            name=state_name(i),
+            description=f"Synthetic state {i}",
+            is_initial=i == 0,
+            is_terminal=terminal,
+            properties={"statusCategory": "DONE" if terminal else "IN_PROGRESS"},
+        )
+
+    def conditions() -> List[Condition]:
+        return [
+            Condition(f"field{j}", rng.choice(OPERATORS), rng.randrange(1000))
+            for j in range(k)
+        ]
+
+    def actions() -> List[Action]:
+        return [
+            Action(rng.choice(ACTION_TYPES), {"target": f"value{rng.randrange(1000)}"})
+            for _ in range(k)
+        ]
+
+    transitions = [
+        Transition(state_name(i), state_name(i + 1), conditions(), actions())
+        for i in range(last)
+    ]
+    sources = max(last, 1)
+    for _ in range(n_transitions - len(transitions)):
+        from_state = state_name(rng.randrange(sources))
+        to_state = state_name(rng.randrange(n_states))
+        transitions.append(Transition(from_state, to_state, conditions(), actions()))
+
+    return UnifiedWorkflow(states, transitions, {"source": "synthetic"})
+
+
+def render_mermaid(workflow: UnifiedWorkflow) -> str:
+    """
+    Render a workflow as Mermaid text that parses back with its initial state.
+
+    Mermaid labels only carry conditions, and only the first one of each
+    transition is kept since the parser gives every label condition the
+    same field and operator.
+    """
+    lines = ["stateDiagram-v2"]
+    # Declare states no transition mentions, so they aren't lost
+    for name, incoming in workflow.index.incoming.items():
+        if not incoming and not workflow.index.outgoing.get(name):
+            lines.append(f'    state "{name}"')
+    for trans in workflow.transitions:
+        if trans.conditions:
+            c = trans.conditions[0]
+            lines.append(
+                f"    {trans.from_state} --> {trans.to_state}: "
+                f"{c.field} {c.operator} {c.value}"
+            )
+        else:
+            lines.append(f"    {trans.from_state} --> {trans.to_state}")
+    # Initial and terminal markers only apply to states already declared
+    for name in workflow.index.initial:
+        lines.append(f"    [*] --> {name}")
+    for name in workflow.index.terminal:
+        lines.append(f"    {name} --> [*]")
+    for state in workflow.states.values():
+        if state.description:
+            lines.append(f"    note right of {state.name}: {state.description}")
+    return "\n".join(lines)
+
+
+def synthetic_content(
+    automation_type: AutomationType,
+    n_states: int,
+    n_transitions: Optional[int] = None,
+    k: int = 1,
+    seed: int = 0,
+) -> Union[str, dict]:
+    """
+    Generate a synthetic workflow in the given format.
+
+    Takes the same arguments as :func:`synthetic_workflow`.
+
+    Returns:
+        The workflow as a dict, or as text for Mermaid
+    """
+    workflow = synthetic_workflow(n_states, n_transitions, k, seed)
+    if automation_type == AutomationType.MERMAID:
+        return render_mermaid(workflow)
+    return get_parser(automation_type).serialize(workflow)
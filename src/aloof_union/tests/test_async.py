@@ -0,0 +1,172 @@
+# aloof_union/tests/test_async.py
+import asyncio
+import threading
+import time
+
+import pytest
+
+from aloof_union.core.models import AutomationType
+from aloof_union.core.transpilers import AsyncWorkflowTranspiler, WorkflowTranspiler
+from aloof_union.exceptions import TranspilerError, ValidationError
+
+FS, JSM = AutomationType.FRESHSERVICE, AutomationType.JSM
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+async def collect(transpiler, contents, **kwargs):
+    async with transpiler:
+        return [r async for r in transpiler.transpile_many(contents, FS, JSM, **kwargs)]
+
+
+class TestAsyncWorkflowTranspiler:
+    def test_transpile_matches_sync(self, simple_fs_workflow):
+        async def main():
+            async with AsyncWorkflowTranspiler() as transpiler:
+                return await transpiler.transpile(simple_fs_workflow, FS, JSM)
+
+        expected = WorkflowTranspiler().transpile(simple_fs_workflow, FS, JSM)
+        assert run(main()) == expected
+
+    def test_errors_propagate(self, invalid_workflow_no_initial):
+        async def main():
+            async with AsyncWorkflowTranspiler() as transpiler:
+                await transpiler.transpile(invalid_workflow_no_initial, FS, JSM)
+
+        with pytest.raises(ValidationError):
+            run(main())
+
+    def test_transpile_many_reports_every_item(
+        self, simple_fs_workflow, complex_fs_workflow, invalid_workflow_no_initial
+    ):
+        contents = [
+            simple_fs_workflow,
+            invalid_workflow_no_initial,
+            complex_fs_workflow,
+        ]
+        results = run(collect(AsyncWorkflowTranspiler(max_workers=2), contents))
+
+        by_index = {r.index: r for r in results}
+        assert sorted(by_index) == [0, 1, 2]
+        assert by_index[0].ok and by_index[2].ok
+        assert isinstance(by_index[1].error, ValidationError)
+        assert len(by_index[2].result["statuses"]) == 6
+
+    def test_accepts_async_iterables(self, simple_fs_workflow):
+        async def exports():
+            for _ in range(3):
+                await asyncio.sleep(0)
+                yield simple_fs_workflow
+
+        results = run(collect(AsyncWorkflowTranspiler(), exports()))
+
+        assert sorted(r.index for r in results) == [0, 1, 2]
+        assert all(r.ok for r in results)
+
+    def test_endless_source_yields_as_it_goes(self, simple_fs_workflow):
+        pulled = [0]
+
+        async def exports():
+            while True:
+                pulled[0] += 1
+                await asyncio.sleep(0)
+                yield simple_fs_workflow
+
+        async def main():
+            async with AsyncWorkflowTranspiler() as transpiler:
+                results = transpiler.transpile_many(exports(), FS, JSM)
+                first = await results.__anext__()
+                await results.aclose()
+                return first, transpiler._window()
+
+        first, window = run(asyncio.wait_for(main(), 5))
+
+        assert first.ok
+        assert pulled[0] <= window + 1
+
+    def test_concurrency_limit(self, simple_fs_workflow):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow(workflow):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        transpiler = AsyncWorkflowTranspiler(
+            transforms=[slow], max_workers=8, max_concurrency=2
+        )
+        results = run(collect(transpiler, [simple_fs_workflow] * 6))
+
+        assert all(r.ok for r in results)
+        assert peak[0] <= 2
+
+    def test_timeout(self, simple_fs_workflow):
+        transpiler = AsyncWorkflowTranspiler(
+            transforms=[lambda w: time.sleep(0.2)], timeout=0.01
+        )
+        results = run(collect(transpiler, [simple_fs_workflow]))
+
+        assert isinstance(results[0].error, TranspilerError)
+        assert "timed out" in str(results[0].error)
+
+    def test_reused_across_event_loops(self, simple_fs_workflow):
+        transpiler = AsyncWorkflowTranspiler(
+            transforms=[lambda w: time.sleep(0.01)], max_concurrency=1
+        )
+
+        async def main():
+            return await asyncio.gather(
+                *(transpiler.transpile(simple_fs_workflow, FS, JSM) for _ in range(3))
+            )
+
+        try:
+            first, second = run(main()), run(main())
+        finally:
+            transpiler._get_executor().shutdown()
+
+        assert first == second
+
+    def test_timed_out_conversion_keeps_its_slot(self, simple_fs_workflow):
+        release = threading.Event()
+        started = []
+
+        def blocked(workflow):
+            started.append(time.perf_counter())
+            release.wait(5)
+
+        transpiler = AsyncWorkflowTranspiler(
+            transforms=[blocked], max_workers=4, max_concurrency=1
+        )
+
+        async def main():
+            with pytest.raises(TranspilerError, match="timed out"):
+                await transpiler.transpile(simple_fs_workflow, FS, JSM, timeout=0.01)
+            second = asyncio.ensure_future(
+                transpiler.transpile(simple_fs_workflow, FS, JSM)
+            )
+            await asyncio.sleep(0.05)
+            waiting = len(started)
+            release.set()
+            await second
+            await transpiler.aclose()
+            return waiting
+
+        assert run(main()) == 1
+        assert len(started) == 2
+
+    def test_process_executor(self, simple_fs_workflow):
+        transpiler = AsyncWorkflowTranspiler(executor="process", max_workers=2)
+        results = run(collect(transpiler, [simple_fs_workflow] * 2))
+
+        expected = WorkflowTranspiler().transpile(simple_fs_workflow, FS, JSM)
+        assert [r.result for r in results] == [expected] * 2
+
+    def test_unknown_executor(self):
+        with pytest.raises(ValueError):
+            AsyncWorkflowTranspiler(executor="fiber")
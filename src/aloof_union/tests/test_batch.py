@@ -0,0 +1,204 @@
+# aloof_union/tests/test_batch.py
+import json
+import os
+import tempfile
+
+import pytest
+from click.testing import CliRunner
+
+from aloof_union.cli import cli
+from aloof_union.core.batch import convert_directory, convert_file, write_summary
+from aloof_union.core.models import AutomationType
+from aloof_union.core.transpiler import WorkflowTranspiler
+from aloof_union.core.transpilers.direct import freshservice_to_jsm
+from aloof_union.exceptions import ParserError
+
+
+@pytest.fixture
+def export_tree(tmp_path, simple_fs_workflow, complex_fs_workflow):
+    """Input tree with two valid Fresh Service exports and one broken file."""
+    root = tmp_path / "exports"
+    (root / "team_a").mkdir(parents=True)
+    (root / "simple.json").write_text(json.dumps(simple_fs_workflow))
+    (root / "team_a" / "complex.json").write_text(json.dumps(complex_fs_workflow))
+    (root / "broken.json").write_text("{not json")
+    return root
+
+
+class TestConvertFile:
+    def test_failed_run_keeps_earlier_output(self, export_tree, tmp_path):
+        target = tmp_path / "simple.jsm.json"
+        transpiler = WorkflowTranspiler()
+        fs, jsm = AutomationType.FRESHSERVICE, AutomationType.JSM
+        convert_file(transpiler, export_tree / "simple.json", target, fs, jsm)
+        converted = target.read_text()
+
+        with pytest.raises(ParserError):
+            convert_file(transpiler, export_tree / "broken.json", target, fs, jsm)
+
+        assert target.read_text() == converted
+        assert [p.name for p in tmp_path.iterdir() if p.is_file()] == [target.name]
+
+    def test_refuses_to_overwrite_input(self, export_tree):
+        source = export_tree / "simple.json"
+        before = source.read_text()
+
+        with pytest.raises(ValueError, match="would overwrite its input"):
+            convert_file(
+                WorkflowTranspiler(),
+                source,
+                export_tree / "team_a" / ".." / "simple.json",
+                AutomationType.FRESHSERVICE,
+                AutomationType.JSM,
+            )
+
+        assert source.read_text() == before
+
+    def test_missing_input_closes_temporary_file(self, tmp_path, monkeypatch):
+        opened = []
+        mkstemp = tempfile.mkstemp
+
+        def recording_mkstemp(*args, **kwargs):
+            opened.append(mkstemp(*args, **kwargs))
+            return opened[-1]
+
+        monkeypatch.setattr(tempfile, "mkstemp", recording_mkstemp)
+        with pytest.raises(OSError):
+            convert_file(
+                WorkflowTranspiler(),
+                tmp_path / "missing.json",
+                tmp_path / "out.json",
+                AutomationType.FRESHSERVICE,
+                AutomationType.JSM,
+            )
+
+        [(fd, tmp)] = opened
+        assert not os.path.exists(tmp)
+        with pytest.raises(OSError):
+            os.fstat(fd)
+
+
+class TestConvertDirectory:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_bad_file_is_recorded_and_skipped(self, export_tree, tmp_path, workers):
+        out = tmp_path / "out"
+        results = convert_directory(
+            export_tree,
+            out,
+            AutomationType.FRESHSERVICE,
+            AutomationType.JSM,
+            workers=workers,
+        )
+
+        assert [r.ok for r in results] == [False, True, True]
+        assert "broken.json" in results[0].source
+        assert results[0].error
+        assert (out / "simple.json").exists()
+        converted = json.loads((out / "team_a" / "complex.json").read_text())
+        assert len(converted["statuses"]) == 6
+
+    def test_target_extension_follows_format(self, export_tree, tmp_path):
+        out = tmp_path / "out"
+        convert_directory(
+            export_tree,
+            out,
+            AutomationType.FRESHSERVICE,
+            AutomationType.MERMAID,
+            workers=1,
+        )
+
+        assert "stateDiagram-v2" in (out / "simple.mmd").read_text()
+
+    def test_rerun_skips_output_inside_input(self, export_tree):
+        out = export_tree / "converted"
+        fs, jsm = AutomationType.FRESHSERVICE, AutomationType.JSM
+        convert_directory(export_tree, out, fs, jsm, workers=1)
+        (export_tree / "summary.json").write_text("{}")
+
+        results = convert_directory(
+            export_tree,
+            out,
+            fs,
+            jsm,
+            workers=1,
+            exclude=[export_tree / "summary.json"],
+        )
+
+        assert [r.source for r in results] == [
+            str(export_tree / "broken.json"),
+            str(export_tree / "simple.json"),
+            str(export_tree / "team_a" / "complex.json"),
+        ]
+
+    def test_same_output_dir_leaves_inputs_alone(self, export_tree):
+        before = (export_tree / "simple.json").read_text()
+
+        results = convert_directory(
+            export_tree,
+            export_tree,
+            AutomationType.FRESHSERVICE,
+            AutomationType.JSM,
+            workers=1,
+        )
+
+        assert not any(r.ok for r in results)
+        assert "would overwrite its input" in results[1].error
+        assert (export_tree / "simple.json").read_text() == before
+
+    def test_summary(self, export_tree, tmp_path):
+        results = convert_directory(
+            export_tree,
+            tmp_path / "out",
+            AutomationType.FRESHSERVICE,
+            AutomationType.JSM,
+            workers=1,
+        )
+        summary = write_summary(results, tmp_path / "summary.json")
+
+        assert summary["total"] == 3
+        assert summary["failed"] == 1
+        written = json.loads((tmp_path / "summary.json").read_text())
+        assert written == summary
+
+
+class TestConvertCommand:
+    @pytest.mark.parametrize("level", ["structural", "none"])
+    def test_uses_fast_path(self, level, tmp_path, simple_fs_workflow, monkeypatch):
+        source, target = tmp_path / "in.json", tmp_path / "out.json"
+        source.write_text(json.dumps(simple_fs_workflow))
+
+        def fail(*args):
+            raise AssertionError("unified model was built")
+
+        monkeypatch.setattr(WorkflowTranspiler, "parse", fail)
+        monkeypatch.setattr(WorkflowTranspiler, "parse_stream", fail)
+        result = CliRunner().invoke(
+            cli,
+            [
+                "convert",
+                str(source),
+                str(target),
+                "-f",
+                "fs",
+                "-t",
+                "jsm",
+                "--validation",
+                level,
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(target.read_text()) == freshservice_to_jsm(simple_fs_workflow)
+
+
+class TestConvertDirCommand:
+    def test_exit_code_reports_failures(self, export_tree, tmp_path):
+        out = tmp_path / "out"
+        result = CliRunner().invoke(
+            cli,
+            ["convert-dir", str(export_tree), str(out), "-f", "fs", "-t", "jsm"],
+        )
+
+        assert result.exit_code == 1
+        assert "Converted 2/3 files" in result.output
+        assert (out / "summary.json").exists()
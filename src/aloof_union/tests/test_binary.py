@@ -0,0 +1,121 @@
+# aloof_union/tests/test_binary.py
+import io
+import json
+
+import pytest
+
+from aloof_union.core import binary
+from aloof_union.core.compact import TransitionTable, compact_workflow
+from aloof_union.core.models import (
+    Action,
+    Condition,
+    Transition,
+    UnifiedWorkflow,
+    WorkflowState,
+)
+from aloof_union.core.parsers import FreshServiceParser
+from aloof_union.exceptions import ParserError
+from aloof_union.tests.synthetic import state_name, synthetic_workflow
+
+
+@pytest.fixture
+def awkward_workflow():
+    """Workflow with values the textual formats can't all carry."""
+    return UnifiedWorkflow(
+        states={
+            "New": WorkflowState("New", is_initial=True),
+            "Open": WorkflowState(
+                "Open", "", properties={"sla": {"hours": 4.5}, "tags": ("a", "b")}
+            ),
+            "Done": WorkflowState("Done", None, is_terminal=True, properties={}),
+        },
+        transitions=[
+            Transition(
+                "New",
+                "Open",
+                [Condition("priority", "in", (1, 2)), Condition("group", "==", None)],
+                [Action("notify", {"to": ["agent"], "raw": b"\x00\xff"})],
+            ),
+            Transition("Open", "Done", [], []),
+            Transition("Open", "Open", [], [Action("comment", {})]),
+        ],
+        metadata={"source": "fs", "version": 3, "labels": {"x", "y"}},
+    )
+
+
+class TestBinaryFormat:
+    def test_round_trip(self, awkward_workflow):
+        data = binary.dumps(awkward_workflow)
+        loaded = binary.loads(data)
+
+        assert data.startswith(binary.MAGIC)
+        assert loaded == awkward_workflow
+        assert loaded.states["Open"].properties["tags"] == ("a", "b")
+        assert loaded.states["New"].properties is None
+        assert loaded.states["Done"].properties == {}
+        assert loaded.transitions[0].conditions[0].value == (1, 2)
+
+    def test_round_trip_loaded_workflows(self, unified_workflow):
+        assert binary.loads(binary.dumps(unified_workflow)) == unified_workflow
+
+    def test_round_trip_parsed_properties(self, complex_fs_workflow):
+        workflow = FreshServiceParser().parse(complex_fs_workflow)
+
+        loaded = binary.loads(binary.dumps(workflow))
+
+        assert loaded == workflow
+        assert type(loaded.states["New"].properties) is dict
+
+    def test_names_are_interned(self, awkward_workflow):
+        loaded = binary.loads(binary.dumps(awkward_workflow))
+
+        assert loaded.transitions[0].to_state is loaded.states["Open"].name
+
+    def test_compact_transitions_preserved(self, awkward_workflow):
+        loaded = binary.loads(binary.dumps(compact_workflow(awkward_workflow)))
+
+        assert isinstance(loaded.transitions, TransitionTable)
+        assert list(loaded.transitions) == awkward_workflow.transitions
+
+    def test_string_table_keeps_output_small(self):
+        workflow = synthetic_workflow(200, k=2)
+        as_json = json.dumps(FreshServiceParser().serialize(workflow))
+
+        data = binary.dumps(workflow)
+
+        assert binary.loads(data) == workflow
+        # Names are stored once however many transitions use them
+        assert data.count(state_name(199).encode()) == 1
+        assert len(data) < len(as_json) / 2
+
+    def test_dump_and_load_files(self, awkward_workflow):
+        buffer = io.BytesIO()
+        binary.dump(awkward_workflow, buffer)
+        buffer.seek(0)
+
+        assert binary.load(buffer) == awkward_workflow
+
+    @pytest.mark.parametrize(
+        "data, message",
+        [
+            (b"", "magic"),
+            (b"JSON{}", "magic"),
+            (binary.MAGIC + b"\x63", "version: 99"),
+            (binary.MAGIC + bytes([binary.FORMAT_VERSION]) + b"\x00", "Corrupt"),
+        ],
+    )
+    def test_bad_input(self, data, message):
+        with pytest.raises(ParserError, match=message):
+            binary.loads(data)
+
+    def test_truncated_input(self, awkward_workflow):
+        data = binary.dumps(awkward_workflow)
+
+        with pytest.raises(ParserError, match="Corrupt"):
+            binary.loads(data[:-10])
+
+    def test_unencodable_value(self, awkward_workflow):
+        awkward_workflow.metadata["when"] = object()
+
+        with pytest.raises(ValueError):
+            binary.dumps(awkward_workflow)
@@ -0,0 +1,203 @@
+# aloof_union/tests/test_cache.py
+import io
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from aloof_union.cli import cli
+from aloof_union.core.cache import TranspileCache
+from aloof_union.core.models import AutomationType
+from aloof_union.core.transpilers import WorkflowTranspiler
+from aloof_union.exceptions import ParserError, ValidationError
+
+FS, JSM, MERMAID = (
+    AutomationType.FRESHSERVICE,
+    AutomationType.JSM,
+    AutomationType.MERMAID,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TranspileCache(tmp_path / "cache")
+
+
+def count_parses(transpiler, monkeypatch):
+    calls = []
+    for name in ("parse", "parse_stream"):
+        original = getattr(transpiler, name)
+
+        def wrapper(*args, _original=original):
+            calls.append(args)
+            return _original(*args)
+
+        monkeypatch.setattr(transpiler, name, wrapper)
+    return calls
+
+
+class TestTranspileCache:
+    def test_key_normalizes_dict_order(self, cache):
+        a = {"states": {"A": {}, "B": {}}, "transitions": []}
+        b = {"transitions": [], "states": {"A": {}, "B": {}}}
+
+        assert cache.key(a, FS, JSM) == cache.key(b, FS, JSM)
+        assert cache.key(a, FS, JSM) != cache.key(a, FS, MERMAID)
+        assert cache.key(a, FS, JSM) != cache.key(a, FS, JSM, ("states",))
+
+    def test_key_includes_version(self, cache, monkeypatch):
+        import aloof_union
+
+        key = cache.key("graph", MERMAID, FS)
+        monkeypatch.setattr(aloof_union, "__version__", "999.0")
+
+        assert cache.key("graph", MERMAID, FS) != key
+
+    def test_stream_key_matches_text(self, cache):
+        text = "stateDiagram-v2\n    state Open\n"
+        fp = io.BytesIO(text.encode("utf-8"))
+        fp.read(3)
+        fp.seek(0)
+
+        assert cache.key_stream(fp, MERMAID, FS) == cache.key(text, MERMAID, FS)
+        assert fp.tell() == 0
+
+    def test_round_trip(self, cache):
+        cache.put("ab" * 32, {"states": {}})
+        cache.put("cd" * 32, "stateDiagram-v2\r\n")
+
+        assert cache.get("ab" * 32) == {"states": {}}
+        assert cache.get("cd" * 32) == "stateDiagram-v2\r\n"
+        assert cache.get_text("ab" * 32) == json.dumps({"states": {}}, indent=2)
+        assert cache.get("ef" * 32) is None
+
+    def test_lru_eviction(self, tmp_path):
+        cache = TranspileCache(tmp_path / "cache", max_bytes=250)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, "x" * 100)
+            path = cache._path(key)
+            os.utime(path, (i, i))
+        # Oldest entry is evicted once the cache outgrows its limit
+        assert cache.get(keys[0]) is None
+
+        os.utime(cache._path(keys[1]), (10, 10))
+        cache.put("99" * 32, "x" * 100)
+
+        assert cache.get(keys[1]) is not None
+        assert cache.get(keys[2]) is None
+        assert cache.size() <= 250
+
+    def test_unwritable_directory_is_a_miss(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = TranspileCache(blocker)
+
+        cache.put("ab" * 32, {"states": {}})
+        assert cache.get("ab" * 32) is None
+
+
+class TestCachedTranspiler:
+    def test_hit_skips_conversion(self, cache, simple_fs_workflow, monkeypatch):
+        transpiler = WorkflowTranspiler(cache=cache)
+        calls = count_parses(transpiler, monkeypatch)
+
+        first = transpiler.transpile(simple_fs_workflow, FS, MERMAID)
+        second = transpiler.transpile(simple_fs_workflow, FS, MERMAID)
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_validation_level_is_part_of_key(self, cache, invalid_workflow_unreachable):
+        WorkflowTranspiler(validation="structural", cache=cache).transpile(
+            invalid_workflow_unreachable, FS, JSM
+        )
+
+        with pytest.raises(ValidationError):
+            WorkflowTranspiler(validation="full", cache=cache).transpile(
+                invalid_workflow_unreachable, FS, JSM
+            )
+
+    def test_transforms_bypass_cache(self, cache, simple_fs_workflow):
+        transpiler = WorkflowTranspiler(transforms=[lambda w: w], cache=cache)
+        transpiler.transpile(simple_fs_workflow, FS, JSM)
+
+        assert cache.size() == 0
+
+    def test_stream_hit_writes_same_output(
+        self, cache, simple_fs_workflow, monkeypatch
+    ):
+        transpiler = WorkflowTranspiler(cache=cache)
+        calls = count_parses(transpiler, monkeypatch)
+        content = json.dumps(simple_fs_workflow)
+
+        outputs = []
+        for _ in range(2):
+            out = io.StringIO()
+            transpiler.transpile_stream(io.StringIO(content), FS, MERMAID, output=out)
+            outputs.append(out.getvalue())
+
+        uncached = io.StringIO()
+        WorkflowTranspiler().transpile_stream(
+            io.StringIO(content), FS, MERMAID, output=uncached
+        )
+        assert outputs == [uncached.getvalue()] * 2
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("to_type", [JSM, MERMAID])
+    def test_stream_miss_is_stored_as_written(
+        self, cache, simple_fs_workflow, monkeypatch, to_type
+    ):
+        transpiler = WorkflowTranspiler(cache=cache)
+        expected = WorkflowTranspiler().transpile(simple_fs_workflow, FS, to_type)
+        content = json.dumps(simple_fs_workflow)
+
+        def in_memory(*args):
+            raise AssertionError("result built in memory")
+
+        monkeypatch.setattr(transpiler, "serialize", in_memory)
+        out = io.StringIO()
+        transpiler.transpile_stream(io.StringIO(content), FS, to_type, output=out)
+
+        key = cache.key(content, FS, to_type, transpiler.validator.checks)
+        assert cache.get(key) == expected
+        assert cache.get_text(key) == out.getvalue()
+
+    def test_failed_stream_leaves_no_entry(self, cache):
+        transpiler = WorkflowTranspiler(cache=cache)
+
+        with pytest.raises(ParserError):
+            transpiler.transpile_stream(
+                io.StringIO("{not json"), FS, JSM, output=io.StringIO()
+            )
+
+        assert list(cache.directory.glob("??/*")) == []
+
+
+class TestCacheOptions:
+    def test_convert_with_cache(self, tmp_path, simple_fs_workflow):
+        source = tmp_path / "in.json"
+        source.write_text(json.dumps(simple_fs_workflow))
+        cache_dir = tmp_path / "cache"
+        args = ["--cache-dir", str(cache_dir), "--cache-max-mb", "1"]
+
+        runner = CliRunner()
+        for target in ("a.json", "b.json"):
+            result = runner.invoke(
+                cli,
+                [
+                    "convert",
+                    str(source),
+                    str(tmp_path / target),
+                    "-f",
+                    "fs",
+                    "-t",
+                    "jsm",
+                ]
+                + args,
+            )
+            assert result.exit_code == 0, result.output
+
+        assert (tmp_path / "a.json").read_text() == (tmp_path / "b.json").read_text()
+        assert TranspileCache(cache_dir).size() > 0
@@ -0,0 +1,167 @@
+# aloof_union/tests/test_columnar.py
+import math
+
+import pytest
+
+from aloof_union.core.models import Condition, Transition, UnifiedWorkflow
+from aloof_union.core.parsers import FreshServiceParser
+from aloof_union.core.routing import RoutingEngine, operators, register_operator
+from aloof_union.exceptions import RoutingError
+
+np = pytest.importorskip("numpy")
+
+from aloof_union.core.routing import ColumnarRouter  # noqa: E402
+
+CONDITIONS = [
+    ("count", "equals", 3),
+    ("count", "greater than", 2),
+    ("count", "in", [1, "1", 4]),
+    ("count", "contains", 1),
+    ("score", "is not", None),
+    ("score", "<=", 0.5),
+    ("score", "is empty", None),
+    ("team", "equals", "ops"),
+    ("team", "not in", ["ops", "dev"]),
+    ("team", "contains", "e"),
+    ("team", "starts with", "d"),
+    ("team", "is not empty", None),
+    ("team", ">", 5),
+    ("team", "matches", "^o"),
+    ("owner", "exists", True),
+    ("owner", "equals", "amy"),
+    ("owner", "in", ["amy", None]),
+    ("code", "contains", "a"),
+    ("code", "not contains", "a"),
+    ("code", "starts with", "a"),
+    ("code", ">", "a"),
+    ("code", "equals", "ab"),
+    ("code", "is empty", None),
+    ("absent", "exists", False),
+    ("absent", "equals", 1),
+]
+
+
+@pytest.fixture
+def operator_workflow():
+    """One transition per condition out of A, plus a two-condition one."""
+    transitions = [
+        Transition("A", f"T{i}", [Condition(*c)], []) for i, c in enumerate(CONDITIONS)
+    ]
+    transitions.append(
+        Transition(
+            "B",
+            "Both",
+            [Condition("count", ">=", 2), Condition("team", "equals", "dev")],
+            [],
+        )
+    )
+    return UnifiedWorkflow({}, transitions, {})
+
+
+@pytest.fixture
+def columns():
+    rng = np.random.default_rng(0)
+    n = 2000
+    score = rng.random(n)
+    score[rng.random(n) < 0.2] = np.nan
+    owner = np.array(
+        [None if i % 3 == 0 else ("amy" if i % 3 == 1 else "bo") for i in range(n)],
+        dtype=object,
+    )
+    return {
+        "count": rng.integers(0, 6, n),
+        "score": score,
+        "team": rng.choice(["ops", "dev", "", "qa"], n),
+        "owner": owner,
+        "code": rng.choice([b"ab", b"x", b""], n),
+    }
+
+
+def as_rows(columns, states):
+    rows = []
+    for i, state in enumerate(states.tolist()):
+        row = {"status": state}
+        for field, column in columns.items():
+            value = column[i].item() if hasattr(column[i], "item") else column[i]
+            # Columns mark missing floats with NaN
+            row[field] = (
+                None if isinstance(value, float) and math.isnan(value) else value
+            )
+        rows.append(row)
+    return rows
+
+
+class TestColumnarRouter:
+    def test_agrees_with_routing_engine(self, operator_workflow, columns):
+        states = np.random.default_rng(1).choice(["A", "B"], len(columns["count"]))
+        router = ColumnarRouter(operator_workflow)
+        routes = RoutingEngine(operator_workflow).route(as_rows(columns, states))
+
+        masks = router.masks(columns, states)
+        names = router.next_state_names(columns, states)
+
+        for position, transition in enumerate(operator_workflow.transitions):
+            expected = [any(t is transition for t in r) for r in routes]
+            assert masks[position].tolist() == expected, transition.conditions
+        assert names.tolist() == [r[0].to_state if r else None for r in routes]
+
+    def test_fresh_service_fixture(self, complex_fs_workflow):
+        workflow = FreshServiceParser().parse(complex_fs_workflow)
+        router = ColumnarRouter(workflow)
+
+        result = router.next_state_names(
+            {
+                "review_passed": np.array([True, False, False]),
+                "assignee": np.array(["amy", None, None], dtype=object),
+                "priority": np.array([1, 2, 3]),
+            },
+            np.array(["Under Review", "Under Review", "New"]),
+        )
+
+        assert result.tolist() == ["Resolved", "In Progress", None]
+
+    def test_selected_masks_and_state_ids(self, operator_workflow, columns):
+        router = ColumnarRouter(operator_workflow)
+        states = np.full(len(columns["count"]), router.ids["A"])
+
+        masks = router.masks(columns, states, transitions=[0])
+
+        assert list(masks) == [0]
+        assert masks[0].tolist() == (columns["count"] == 3).tolist()
+
+    def test_replaced_operator_falls_back(self, monkeypatch):
+        monkeypatch.setattr(operators, "OPERATORS", dict(operators.OPERATORS))
+        register_operator(
+            "equals",
+            lambda field, value: lambda t: str(t.get(field)).lower() == value.lower(),
+            replace=True,
+        )
+        workflow = UnifiedWorkflow(
+            {}, [Transition("A", "B", [Condition("team", "equals", "OPS")], [])], {}
+        )
+        router = ColumnarRouter(workflow)
+
+        result = router.next_states({"team": np.array(["ops"])}, np.array(["A"]))
+
+        assert result.tolist() == [router.ids["B"]]
+        assert RoutingEngine(workflow).enabled({"status": "A", "team": "ops"})
+
+    def test_columns_misaligned(self, operator_workflow):
+        router = ColumnarRouter(operator_workflow)
+
+        with pytest.raises(ValueError, match="'count' has 2 rows, expected 3"):
+            router.next_states({"count": np.arange(2)}, np.array(["A"] * 3))
+
+    @pytest.mark.parametrize(
+        "states, message",
+        [
+            (np.array(["A", "Gone"]), "unknown state 'Gone'"),
+            (np.array(["Gone", "A"], dtype=object), "unknown state 'Gone'"),
+            (np.array([0, 99]), "out of range"),
+        ],
+    )
+    def test_unknown_states(self, operator_workflow, states, message):
+        router = ColumnarRouter(operator_workflow)
+
+        with pytest.raises(RoutingError, match=message):
+            router.next_states({}, states)
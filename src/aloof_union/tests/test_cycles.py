@@ -0,0 +1,78 @@
+# aloof_union/tests/test_cycles.py
+from aloof_union.core.analysis import condense
+from aloof_union.core.analysis.cycles import strongly_connected_components
+from aloof_union.core.parsers import JSMParser
+from aloof_union.tests.conftest import make_workflow
+
+
+class TestStronglyConnectedComponents:
+    def test_components_sinks_first(self):
+        adjacency = [[1], [2], [0, 3], [4], [3], []]
+
+        components, component_of = strongly_connected_components(adjacency)
+
+        assert [sorted(c) for c in components] == [[3, 4], [0, 1, 2], [5]]
+        assert component_of == [1, 1, 1, 0, 0, 2]
+
+    def test_deep_graph(self):
+        count = 50000
+        adjacency = [[i + 1] for i in range(count - 1)] + [[0]]
+
+        components, _ = strongly_connected_components(adjacency)
+
+        assert len(components) == 1
+
+
+class TestCondensation:
+    def test_reopen_cycle(self):
+        workflow = make_workflow(
+            [
+                ("Open", "In Progress"),
+                ("In Progress", "Resolved"),
+                ("Resolved", "Reopened"),
+                ("Reopened", "In Progress"),
+                ("Resolved", "Closed"),
+            ],
+            terminal=["Closed"],
+        )
+
+        condensation = condense(workflow)
+
+        assert condensation.components == [
+            ("Open",),
+            ("In Progress", "Resolved", "Reopened"),
+            ("Closed",),
+        ]
+        assert condensation.successors == [[1], [2], []]
+        assert condensation.cycles() == [("In Progress", "Resolved", "Reopened")]
+        assert condensation.non_terminating_cycles() == []
+        assert condensation.layers() == [
+            ["Open"],
+            ["In Progress", "Resolved", "Reopened"],
+            ["Closed"],
+        ]
+
+    def test_non_terminating_cycles(self):
+        workflow = make_workflow(
+            [("A", "B"), ("B", "C"), ("C", "B"), ("A", "D"), ("D", "D"), ("A", "E")],
+            terminal=["E"],
+        )
+
+        condensation = condense(workflow)
+
+        assert sorted(condensation.non_terminating_cycles()) == [("B", "C"), ("D",)]
+        assert condensation.terminates[condensation.component_of["A"]]
+
+    def test_layers_follow_longest_chain(self):
+        workflow = make_workflow([("A", "B"), ("B", "C"), ("A", "C")])
+
+        condensation = condense(workflow)
+
+        assert condensation.layers() == [["A"], ["B"], ["C"]]
+        assert condensation.layer_of() == [0, 1, 2]
+
+    def test_jsm_fixture_is_acyclic(self, simple_jsm_workflow):
+        condensation = condense(JSMParser().parse(simple_jsm_workflow))
+
+        assert condensation.cycles() == []
+        assert all(len(c) == 1 for c in condensation.components)
@@ -0,0 +1,153 @@
+# aloof_union/tests/test_inputs.py
+import gzip
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from aloof_union.cli import cli
+from aloof_union.core import inputs
+from aloof_union.core.batch import convert_directory, convert_file
+from aloof_union.core.cache import TranspileCache
+from aloof_union.core.inputs import MappedFile, detect_compression, open_input
+from aloof_union.core.models import AutomationType
+from aloof_union.core.parsers import FreshServiceParser, JSMParser, MermaidParser
+from aloof_union.core.transpilers import WorkflowTranspiler
+
+FS, JSM, MERMAID = (
+    AutomationType.FRESHSERVICE,
+    AutomationType.JSM,
+    AutomationType.MERMAID,
+)
+
+
+class TestOpenInput:
+    def test_uncompressed_is_memory_mapped(self, tmp_path):
+        path = tmp_path / "in.mmd"
+        path.write_bytes(b"first\nsecond\n")
+
+        with open_input(path) as fp:
+            assert isinstance(fp, MappedFile)
+            assert fp.readline() == b"first\n"
+            assert fp.readline(3) == b"sec"
+            assert fp.tell() == 9
+            assert fp.read() == b"ond\n"
+            assert fp.seek(0) == 0
+            assert list(fp) == [b"first\n", b"second\n"]
+            assert bytes(fp.getbuffer()[:5]) == b"first"
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.json"
+        path.write_bytes(b"")
+
+        with open_input(path) as fp:
+            assert fp.read() == b""
+
+    def test_gzip_detected_by_content(self, tmp_path):
+        path = tmp_path / "export.json"
+        path.write_bytes(gzip.compress(b'{"a": 1}'))
+
+        with open_input(path) as fp:
+            assert json.load(fp) == {"a": 1}
+
+    def test_detect_compression(self):
+        assert detect_compression(gzip.compress(b"x")) == "gzip"
+        assert detect_compression(inputs.ZSTD_MAGIC + b"\x00") == "zstd"
+        assert detect_compression(b"{}") is None
+
+    def test_zstd_needs_optional_dependency(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(inputs, "zstandard", None)
+        path = tmp_path / "export.json.zst"
+        path.write_bytes(inputs.ZSTD_MAGIC + b"\x00" * 8)
+
+        with pytest.raises(ImportError, match="zstandard"):
+            open_input(path)
+
+    def test_zstd(self, tmp_path, simple_mermaid_workflow):
+        zstandard = pytest.importorskip("zstandard")
+        path = tmp_path / "export.mmd.zst"
+        path.write_bytes(
+            zstandard.ZstdCompressor().compress(simple_mermaid_workflow.encode())
+        )
+
+        with open_input(path) as fp:
+            workflow = MermaidParser().parse_stream(fp)
+
+        assert workflow == MermaidParser().parse(simple_mermaid_workflow)
+
+
+class TestBinaryParsing:
+    @pytest.mark.parametrize(
+        "parser, fixture",
+        [
+            (FreshServiceParser(), "simple_fs_workflow"),
+            (JSMParser(), "simple_jsm_workflow"),
+            (MermaidParser(), "simple_mermaid_workflow"),
+        ],
+    )
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_parsers_read_bytes(self, request, tmp_path, parser, fixture, compress):
+        content = request.getfixturevalue(fixture)
+        text = content if isinstance(content, str) else json.dumps(content)
+        data = text.encode("utf-8")
+        path = tmp_path / "export"
+        path.write_bytes(gzip.compress(data) if compress else data)
+
+        with open_input(path) as fp:
+            workflow = parser.parse_stream(fp)
+
+        assert workflow == parser.parse(content)
+
+
+class TestCompressedConversion:
+    def test_convert_file(self, tmp_path, simple_jsm_workflow):
+        source = tmp_path / "export.json.gz"
+        source.write_bytes(gzip.compress(json.dumps(simple_jsm_workflow).encode()))
+        target = tmp_path / "out.json"
+
+        convert_file(WorkflowTranspiler(), source, target, JSM, FS)
+
+        assert set(json.loads(target.read_text())["states"]) == {
+            "Open",
+            "In Progress",
+            "Done",
+        }
+
+    def test_cached_mapped_input(self, tmp_path, simple_fs_workflow):
+        source = tmp_path / "export.json"
+        source.write_text(json.dumps(simple_fs_workflow))
+        cache = TranspileCache(tmp_path / "cache")
+        transpiler = WorkflowTranspiler(cache=cache)
+
+        convert_file(transpiler, source, tmp_path / "a.mmd", FS, MERMAID)
+        convert_file(transpiler, source, tmp_path / "b.mmd", FS, MERMAID)
+
+        assert len(list(cache._entries())) == 1
+        assert (tmp_path / "a.mmd").read_text() == (tmp_path / "b.mmd").read_text()
+
+    def test_convert_directory_strips_suffix(self, tmp_path, simple_fs_workflow):
+        inputs_dir = tmp_path / "in"
+        inputs_dir.mkdir()
+        (inputs_dir / "a.json.gz").write_bytes(
+            gzip.compress(json.dumps(simple_fs_workflow).encode())
+        )
+
+        results = convert_directory(
+            inputs_dir, tmp_path / "out", FS, MERMAID, workers=1, pattern="*.gz"
+        )
+
+        assert [r.ok for r in results] == [True]
+        assert not (tmp_path / "out" / "a.json.mmd").exists()
+        assert "stateDiagram-v2" in (tmp_path / "out" / "a.mmd").read_text()
+
+    def test_cli_convert(self, tmp_path, simple_fs_workflow):
+        source = tmp_path / "export.json.gz"
+        source.write_bytes(gzip.compress(json.dumps(simple_fs_workflow).encode()))
+        target = tmp_path / "out.json"
+
+        result = CliRunner().invoke(
+            cli, ["convert", str(source), str(target), "-f", "fs", "-t", "jsm"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert len(json.loads(target.read_text())["statuses"]) == 3
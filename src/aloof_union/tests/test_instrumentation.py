@@ -0,0 +1,164 @@
+# aloof_union/tests/test_instrumentation.py
+import io
+import json
+
+from click.testing import CliRunner
+
+from aloof_union.cli import cli
+from aloof_union.core.instrumentation import (
+    StageProfile,
+    TranspileObserver,
+    WorkflowCounts,
+)
+from aloof_union.core.models import AutomationType
+from aloof_union.core.transpilers import WorkflowTranspiler
+
+FS, JSM, MERMAID = (
+    AutomationType.FRESHSERVICE,
+    AutomationType.JSM,
+    AutomationType.MERMAID,
+)
+
+
+class RecordingObserver(TranspileObserver):
+    def __init__(self):
+        self.events = []
+
+    def stage_started(self, stage):
+        self.events.append(("start", stage))
+
+    def stage_finished(self, stage, seconds):
+        assert seconds >= 0
+        self.events.append(("end", stage))
+
+    def workflow_parsed(self, counts):
+        self.events.append(("counts", counts))
+
+    def transpile_finished(self, input_bytes, output_bytes):
+        self.events.append(("sizes", input_bytes, output_bytes))
+
+
+class TestObserver:
+    def test_stage_events(self, simple_fs_workflow):
+        observer = RecordingObserver()
+        result = WorkflowTranspiler(observer=observer).transpile(
+            simple_fs_workflow, FS, MERMAID
+        )
+
+        assert observer.events == [
+            ("start", "parse"),
+            ("end", "parse"),
+            ("counts", WorkflowCounts(3, 2, 2, 2)),
+            ("start", "validate"),
+            ("end", "validate"),
+            ("start", "serialize"),
+            ("end", "serialize"),
+            ("sizes", None, len(result.encode("utf-8"))),
+        ]
+
+    def test_direct_path_stages(self, simple_fs_workflow):
+        observer = RecordingObserver()
+        WorkflowTranspiler(validation="structural", observer=observer).transpile(
+            simple_fs_workflow, FS, JSM
+        )
+
+        stages = [e[1] for e in observer.events if e[0] == "end"]
+        assert stages == ["validate", "direct"]
+
+    def test_stream_byte_sizes(self, simple_fs_workflow):
+        profile = StageProfile()
+        content = json.dumps(simple_fs_workflow)
+        output = io.StringIO()
+
+        WorkflowTranspiler(observer=profile).transpile_stream(
+            io.StringIO(content), FS, MERMAID, output=output
+        )
+
+        assert profile.conversions == 1
+        assert profile.input_bytes == len(content)
+        assert profile.output_bytes == len(output.getvalue())
+        assert profile.transitions == 2
+        assert set(profile.seconds) == {"parse", "validate", "serialize"}
+
+    def test_stage_finished_on_error(self, invalid_workflow_no_initial):
+        observer = RecordingObserver()
+        try:
+            WorkflowTranspiler(observer=observer).transpile(
+                invalid_workflow_no_initial, FS, JSM
+            )
+        except Exception:
+            pass
+
+        assert observer.events[-1] == ("end", "validate")
+
+
+class TestStageProfile:
+    def test_merge_and_format(self):
+        a, b = StageProfile(), StageProfile()
+        a.stage_finished("parse", 1.0)
+        b.stage_finished("parse", 0.5)
+        b.stage_finished("serialize", 0.5)
+        b.workflow_parsed(WorkflowCounts(3, 2, 1, 1))
+        b.transpile_finished(10, 20)
+
+        a.merge(b)
+
+        assert a.seconds == {"parse": 1.5, "serialize": 0.5}
+        assert a.calls == {"parse": 2, "serialize": 1}
+        assert (a.states, a.input_bytes, a.output_bytes) == (3, 10, 20)
+        report = a.format()
+        assert "parse" in report and "75.0%" in report
+
+
+class TestProfileOption:
+    def test_convert_profile(self, tmp_path, simple_fs_workflow):
+        source = tmp_path / "in.json"
+        source.write_text(json.dumps(simple_fs_workflow))
+        dump = tmp_path / "convert.prof"
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "convert",
+                str(source),
+                str(tmp_path / "out.mmd"),
+                "-f",
+                "fs",
+                "-t",
+                "mermaid",
+                "--profile",
+                "--profile-dump",
+                str(dump),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "serialize" in result.output
+        assert dump.stat().st_size > 0
+
+    def test_convert_dir_profile(self, tmp_path, simple_fs_workflow):
+        inputs = tmp_path / "in"
+        inputs.mkdir()
+        for name in ("a.json", "b.json"):
+            (inputs / name).write_text(json.dumps(simple_fs_workflow))
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "convert-dir",
+                str(inputs),
+                str(tmp_path / "out"),
+                "-f",
+                "fs",
+                "-t",
+                "jsm",
+                "-j",
+                "1",
+                "--profile",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "2 conversions" in result.output
+        summary = json.loads((tmp_path / "out" / "summary.json").read_text())
+        assert "parse" in summary["files"][0]["profile"]["seconds"]
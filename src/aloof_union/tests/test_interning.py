@@ -0,0 +1,159 @@
+# aloof_union/tests/test_interning.py
+import copy
+import json
+import pickle
+
+import pytest
+
+from aloof_union.core import binary
+from aloof_union.core.compact import compact_workflow
+from aloof_union.core.interning import (
+    FlyweightPool,
+    FrozenAction,
+    FrozenCondition,
+    FrozenDict,
+    FrozenList,
+    intern_workflow,
+    value_identity,
+)
+from aloof_union.core.models import Action, Condition
+from aloof_union.core.parsers import FreshServiceParser, JSMParser
+
+
+@pytest.fixture
+def repetitive_jsm_workflow():
+    """JSM export whose rules all share two configurations."""
+    statuses = [{"name": f"S{i}", "statusCategory": "TO_DO"} for i in range(20)]
+    rules = [
+        {
+            "fromStatus": f"S{i}",
+            "toStatus": f"S{(i + 1) % 20}",
+            "conditions": [
+                {"field": {"name": "priority"}, "operator": "in", "value": ["P1"]}
+            ],
+            "postFunctions": [
+                {"type": "notify", "configuration": {"to": ["agent"], "n": i % 2}}
+            ],
+        }
+        for i in range(100)
+    ]
+    return {"statuses": statuses, "rules": rules}
+
+
+class TestFrozenValues:
+    def test_frozen_dict(self):
+        frozen = FrozenDict({"a": FrozenList([1, 2])})
+
+        assert frozen == {"a": [1, 2]}
+        assert hash(frozen) == hash(FrozenDict({"a": FrozenList([1, 2])}))
+        assert json.dumps(frozen) == '{"a": [1, 2]}'
+        assert copy.deepcopy(frozen) is frozen
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+        with pytest.raises(TypeError):
+            frozen["b"] = 1
+        with pytest.raises(TypeError):
+            frozen["a"].append(3)
+
+    def test_frozen_condition_and_action(self):
+        condition = FrozenCondition("priority", "==", "P1")
+        action = FrozenAction("notify", FrozenDict(to="agent"))
+
+        assert condition == Condition("priority", "==", "P1")
+        assert Condition("priority", "==", "P1") == condition
+        assert action == Action("notify", {"to": "agent"})
+        assert len({condition, FrozenCondition("priority", "==", "P1")}) == 1
+        assert pickle.loads(pickle.dumps(action)) == action
+        with pytest.raises(AttributeError):
+            condition.value = "P2"
+
+
+class TestFlyweightPool:
+    def test_equal_values_are_shared(self):
+        pool = FlyweightPool()
+        first = pool.action("notify", {"to": ["agent"]})
+        second = pool.action("notify", {"to": ["agent"]})
+
+        assert first is second
+        assert isinstance(first.parameters, FrozenDict)
+        assert pool.stats.action_ratio == 2.0
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [(True, 1), (1, 1.0), ({"x": 1, "y": 2}, {"y": 2, "x": 1}), ([1], (1,))],
+    )
+    def test_serialization_differences_not_merged(self, a, b):
+        pool = FlyweightPool()
+
+        first = pool.condition("f", "==", a)
+        second = pool.condition("f", "==", b)
+
+        assert first is not second
+        assert json.dumps(first.value) == json.dumps(a)
+        assert value_identity(a) != value_identity(b)
+        assert hash(value_identity(a)) == hash(value_identity(copy.deepcopy(a)))
+
+    def test_lists_shared(self):
+        pool = FlyweightPool()
+        conditions = [pool.condition("f", "==", 1)]
+
+        assert pool.share(conditions) is pool.share(list(conditions))
+        assert pool.share([]) is not pool.share(conditions)
+
+
+class TestInterning:
+    def test_jsm_parser(self, repetitive_jsm_workflow):
+        pool = FlyweightPool()
+        plain = JSMParser().parse(repetitive_jsm_workflow)
+
+        interned = JSMParser(pool=pool).parse(repetitive_jsm_workflow)
+
+        assert interned == plain
+        assert JSMParser().serialize(interned) == JSMParser().serialize(plain)
+        first, second, third = interned.transitions[:3]
+        assert first.conditions is second.conditions
+        assert first.actions is third.actions
+        assert first.actions is not second.actions
+        assert pool.stats.conditions == 100
+        assert pool.stats.unique_conditions == 1
+        assert pool.stats.unique_actions == 2
+        assert pool.stats.condition_ratio == 100.0
+        assert "conditions" in pool.stats.format()
+
+    def test_fresh_service_parser(self, complex_fs_workflow):
+        parser = FreshServiceParser()
+        plain = parser.parse(complex_fs_workflow)
+
+        interned = FreshServiceParser(pool=FlyweightPool()).parse(complex_fs_workflow)
+
+        assert interned == plain
+        assert json.dumps(parser.serialize(interned)) == json.dumps(
+            parser.serialize(plain)
+        )
+
+    def test_intern_workflow(self, unified_workflow):
+        expected = copy.deepcopy(unified_workflow)
+
+        pool = intern_workflow(unified_workflow)
+
+        assert unified_workflow == expected
+        assert all(
+            isinstance(c, FrozenCondition)
+            for t in unified_workflow.transitions
+            for c in t.conditions
+        )
+        assert pool.stats.conditions == sum(
+            len(t.conditions) for t in expected.transitions
+        )
+
+    def test_intern_compact_workflow(self, unified_workflow):
+        compact = compact_workflow(unified_workflow)
+
+        intern_workflow(compact)
+
+        assert compact.transitions == unified_workflow.transitions
+        assert isinstance(compact.transitions[0].actions[0], FrozenAction)
+
+    def test_binary_round_trip(self, repetitive_jsm_workflow):
+        workflow = JSMParser(pool=FlyweightPool()).parse(repetitive_jsm_workflow)
+
+        assert binary.loads(binary.dumps(workflow)) == workflow
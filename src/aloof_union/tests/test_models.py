@@ -0,0 +1,218 @@
+# aloof_union/tests/test_models.py
+import copy
+import pickle
+from dataclasses import asdict, fields
+
+import pytest
+
+from aloof_union.core.analysis import Reachability
+from aloof_union.core.compact import StateTable, TransitionTable, compact_workflow
+from aloof_union.core.models import (
+    Action,
+    Condition,
+    StateProperties,
+    Transition,
+    UnifiedWorkflow,
+    WorkflowState,
+)
+from aloof_union.core.parsers import FreshServiceParser, JSMParser
+from aloof_union.core.routing import RoutingEngine
+
+
+class TestSlottedModels:
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            Condition("assignee", "is not", None),
+            Action("notify", {}),
+            Transition("New", "Done", [], []),
+            WorkflowState("New"),
+        ],
+    )
+    def test_no_instance_dict(self, instance):
+        assert not hasattr(instance, "__dict__")
+        assert pickle.loads(pickle.dumps(instance)) == instance
+
+    def test_state_names_are_interned(self):
+        name = "".join(["In ", "Progress"])
+        transition = Transition("New", name, [], [])
+        state = WorkflowState("".join(["In ", "Progress"]))
+
+        assert transition.to_state is state.name
+
+    def test_defaults_preserved(self):
+        state = WorkflowState("New")
+
+        assert state.description is None
+        assert not state.is_initial
+        assert state.properties is None
+
+
+class TestStateProperties:
+    def test_writes_do_not_touch_base(self):
+        base = {"a": 1, "b": {"nested": True}}
+        properties = StateProperties(base)
+
+        properties["a"] = 2
+        properties["c"] = 3
+        del properties["b"]
+
+        assert base == {"a": 1, "b": {"nested": True}}
+        assert dict(properties) == {"a": 2, "c": 3}
+        assert properties.modified
+        assert "b" not in properties
+        with pytest.raises(KeyError):
+            del properties["b"]
+
+    def test_key_order_follows_base(self):
+        properties = StateProperties({"a": 1, "b": 2})
+
+        properties["z"] = 0
+        properties["a"] = 9
+
+        assert list(properties.items()) == [("a", 9), ("b", 2), ("z", 0)]
+        assert len(properties) == 3
+
+    def test_equality_copy_and_pickle(self):
+        base = {"a": [1]}
+        properties = StateProperties(base)
+        clone = copy.copy(properties)
+        clone["a"] = []
+
+        assert properties == base
+        assert clone.base is base
+        assert properties["a"] == [1]
+        assert pickle.loads(pickle.dumps(properties)) == properties
+        assert WorkflowState("New", properties=properties) == WorkflowState(
+            "New", properties=dict(base)
+        )
+
+
+class TestTransitionTable:
+    def test_behaves_like_a_list(self, unified_workflow):
+        table = TransitionTable(unified_workflow.transitions)
+
+        assert len(table) == 2
+        assert table == unified_workflow.transitions
+        assert table[-1] == unified_workflow.transitions[-1]
+        assert list(table.from_ids) == [0, 1]
+        assert list(table.to_ids) == [1, 2]
+
+        extra = Transition("Resolved", "New", [], [])
+        table.append(extra)
+        table[0] = extra
+        del table[1]
+        assert table == [extra, extra]
+        assert table.states.names == ["New", "In Progress", "Resolved"]
+
+    def test_state_table_ids_are_stable(self):
+        states = StateTable(["New", "Done"])
+
+        assert states.id_for("Done") == 1
+        assert states.id_for("Closed") == 2
+        assert len(states) == 3
+
+    @pytest.mark.parametrize("parser_cls", [FreshServiceParser, JSMParser])
+    def test_compact_workflow_serializes_identically(
+        self, parser_cls, complex_fs_workflow
+    ):
+        workflow = FreshServiceParser().parse(complex_fs_workflow)
+        for state in workflow.states.values():
+            state.properties = dict(state.properties, statusCategory="TO_DO")
+        compact = compact_workflow(workflow)
+
+        assert isinstance(compact, UnifiedWorkflow)
+        assert isinstance(compact.transitions, TransitionTable)
+        parser = parser_cls()
+        assert parser.serialize(compact) == parser.serialize(workflow)
+
+
+class TestWorkflowIndex:
+    def test_lookups(self, complex_fs_workflow):
+        workflow = FreshServiceParser().parse(complex_fs_workflow)
+        index = workflow.index
+
+        assert index.initial == ("New",)
+        assert index.terminal == ("Closed",)
+        assert index.successors("New") == ["Pending", "In Progress"]
+        assert index.predecessors("In Progress") == ["New", "Pending", "Under Review"]
+        assert len(index.outgoing["Under Review"]) == 2
+        assert index.transitions_between("Resolved", "Closed")[0].to_state == "Closed"
+        assert index.transitions_between("Closed", "New") == []
+        assert index.adjacency[index.ids["New"]] == [
+            index.ids["Pending"],
+            index.ids["In Progress"],
+        ]
+
+    def test_cached_until_mutated(self, unified_workflow):
+        index = unified_workflow.index
+        assert unified_workflow.index is index
+
+        unified_workflow.transitions.append(Transition("Resolved", "New", [], []))
+        rebuilt = unified_workflow.index
+        assert rebuilt is not index
+        assert rebuilt.successors("Resolved") == ["New"]
+
+        # Building unrelated objects is not an edit
+        Transition("New", "Resolved", [], [])
+        WorkflowState("Other", is_initial=True)
+        assert unified_workflow.index is rebuilt
+
+        unified_workflow.states["New"].is_initial = False
+        assert unified_workflow.index.initial == ()
+
+    def test_state_flag_edited_in_place(self):
+        states = {"A": WorkflowState("A", is_initial=True), "B": WorkflowState("B")}
+        workflow = UnifiedWorkflow(states, [Transition("A", "B", [], [])], {})
+        assert workflow.index.terminal == ()
+        assert not Reachability(workflow).can_terminate("A")
+
+        workflow.states["B"].is_terminal = True
+
+        assert workflow.index.terminal == ("B",)
+        assert Reachability(workflow).can_terminate("A")
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_transition_replaced_in_place(self, compact):
+        states = {"A": WorkflowState("A", is_initial=True), "B": WorkflowState("B")}
+        workflow = UnifiedWorkflow(states, [Transition("A", "B", [], [])], {})
+        if compact:
+            workflow = compact_workflow(workflow)
+        assert workflow.paths().distance("A", "B") == 1
+
+        workflow.transitions[0] = Transition("A", "A", [], [])
+
+        assert workflow.index.successors("A") == ["A"]
+        assert workflow.paths().distance("A", "B") is None
+        enabled = RoutingEngine(workflow).enabled({"status": "A"})
+        assert [(t.from_state, t.to_state) for t in enabled] == [("A", "A")]
+
+    def test_container_edits(self, unified_workflow):
+        index = unified_workflow.index
+
+        unified_workflow.states["Resolved"] = WorkflowState("Resolved")
+        assert unified_workflow.index.terminal == ()
+        unified_workflow.transitions.reverse()
+        assert unified_workflow.index.outgoing["New"] == [
+            unified_workflow.transitions[1]
+        ]
+        assert unified_workflow.index is not index
+
+    def test_not_a_field(self, unified_workflow):
+        unified_workflow.index
+        unified_workflow.paths()
+
+        assert [f.name for f in fields(unified_workflow)] == [
+            "states",
+            "transitions",
+            "metadata",
+        ]
+        assert list(asdict(unified_workflow)) == ["states", "transitions", "metadata"]
+        assert "_index" not in repr(unified_workflow)
+
+    def test_not_pickled(self, unified_workflow):
+        unified_workflow.index
+        restored = pickle.loads(pickle.dumps(unified_workflow))
+
+        assert restored._index is None
+        assert restored == unified_workflow
@@ -1,7 +1,11 @@
 # aloof_union/tests/test_parsers.py
+import io
+import json
+
 import pytest
 
 from aloof_union.core.parsers import FreshServiceParser, JSMParser, MermaidParser
+from aloof_union.core.parsers.mermaid import TokenKind, tokenize
 from aloof_union.exceptions import ParserError
 
 
@@ -40,6 +44,31 @@ class TestFreshServiceParser:
         assert len(result["states"]) == len(unified_workflow.states)
         assert len(result["transitions"]) == len(unified_workflow.transitions)
 
+    def test_round_trip_shares_untouched_properties(self):
+        metadata = {"sla": {"hours": 4}, "tags": ["vip"]}
+        content = {
+            "states": {
+                "New": {"is_initial": True, "meta": metadata},
+                "Done": {"is_terminal": True},
+            },
+            "transitions": [],
+        }
+        parser = FreshServiceParser()
+        workflow = parser.parse(content)
+
+        workflow.states["New"].properties["owner"] = "ops"
+        workflow.states["Done"].description = "Closed out"
+        result = parser.serialize(workflow)
+
+        assert content["states"]["New"] == {"is_initial": True, "meta": metadata}
+        assert result["states"]["New"]["meta"] is metadata
+        assert result["states"]["New"]["owner"] == "ops"
+        assert result["states"]["Done"] == {
+            "description": "Closed out",
+            "is_initial": False,
+            "is_terminal": True,
+        }
+
 
 class TestJSMParser:
     def test_parse_simple_workflow(self, simple_jsm_workflow):
@@ -70,6 +99,26 @@ class TestJSMParser:
         assert len(result["statuses"]) == len(unified_workflow.states)
         assert len(result["rules"]) == len(unified_workflow.transitions)
 
+    @pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+    def test_parse_stream_matches_parse(self, simple_jsm_workflow, chunk_size):
+        parser = JSMParser()
+        document = json.dumps({"project": {"key": "IT"}, **simple_jsm_workflow})
+
+        streamed = parser.parse_stream(io.StringIO(document), chunk_size=chunk_size)
+        binary = parser.parse_stream(
+            io.BytesIO(document.encode("utf-8")), chunk_size=chunk_size
+        )
+
+        assert streamed == parser.parse(simple_jsm_workflow)
+        assert binary == streamed
+
+    def test_parse_stream_malformed(self, simple_jsm_workflow):
+        parser = JSMParser()
+        document = json.dumps(simple_jsm_workflow)[:-20]
+
+        with pytest.raises(ParserError):
+            parser.parse_stream(io.StringIO(document), chunk_size=16)
+
 
 class TestMermaidParser:
     def test_parse_simple_workflow(self, simple_mermaid_workflow):
@@ -105,3 +154,48 @@ class TestMermaidParser:
         assert "[*] -->" in result  # Initial state transition
         assert "-->" in result  # Regular transitions
         assert "note right of" in result  # State descriptions
+
+    def test_parse_file_object(self, complex_mermaid_workflow):
+        parser = MermaidParser()
+        expected = parser.parse(complex_mermaid_workflow)
+
+        assert parser.parse_stream(io.StringIO(complex_mermaid_workflow)) == expected
+        assert parser.parse(complex_mermaid_workflow.splitlines()) == expected
+
+    def test_tokenize_keeps_line_numbers(self, simple_mermaid_workflow):
+        tokens = list(tokenize(simple_mermaid_workflow))
+
+        assert tokens[0].kind is TokenKind.HEADER
+        assert tokens[0].lineno == 2
+        transition = tokens[2]
+        assert transition.kind is TokenKind.TRANSITION
+        assert transition.lineno == 4
+        assert transition.args == ("New", "InProgress", ["assignee set"])
+
+    def test_invalid_transition_reports_line(self):
+        parser = MermaidParser()
+        with pytest.raises(ParserError, match="Line 3"):
+            parser.parse("stateDiagram-v2\n    A --> B\n    B --> C --> D\n")
+
+
+class TestSerializeTo:
+    @pytest.mark.parametrize("parser_cls", [FreshServiceParser, JSMParser])
+    def test_json_output_matches_json_dump(
+        self, parser_cls, complex_fs_workflow, unified_workflow
+    ):
+        parser = parser_cls()
+        for state in unified_workflow.states.values():
+            state.properties = {"statusCategory": "DONE"}
+        workflows = [FreshServiceParser().parse(complex_fs_workflow), unified_workflow]
+
+        for workflow in workflows:
+            out = io.StringIO()
+            parser.serialize_to(workflow, out)
+            assert out.getvalue() == json.dumps(parser.serialize(workflow), indent=2)
+
+    def test_mermaid_output_matches_serialize(self, unified_workflow):
+        parser = MermaidParser()
+        out = io.StringIO()
+        parser.serialize_to(unified_workflow, out)
+
+        assert out.getvalue() == parser.serialize(unified_workflow)
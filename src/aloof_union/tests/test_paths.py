@@ -0,0 +1,141 @@
+# aloof_union/tests/test_paths.py
+import pickle
+
+import pytest
+
+from aloof_union.core.analysis import PathAnalysis, action_cost
+from aloof_union.core.models import Transition
+from aloof_union.core.parsers import FreshServiceParser
+from aloof_union.tests.conftest import make_workflow
+
+
+@pytest.fixture
+def sla_workflow():
+    """Two routes from Open to Closed, the shorter one slower."""
+    return make_workflow(
+        [
+            ("Open", "Triage", 1),
+            ("Triage", "Fixing", 1),
+            ("Fixing", "Closed", 1),
+            ("Open", "Escalated", 10),
+            ("Escalated", "Closed", 10),
+            ("Closed", "Reopened", 1),
+            ("Reopened", "Fixing", 1),
+        ],
+        initial=["Open"],
+        terminal=["Closed"],
+    )
+
+
+class TestShortestPaths:
+    def test_hops(self, sla_workflow):
+        paths = sla_workflow.paths()
+
+        assert paths.distance("Open", "Closed") == 2
+        assert paths.shortest_path("Open", "Closed") == ["Open", "Escalated", "Closed"]
+        assert paths.distances("Fixing") == {
+            "Fixing": 0,
+            "Closed": 1,
+            "Reopened": 2,
+        }
+        assert paths.distance("Closed", "Open") is None
+        assert paths.shortest_path("Closed", "Open") is None
+
+    def test_action_costs(self, sla_workflow):
+        paths = sla_workflow.paths(action_cost())
+
+        assert paths.distance("Open", "Closed") == 3
+        assert paths.shortest_path("Open", "Closed") == [
+            "Open",
+            "Triage",
+            "Fixing",
+            "Closed",
+        ]
+
+    def test_side_table(self, sla_workflow):
+        paths = PathAnalysis(
+            sla_workflow, {("Open", "Escalated"): 0.5}, default_cost=2.0
+        )
+
+        assert paths.distance("Open", "Closed") == 2.5
+
+    def test_cheapest_parallel_transition(self):
+        workflow = make_workflow([("A", "B", 5), ("A", "B", 2), ("A", "B")])
+
+        assert workflow.paths(action_cost(default=9)).distance("A", "B") == 2
+
+    def test_negative_cost(self):
+        workflow = make_workflow([("A", "B", -1)])
+
+        with pytest.raises(ValueError, match="A -> B has invalid cost -1.0"):
+            workflow.paths(action_cost())
+
+    def test_initial_to_terminal(self, complex_fs_workflow):
+        workflow = FreshServiceParser().parse(complex_fs_workflow)
+
+        hops = workflow.paths().initial_to_terminal()
+
+        assert hops == {("New", "Closed"): workflow.paths().distance("New", "Closed")}
+        assert hops[("New", "Closed")] >= 1
+
+    def test_all_pairs(self, sla_workflow):
+        paths = sla_workflow.paths()
+
+        every = paths.all_pairs()
+
+        assert list(every) == list(sla_workflow.states)
+        for source, distances in every.items():
+            assert distances == paths.distances(source)
+
+    def test_all_pairs_in_worker_processes(self, sla_workflow):
+        expected = sla_workflow.paths(action_cost()).all_pairs()
+
+        assert sla_workflow.paths(action_cost()).all_pairs(workers=2) == expected
+
+    def test_unknown_state(self, sla_workflow):
+        with pytest.raises(KeyError, match="Unknown state: Nowhere"):
+            sla_workflow.paths().distances("Nowhere")
+
+
+class TestCriticalPath:
+    def test_skips_cycles(self, sla_workflow):
+        assert sla_workflow.paths().critical_path() == (
+            3,
+            ["Open", "Triage", "Fixing", "Closed"],
+        )
+        assert sla_workflow.paths(action_cost()).critical_path() == (
+            20,
+            ["Open", "Escalated", "Closed"],
+        )
+
+    def test_without_initial_or_terminal_states(self):
+        workflow = make_workflow([("A", "B"), ("B", "C"), ("X", "C")])
+
+        assert workflow.paths().critical_path() == (2, ["A", "B", "C"])
+
+    def test_no_path(self):
+        workflow = make_workflow([("A", "B")], initial=["B"], terminal=["A"])
+
+        assert workflow.paths().critical_path() == (0, [])
+
+
+class TestCaching:
+    def test_hop_analysis_cached_with_index(self, sla_workflow):
+        paths = sla_workflow.paths()
+        paths.distances("Open")
+
+        assert sla_workflow.paths() is paths
+        assert sla_workflow.paths(action_cost()) is not paths
+
+        sla_workflow.transitions.append(Transition("Open", "Closed", [], []))
+
+        assert sla_workflow.paths() is not paths
+        assert sla_workflow.paths().distance("Open", "Closed") == 1
+
+    def test_not_pickled(self, sla_workflow):
+        sla_workflow.paths().distances("Open")
+
+        restored = pickle.loads(pickle.dumps(sla_workflow))
+
+        assert restored._paths is None
+        assert restored == sla_workflow
@@ -0,0 +1,102 @@
+# aloof_union/tests/test_reachability.py
+import itertools
+import random
+
+import pytest
+
+from aloof_union.core.analysis import Reachability
+from aloof_union.core.analysis.reachability import reachable_ids
+from aloof_union.core.parsers import FreshServiceParser
+from aloof_union.tests.conftest import make_workflow
+
+
+def naive_reach(workflow, source):
+    """States reachable from ``source`` in one or more steps."""
+    index = workflow.index
+    found = set()
+    frontier = index.successors(source)
+    while frontier:
+        state = frontier.pop()
+        if state not in found:
+            found.add(state)
+            frontier.extend(index.successors(state))
+    return found
+
+
+class TestReachability:
+    def test_matches_naive_search(self):
+        rng = random.Random(3)
+        names = [f"S{i:02d}" for i in range(40)]
+        edges = [tuple(rng.sample(names, 2)) for _ in range(60)]
+        edges += [("S05", "S05")]
+        workflow = make_workflow(edges)
+
+        reach = Reachability(workflow)
+
+        for a, b in itertools.product(workflow.states, repeat=2):
+            assert reach.can_reach(a, b) is (b in naive_reach(workflow, a)), (a, b)
+        for name in workflow.states:
+            reached = naive_reach(workflow, name)
+            assert reach.reachable_from(name) == [
+                a for a in workflow.states if a in reached
+            ]
+            assert reach.reaching(name) == [
+                a for a in workflow.states if name in naive_reach(workflow, a)
+            ]
+
+    def test_self_reach_needs_cycle(self):
+        reach = Reachability(make_workflow([("A", "B"), ("B", "B")]))
+
+        assert not reach.can_reach("A", "A")
+        assert reach.can_reach("B", "B")
+        assert reach.reaching("B") == ["A", "B"]
+
+    def test_fresh_service_fixture(self, complex_fs_workflow):
+        reach = Reachability(FreshServiceParser().parse(complex_fs_workflow))
+
+        assert reach.can_reach("New", "Closed")
+        assert not reach.can_reach("Closed", "New")
+        assert reach.unreachable() == []
+        assert reach.can_terminate("Pending")
+
+    def test_dead_ends_and_traps(self):
+        workflow = make_workflow(
+            [("A", "B"), ("A", "C"), ("A", "F"), ("C", "D"), ("D", "C"), ("E", "A")],
+            initial=["A"],
+            terminal=["F"],
+        )
+
+        reach = Reachability(workflow)
+
+        assert reach.unreachable() == ["E"]
+        assert reach.dead_ends() == ["B"]
+        assert reach.traps() == ["C", "D"]
+        assert reach.can_terminate("E")
+        assert not reach.can_terminate("D")
+
+    def test_no_terminal_states_means_no_traps(self):
+        reach = Reachability(make_workflow([("A", "B"), ("B", "A")], initial=["A"]))
+
+        assert reach.traps() == []
+        assert not reach.can_terminate("A")
+
+    def test_unknown_state(self):
+        reach = Reachability(make_workflow([("A", "B")]))
+
+        with pytest.raises(KeyError, match="Unknown state: Z"):
+            reach.can_reach("A", "Z")
+
+    def test_long_chain(self):
+        names = [f"S{i}" for i in range(5000)]
+        reach = Reachability(make_workflow(list(zip(names, names[1:]))))
+
+        assert reach.can_reach("S0", "S4999")
+        assert not reach.can_reach("S4999", "S0")
+
+
+class TestReachableIds:
+    def test_sweep_includes_sources(self):
+        adjacency = [[1], [2], [], [0]]
+
+        assert reachable_ids(adjacency, [1]) == [False, True, True, False]
+        assert reachable_ids(adjacency, [3, 3]) == [True] * 4
@@ -0,0 +1,166 @@
+# aloof_union/tests/test_registry.py
+import json
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from aloof_union.cli import cli
+from aloof_union.core import registry as registry_module
+from aloof_union.core.models import AutomationType
+from aloof_union.core.parsers import get_parser
+from aloof_union.core.parsers.freshservice import FreshServiceParser
+from aloof_union.core.registry import ParserRegistry, registry
+from aloof_union.core.transpilers import WorkflowTranspiler
+from aloof_union.exceptions import TranspilerError
+
+
+class NamesParser(FreshServiceParser):
+    """Fresh Service JSON that only keeps state names, as a stand-in plugin."""
+
+    extension = ".names"
+
+    def serialize(self, workflow):
+        return "\n".join(workflow.states) + "\n"
+
+    def serialize_to(self, workflow, fp):
+        fp.write(self.serialize(workflow))
+
+
+class FakeEntryPoint:
+    def __init__(self, name, target):
+        self.name = name
+        self.target = target
+        self.loaded = False
+
+    def load(self):
+        self.loaded = True
+        return self.target
+
+
+@pytest.fixture
+def plugin_registry(monkeypatch):
+    """The default registry, restored after the test."""
+    for attr in ("_specs", "_names", "_parsers"):
+        monkeypatch.setattr(registry, attr, dict(getattr(registry, attr)))
+    return registry
+
+
+class TestParserRegistry:
+    def test_builtins_and_aliases(self):
+        assert registry.resolve("fs") is AutomationType.FRESHSERVICE
+        assert registry.resolve("JSM") is AutomationType.JSM
+        assert get_parser("fs") is get_parser(AutomationType.FRESHSERVICE)
+        assert {"freshservice", "jsm", "mermaid"} <= set(registry.names())
+
+    def test_unknown_format(self):
+        empty = ParserRegistry(entry_point_group=None)
+
+        with pytest.raises(KeyError):
+            empty.get("servicenow")
+        assert "servicenow" not in empty
+
+    def test_reference_imported_on_first_use(self, monkeypatch):
+        monkeypatch.delitem(sys.modules, "aloof_union.core.parsers.jsm", raising=False)
+        reg = ParserRegistry(entry_point_group=None)
+        reg.register("jira", "aloof_union.core.parsers.jsm:JSMParser")
+
+        assert "aloof_union.core.parsers.jsm" not in sys.modules
+        parser = reg.get("jira")
+        assert type(parser).__name__ == "JSMParser"
+        assert reg.get("jira") is parser
+
+    def test_duplicate_registration(self):
+        reg = ParserRegistry(entry_point_group=None)
+        reg.register("names", NamesParser, aliases=["nm"])
+
+        with pytest.raises(ValueError, match="already registered"):
+            reg.register("other", NamesParser, aliases=["nm"])
+        reg.register("names", FreshServiceParser, replace=True)
+        assert type(reg.get("nm")) is FreshServiceParser
+
+    def test_entry_points_loaded_lazily(self, monkeypatch):
+        ep = FakeEntryPoint("names", NamesParser)
+        calls = []
+        monkeypatch.setattr(
+            registry_module, "_entry_points", lambda group: calls.append(group) or [ep]
+        )
+        reg = ParserRegistry()
+        reg.register(AutomationType.JSM, "aloof_union.core.parsers.jsm:JSMParser")
+
+        reg.get("jsm")
+        assert calls == []
+        assert reg.names() == ["jsm", "names"]
+        assert calls == ["aloof_union.parsers"] and not ep.loaded
+        assert isinstance(reg.get("names"), NamesParser)
+        assert ep.loaded
+
+    def test_entry_point_does_not_shadow_registered_format(self, monkeypatch):
+        ep = FakeEntryPoint("jsm", NamesParser)
+        monkeypatch.setattr(registry_module, "_entry_points", lambda group: [ep])
+        reg = ParserRegistry()
+        reg.register(AutomationType.JSM, FreshServiceParser)
+
+        reg.discover()
+        assert type(reg.get("jsm")) is FreshServiceParser
+
+
+class TestPluginFormats:
+    def test_transpile_by_name(self, simple_fs_workflow):
+        transpiler = WorkflowTranspiler()
+
+        assert transpiler.transpile(simple_fs_workflow, "fs", "jsm") == (
+            transpiler.transpile(
+                simple_fs_workflow, AutomationType.FRESHSERVICE, AutomationType.JSM
+            )
+        )
+        with pytest.raises(TranspilerError, match="Unsupported format"):
+            transpiler.transpile(simple_fs_workflow, "fs", "servicenow")
+
+    def test_registered_plugin(self, plugin_registry, simple_fs_workflow):
+        plugin_registry.register("names", NamesParser)
+
+        result = WorkflowTranspiler().transpile(simple_fs_workflow, "fs", "names")
+
+        assert result == "New\nIn Progress\nResolved\n"
+
+    def test_cli_accepts_plugin_format(
+        self, plugin_registry, tmp_path, simple_fs_workflow
+    ):
+        plugin_registry.register("names", NamesParser)
+        inputs = tmp_path / "in"
+        inputs.mkdir()
+        (inputs / "a.json").write_text(json.dumps(simple_fs_workflow))
+        runner = CliRunner()
+
+        result = runner.invoke(
+            cli,
+            ["convert-dir", str(inputs), str(tmp_path / "out")]
+            + ["-f", "fs", "-t", "names", "-j", "1"],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert (tmp_path / "out" / "a.names").read_text().startswith("New\n")
+
+    def test_cli_help_skips_entry_points(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(
+            registry_module, "_entry_points", lambda group: calls.append(group) or []
+        )
+        monkeypatch.setattr(registry, "_discovered", False)
+
+        result = CliRunner().invoke(cli, ["convert", "--help"])
+
+        assert "[freshservice|jsm|mermaid|fs|...]" in result.output
+        assert calls == []
+
+    def test_cli_rejects_unknown_format(self, tmp_path):
+        source = tmp_path / "in.json"
+        source.write_text("{}")
+
+        result = CliRunner().invoke(
+            cli, ["convert", str(source), "out", "-f", "servicenow", "-t", "jsm"]
+        )
+
+        assert result.exit_code == 2
+        assert "not a known format" in result.output
@@ -0,0 +1,154 @@
+# aloof_union/tests/test_routing.py
+import pytest
+
+from aloof_union.core.models import Condition, Transition, UnifiedWorkflow
+from aloof_union.core.parsers import FreshServiceParser, JSMParser
+from aloof_union.core.routing import (
+    OPERATORS,
+    RoutingEngine,
+    compile_condition,
+    operators,
+    register_operator,
+)
+from aloof_union.exceptions import RoutingError
+
+
+def targets(transitions):
+    return [t.to_state for t in transitions]
+
+
+class TestOperators:
+    @pytest.mark.parametrize(
+        "operator, value, ticket, expected",
+        [
+            ("equals", True, {"f": True}, True),
+            ("equals", True, {}, False),
+            ("is not", None, {"f": "bob"}, True),
+            ("is not", None, {}, False),
+            ("not equals", 1, {"f": 2}, True),
+            ("exists", True, {"f": 0}, True),
+            ("exists", True, {"f": None}, False),
+            ("exists", False, {}, True),
+            ("is not empty", None, {"f": []}, False),
+            ("is not empty", None, {"f": "x"}, True),
+            ("is empty", None, {}, True),
+            ("in", ["P1", "P2"], {"f": "P2"}, True),
+            ("in", ["P1"], {"f": ["P1"]}, False),
+            ("not in", ["P1"], {"f": "P3"}, True),
+            ("contains", "urgent", {"f": "very urgent"}, True),
+            ("contains", "x", {"f": 5}, False),
+            ("greater than", 3, {"f": 4}, True),
+            ("<=", 3, {"f": "a"}, False),
+            ("matches", r"^INC-\d+$", {"f": "INC-42"}, True),
+            ("starts with", "INC", {"f": None}, False),
+        ],
+    )
+    def test_operator(self, operator, value, ticket, expected):
+        assert compile_condition("f", operator, value)(ticket) is expected
+
+    def test_names_normalized(self):
+        predicate = compile_condition("f", "IS_NOT_EMPTY", None)
+
+        assert predicate({"f": "x"})
+
+    def test_unknown_operator(self):
+        with pytest.raises(RoutingError, match="'roughly'"):
+            compile_condition("f", "roughly", 1)
+
+    def test_register_operator(self, monkeypatch):
+        monkeypatch.setattr(operators, "OPERATORS", dict(OPERATORS))
+
+        register_operator(
+            "Is Odd", lambda field, value: lambda t: t.get(field, 0) % 2 == 1
+        )
+
+        assert compile_condition("n", "is odd", None)({"n": 3})
+        with pytest.raises(ValueError, match="already registered"):
+            register_operator("IS_ODD", OPERATORS["equals"])
+        assert "is odd" not in OPERATORS
+
+
+class TestRoutingEngine:
+    def test_fresh_service_fixture(self, complex_fs_workflow):
+        engine = RoutingEngine(FreshServiceParser().parse(complex_fs_workflow))
+
+        assert targets(
+            engine.enabled({"status": "New", "assignee": "bob", "priority": 2})
+        ) == ["In Progress"]
+        assert targets(engine.enabled({"status": "New", "info_required": True})) == [
+            "Pending"
+        ]
+        assert engine.enabled({"status": "Closed"}) == []
+
+    def test_jsm_fixture(self, simple_jsm_workflow):
+        engine = RoutingEngine(JSMParser().parse(simple_jsm_workflow))
+
+        assert engine.enabled({"status": "Open"}) == []
+        assert targets(engine.enabled({"status": "Open", "assignee": "amy"})) == [
+            "In Progress"
+        ]
+
+    def test_route_batch(self, complex_fs_workflow):
+        engine = RoutingEngine(FreshServiceParser().parse(complex_fs_workflow))
+        tickets = [
+            {"status": "Under Review", "review_passed": True},
+            {"status": "Under Review", "review_passed": False},
+            {"status": "Pending"},
+        ]
+
+        assert [targets(r) for r in engine.route(tickets)] == [
+            ["Resolved"],
+            ["In Progress"],
+            [],
+        ]
+
+    def test_state_field_and_explicit_state(self):
+        workflow = UnifiedWorkflow(
+            {}, [Transition("A", "B", [], []), Transition("A", "C", [], [])], {}
+        )
+        engine = RoutingEngine(workflow, state_field="state")
+
+        assert targets(engine.route([{"state": "A"}])[0]) == ["B", "C"]
+        assert targets(engine.enabled({}, state="A")) == ["B", "C"]
+
+    def test_shared_conditions_compiled_once(self):
+        conditions = [Condition("p", "equals", 1), Condition("q", "in", [1, 2])]
+        workflow = UnifiedWorkflow(
+            {},
+            [
+                Transition("A", "B", conditions, []),
+                Transition("A", "C", [Condition("p", "EQUALS", 1)], []),
+                Transition("B", "C", list(conditions), []),
+            ],
+            {},
+        )
+
+        engine = RoutingEngine(workflow)
+
+        (ab, _), (bc,) = engine._routes["A"], engine._routes["B"]
+        assert ab[1] is bc[1]
+        assert len(engine._conditions) == 2
+
+    @pytest.mark.parametrize(
+        "ticket, message",
+        [
+            ({"status": "Nowhere"}, "unknown state 'Nowhere'"),
+            ({"status": ["A"]}, "unknown state"),
+            ({}, "no 'status' field"),
+        ],
+    )
+    def test_bad_tickets(self, simple_fs_workflow, ticket, message):
+        engine = RoutingEngine(FreshServiceParser().parse(simple_fs_workflow))
+
+        with pytest.raises(RoutingError, match=message):
+            engine.route([ticket])
+        with pytest.raises(RoutingError, match=message):
+            engine.enabled(ticket)
+
+    def test_unknown_operator_names_transition(self):
+        workflow = UnifiedWorkflow(
+            {}, [Transition("A", "B", [Condition("p", "near", 1)], [])], {}
+        )
+
+        with pytest.raises(RoutingError, match="A -> B: Unknown condition operator"):
+            RoutingEngine(workflow)
@@ -0,0 +1,137 @@
+# aloof_union/tests/test_simulation.py
+import functools
+
+import pytest
+
+from aloof_union.tests.conftest import make_workflow
+
+np = pytest.importorskip("numpy")
+
+from aloof_union.core.analysis import TicketFlowSimulator, simulate  # noqa: E402
+from aloof_union.core.analysis.simulation import (  # noqa: E402
+    _alias_table,
+    empirical,
+    exponential,
+    fixed,
+)
+
+# Tickets start in New and finish in Done unless a test says otherwise
+ticket_workflow = functools.partial(make_workflow, initial=["New"], terminal=["Done"])
+
+
+@pytest.fixture
+def branching_workflow():
+    """New branches to Triage or Work; both lead to Done."""
+    return ticket_workflow(
+        [("New", "Triage"), ("New", "Work"), ("Triage", "Work"), ("Work", "Done")]
+    )
+
+
+class TestTicketFlowSimulator:
+    def test_linear_flow_with_fixed_dwell(self):
+        workflow = ticket_workflow([("New", "Work"), ("Work", "Done")])
+
+        result = simulate(workflow, 1000, dwell={"Work": 3}, seed=0)
+
+        assert result.completed == 1000
+        assert result.stuck == result.unfinished == 0
+        assert np.all(result.cycle_times == 4.0)
+        assert result.visits.tolist() == [1000, 1000, 0]
+        assert result.bottlenecks() == [("Work", 0.75), ("New", 0.25)]
+        assert result.occupancy(arrival_rate=2.0) == {
+            "New": 2.0,
+            "Work": 6.0,
+            "Done": 0.0,
+        }
+
+    def test_transition_probabilities(self, branching_workflow):
+        result = simulate(branching_workflow, 100_000, {("New", "Triage"): 0.2}, seed=1)
+
+        triage = result.visits[result.states.index("Triage")] / result.tickets
+        assert triage == pytest.approx(0.2, abs=0.01)
+        assert result.mean_cycle_time == pytest.approx(2.2, abs=0.01)
+
+    def test_weights_are_relative_when_all_given(self, branching_workflow):
+        probabilities = {("New", "Triage"): 3, ("New", "Work"): 1}
+
+        result = simulate(branching_workflow, 100_000, probabilities, seed=2)
+
+        triage = result.visits[result.states.index("Triage")] / result.tickets
+        assert triage == pytest.approx(0.75, abs=0.01)
+
+    def test_duplicate_transitions_form_one_route(self):
+        workflow = ticket_workflow([("New", "Done"), ("New", "Done"), ("New", "Work")])
+        workflow.states["Work"].is_terminal = True
+
+        result = simulate(workflow, 100_000, seed=3)
+
+        done = result.ended_in[result.states.index("Done")] / result.tickets
+        assert done == pytest.approx(0.5, abs=0.01)
+
+    def test_dead_ends_and_cycles(self):
+        workflow = ticket_workflow(
+            [("New", "Stuck"), ("New", "Loop"), ("Loop", "Loop"), ("New", "Done")]
+        )
+
+        result = simulate(workflow, 3000, seed=4, max_steps=50)
+
+        assert result.stuck + result.unfinished + result.completed == 3000
+        assert result.stuck == pytest.approx(1000, rel=0.1)
+        assert result.unfinished == pytest.approx(1000, rel=0.1)
+        assert result.ended_in[result.states.index("Stuck")] == result.stuck
+
+    def test_distributions(self, branching_workflow):
+        simulator = TicketFlowSimulator(
+            branching_workflow,
+            dwell={"New": exponential(2.0), "Work": empirical([1.0, 3.0])},
+            default_dwell=fixed(0.5),
+        )
+
+        result = simulator.run(50_000, seed=5, batch_size=7000)
+
+        # New (2) + half the tickets in Triage (0.5) + Work (2)
+        assert result.mean_cycle_time == pytest.approx(4.25, rel=0.02)
+        assert "50000 tickets: 50000 completed" in result.format()
+
+    def test_seed_reproducible(self, branching_workflow):
+        dwell = {"Work": exponential(1.0)}
+        first = simulate(branching_workflow, 500, dwell=dwell, seed=6)
+        second = simulate(branching_workflow, 500, dwell=dwell, seed=6)
+
+        assert np.array_equal(first.cycle_times, second.cycle_times)
+
+    @pytest.mark.parametrize(
+        "workflow, options, message",
+        [
+            (ticket_workflow([("New", "Done")], initial=()), {}, "no initial state"),
+            (
+                ticket_workflow([("New", "Done")]),
+                {"probabilities": {("Done", "New"): 1.0}},
+                "No transition from 'Done' to 'New'",
+            ),
+            (
+                ticket_workflow([("New", "Done"), ("New", "Work")]),
+                {"probabilities": {("New", "Done"): 1.5}},
+                "over 1",
+            ),
+            (
+                ticket_workflow([("New", "Done")]),
+                {"dwell": {"Gone": 1.0}},
+                "unknown state 'Gone'",
+            ),
+        ],
+    )
+    def test_invalid_configuration(self, workflow, options, message):
+        with pytest.raises(ValueError, match=message):
+            TicketFlowSimulator(workflow, **options)
+
+    def test_alias_table_is_exact(self):
+        weights = [0.5, 0.3, 0.2, 0.0]
+        cutoff, alias = _alias_table(weights)
+
+        probabilities = [0.0] * len(weights)
+        for slot, (keep, other) in enumerate(zip(cutoff, alias)):
+            probabilities[slot] += keep / len(weights)
+            probabilities[other] += (1 - keep) / len(weights)
+
+        assert probabilities == pytest.approx(weights)
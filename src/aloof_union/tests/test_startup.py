@@ -0,0 +1,125 @@
+# aloof_union/tests/test_startup.py
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import aloof_union
+
+# Cumulative import time allowed for aloof_union.cli, click excluded. Wall
+# clock checks are flaky on loaded machines, so the budget is only enforced
+# when ALOOF_UNION_IMPORT_BUDGET_MS is set.
+IMPORT_BUDGET_MS = os.environ.get("ALOOF_UNION_IMPORT_BUDGET_MS")
+
+# Modules a bare CLI start must not load
+DEFERRED_MODULES = [
+    "asyncio",
+    "concurrent.futures",
+    "multiprocessing",
+    "cProfile",
+    "numpy",
+    "aloof_union.core.batch",
+    "aloof_union.core.cache",
+    "aloof_union.core.transpilers.asynchronous",
+    "aloof_union.core.parsers.freshservice",
+    "aloof_union.core.parsers.jsm",
+    "aloof_union.core.parsers.mermaid",
+]
+
+# Modules a bare package import must not load, beyond the CLI's
+PACKAGE_DEFERRED_MODULES = DEFERRED_MODULES + [
+    "json",
+    "aloof_union.core.parsers",
+    "aloof_union.core.transpilers",
+    "aloof_union.core.routing",
+    "aloof_union.core.analysis",
+]
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ)
+    src = str(Path(aloof_union.__file__).parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def import_times(statement: str) -> dict:
+    """Map each module imported by ``statement`` to its cumulative import time."""
+    stderr = run_python("-X", "importtime", "-c", statement).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestStartup:
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        IMPORT_BUDGET_MS is None, reason="set ALOOF_UNION_IMPORT_BUDGET_MS to run"
+    )
+    def test_cli_import_budget(self):
+        # Best of three runs to ride out a noisy machine
+        elapsed_us = min(
+            import_times("import click; import aloof_union.cli")["aloof_union.cli"]
+            for _ in range(3)
+        )
+
+        assert elapsed_us / 1000 < float(IMPORT_BUDGET_MS)
+
+    def test_package_defers_heavy_modules(self):
+        loaded = import_times("import aloof_union")
+
+        assert [m for m in PACKAGE_DEFERRED_MODULES if m in loaded] == []
+
+    def test_cli_defers_heavy_modules(self):
+        loaded = import_times("import click; import aloof_union.cli")
+
+        assert [m for m in DEFERRED_MODULES if m in loaded] == []
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import aloof_union",
+            "from aloof_union.core.parsers import MermaidParser",
+        ],
+    )
+    def test_formats_load_on_first_use(self, statement):
+        loaded = import_times(statement)
+
+        assert "aloof_union.core.parsers.jsm" not in loaded
+        assert "aloof_union.core.parsers.freshservice" not in loaded
+
+    def test_get_parser_loads_only_its_format(self):
+        out = run_python(
+            "-c",
+            "import sys\n"
+            "from aloof_union.core.models import AutomationType\n"
+            "from aloof_union.core.parsers import get_parser\n"
+            "get_parser(AutomationType.MERMAID)\n"
+            "print(sorted(m for m in sys.modules if '.parsers.' in m))",
+        ).stdout
+
+        assert "mermaid" in out
+        assert "jsm" not in out and "freshservice" not in out
+
+    def test_lazy_names_resolve(self):
+        from aloof_union import AutomationType, WorkflowTranspiler
+        from aloof_union.core.transpilers import AsyncWorkflowTranspiler
+
+        assert AutomationType.JSM.value == "jsm"
+        assert WorkflowTranspiler.__name__ == "WorkflowTranspiler"
+        assert AsyncWorkflowTranspiler.__name__ == "AsyncWorkflowTranspiler"
+        assert "WorkflowTranspiler" in dir(aloof_union)
+        with pytest.raises(AttributeError):
+            aloof_union.missing
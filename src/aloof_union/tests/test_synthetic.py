@@ -0,0 +1,50 @@
+# aloof_union/tests/test_synthetic.py
+import pytest
+
+from aloof_union.core.models import AutomationType
+from aloof_union.core.parsers import get_parser
+from aloof_union.core.transpilers import WorkflowTranspiler, WorkflowValidator
+
+from .synthetic import synthetic_content, synthetic_workflow
+
+
+class TestSyntheticGenerator:
+    def test_is_deterministic(self):
+        assert synthetic_workflow(20, k=2, seed=7) == synthetic_workflow(
+            20, k=2, seed=7
+        )
+        assert synthetic_workflow(20, seed=7) != synthetic_workflow(20, seed=8)
+
+    def test_sizes(self):
+        workflow = synthetic_workflow(10, 25, k=3)
+
+        assert len(workflow.states) == 10
+        assert len(workflow.transitions) == 25
+        assert all(len(t.conditions) == 3 for t in workflow.transitions)
+        assert all(len(t.actions) == 3 for t in workflow.transitions)
+
+    def test_too_few_transitions(self):
+        with pytest.raises(ValueError):
+            synthetic_workflow(10, 5)
+
+    @pytest.mark.parametrize("automation_type", list(AutomationType))
+    @pytest.mark.parametrize("n_states", [1, 2, 50])
+    def test_every_format_is_valid(self, automation_type, n_states):
+        content = synthetic_content(automation_type, n_states, k=2)
+        workflow = get_parser(automation_type).parse(content)
+
+        assert len(workflow.states) == n_states
+        assert len(workflow.transitions) == 3 * n_states
+        assert WorkflowValidator().check(workflow).ok
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("from_type", list(AutomationType))
+@pytest.mark.parametrize("to_type", list(AutomationType))
+def test_large_workflow_conversion(from_type, to_type):
+    content = synthetic_content(from_type, 5_000, k=2)
+    result = WorkflowTranspiler().transpile(content, from_type, to_type)
+
+    workflow = get_parser(to_type).parse(result)
+    assert len(workflow.states) == 5_000
+    assert len(workflow.transitions) == 15_000
@@ -3,7 +3,12 @@ import pytest
 
 from aloof_union.core.models import AutomationType
 from aloof_union.core.transpilers import WorkflowTranspiler
-from aloof_union.exceptions import TranspilerError, ValidationError
+from aloof_union.core.transpilers.direct import (
+    DIRECT_CONVERTERS,
+    freshservice_to_jsm,
+    jsm_to_freshservice,
+)
+from aloof_union.exceptions import ParserError, TranspilerError, ValidationError
 
 
 class TestWorkflowTranspiler:
@@ -65,3 +70,156 @@ class TestWorkflowTranspiler:
             validate=False,
         )
         assert result is not None
+
+    def test_single_implementation(self):
+        from aloof_union import WorkflowTranspiler as PublicTranspiler
+
+        assert PublicTranspiler is WorkflowTranspiler
+
+    def test_parsers_are_shared(self):
+        first, second = WorkflowTranspiler(), WorkflowTranspiler()
+
+        assert first._parser(AutomationType.JSM) is second._parser(AutomationType.JSM)
+
+    def test_validation_levels(self, invalid_workflow_unreachable):
+        assert WorkflowTranspiler().validation == "structural"
+        with pytest.raises(ValidationError, match="unreachable"):
+            WorkflowTranspiler(validation="full").transpile(
+                invalid_workflow_unreachable,
+                AutomationType.FRESHSERVICE,
+                AutomationType.JSM,
+            )
+
+        for level in ("structural", "none"):
+            result = WorkflowTranspiler(validation=level).transpile(
+                invalid_workflow_unreachable,
+                AutomationType.FRESHSERVICE,
+                AutomationType.JSM,
+            )
+            assert len(result["statuses"]) == 4
+
+        assert WorkflowTranspiler(validation="none").validator is None
+        with pytest.raises(ValueError):
+            WorkflowTranspiler(validation="strict")
+
+    @pytest.mark.parametrize("to_type", [AutomationType.JSM, AutomationType.MERMAID])
+    def test_multiple_initial_states_convert(self, simple_fs_workflow, to_type):
+        simple_fs_workflow["states"]["In Progress"]["is_initial"] = True
+        assert DIRECT_CONVERTERS[
+            (AutomationType.FRESHSERVICE, AutomationType.JSM)
+        ].is_valid(simple_fs_workflow)
+
+        # The original transpiler only required at least one initial state
+        result = WorkflowTranspiler().transpile(
+            simple_fs_workflow, AutomationType.FRESHSERVICE, to_type
+        )
+        assert result
+
+        with pytest.raises(ValidationError, match="multiple initial states"):
+            WorkflowTranspiler(validation="full").transpile(
+                simple_fs_workflow, AutomationType.FRESHSERVICE, to_type
+            )
+
+    def test_transform_stage(self, simple_fs_workflow):
+        def drop_descriptions(workflow):
+            for state in workflow.states.values():
+                state.description = None
+
+        transpiler = WorkflowTranspiler(transforms=[drop_descriptions])
+        result = transpiler.transpile(
+            simple_fs_workflow, AutomationType.FRESHSERVICE, AutomationType.JSM
+        )
+
+        assert all(status["description"] is None for status in result["statuses"])
+
+    def test_stages_compose(self, simple_fs_workflow):
+        transpiler = WorkflowTranspiler()
+        workflow = transpiler.parse(simple_fs_workflow, AutomationType.FRESHSERVICE)
+        transpiler.validate(workflow)
+
+        assert transpiler.serialize(workflow, AutomationType.JSM) == (
+            transpiler.transpile(
+                simple_fs_workflow, AutomationType.FRESHSERVICE, AutomationType.JSM
+            )
+        )
+
+
+class TestDirectConversion:
+    PAIRS = [
+        (AutomationType.FRESHSERVICE, AutomationType.JSM),
+        (AutomationType.JSM, AutomationType.FRESHSERVICE),
+    ]
+
+    @staticmethod
+    def two_step(content, from_type, to_type):
+        transpiler = WorkflowTranspiler()
+        return transpiler.serialize(transpiler.parse(content, from_type), to_type)
+
+    @pytest.mark.parametrize("from_type,to_type", PAIRS)
+    def test_matches_two_step_path(
+        self, from_type, to_type, complex_fs_workflow, simple_jsm_workflow
+    ):
+        content = (
+            complex_fs_workflow
+            if from_type is AutomationType.FRESHSERVICE
+            else simple_jsm_workflow
+        )
+        converter = DIRECT_CONVERTERS[(from_type, to_type)]
+
+        assert converter.convert(content) == self.two_step(content, from_type, to_type)
+
+    def test_duplicate_status_names(self, simple_jsm_workflow):
+        statuses = simple_jsm_workflow["statuses"]
+        statuses.append(dict(statuses[0], description="Replaced"))
+
+        assert jsm_to_freshservice(simple_jsm_workflow) == self.two_step(
+            simple_jsm_workflow, AutomationType.JSM, AutomationType.FRESHSERVICE
+        )
+
+    @pytest.mark.parametrize("level", ["structural", "none"])
+    def test_transpile_uses_fast_path(self, level, simple_fs_workflow, monkeypatch):
+        transpiler = WorkflowTranspiler(validation=level)
+
+        def fail(*args):
+            raise AssertionError("unified model was built")
+
+        monkeypatch.setattr(transpiler, "parse", fail)
+        result = transpiler.transpile(
+            simple_fs_workflow, AutomationType.FRESHSERVICE, AutomationType.JSM
+        )
+
+        assert result == freshservice_to_jsm(simple_fs_workflow)
+
+    def test_full_validation_uses_unified_model(self, invalid_workflow_unreachable):
+        assert DIRECT_CONVERTERS[
+            (AutomationType.FRESHSERVICE, AutomationType.JSM)
+        ].is_valid(invalid_workflow_unreachable)
+
+        with pytest.raises(ValidationError, match="unreachable"):
+            WorkflowTranspiler(validation="full").transpile(
+                invalid_workflow_unreachable,
+                AutomationType.FRESHSERVICE,
+                AutomationType.JSM,
+            )
+
+    def test_structural_failure_falls_back(self, invalid_workflow_no_initial):
+        transpiler = WorkflowTranspiler(validation="structural")
+
+        with pytest.raises(ValidationError, match="initial state"):
+            transpiler.transpile(
+                invalid_workflow_no_initial,
+                AutomationType.FRESHSERVICE,
+                AutomationType.JSM,
+            )
+        assert transpiler.transpile(
+            invalid_workflow_no_initial,
+            AutomationType.FRESHSERVICE,
+            AutomationType.JSM,
+            validate=False,
+        ) == freshservice_to_jsm(invalid_workflow_no_initial)
+
+    def test_malformed_input_falls_back(self):
+        with pytest.raises(ParserError, match="Missing required field"):
+            WorkflowTranspiler(validation="none").transpile(
+                {"states": {}}, AutomationType.FRESHSERVICE, AutomationType.JSM
+            )
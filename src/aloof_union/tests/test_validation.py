@@ -1,7 +1,18 @@
 # aloof_union/tests/test_validation.py
 import pytest
 
-from aloof_union.core.transpilers.validation import WorkflowValidator
+from aloof_union.core.models import (
+    Condition,
+    Transition,
+    UnifiedWorkflow,
+    WorkflowState,
+)
+from aloof_union.core.parsers import FreshServiceParser, MermaidParser
+from aloof_union.core.transpilers.validation import (
+    STRUCTURAL_CHECKS,
+    Severity,
+    WorkflowValidator,
+)
 from aloof_union.exceptions import ValidationError
 
 
@@ -27,3 +38,147 @@ class TestWorkflowValidator:
         validator = WorkflowValidator()
         with pytest.raises(ValidationError, match="cannot have outgoing transitions"):
             validator.validate_workflow(invalid_workflow_terminal_transition)
+
+
+class TestValidationReport:
+    def test_reports_every_violation(self, invalid_workflow_unreachable):
+        workflow = FreshServiceParser().parse(invalid_workflow_unreachable)
+        workflow.states["Resolved"].is_initial = True
+        workflow.transitions.append(Transition("Resolved", "Nowhere", [], []))
+        workflow.transitions[0].conditions = [
+            Condition("assignee", "equals", "a"),
+            Condition("assignee", "equals", "b"),
+        ]
+
+        report = WorkflowValidator().check(workflow)
+
+        assert not report.ok
+        assert [v.rule for v in report.violations] == [
+            "initial.multiple",
+            "transitions.unknown-to",
+            "reachability.unreachable",
+            "terminal.outgoing",
+            "conditions.conflict",
+        ]
+        assert report.violations[2].states == ("Abandoned",)
+        assert all(v.severity is Severity.ERROR for v in report.violations)
+
+    def test_fail_fast_option(self, invalid_workflow_unreachable):
+        workflow = FreshServiceParser().parse(invalid_workflow_unreachable)
+        workflow.transitions.append(Transition("Resolved", "New", [], []))
+        validator = WorkflowValidator()
+
+        with pytest.raises(ValidationError) as first:
+            validator.validate_workflow(workflow)
+        with pytest.raises(ValidationError) as every:
+            validator.validate_workflow(workflow, fail_fast=False)
+
+        assert "cannot have outgoing" not in str(first.value)
+        assert "unreachable" in str(every.value)
+        assert "cannot have outgoing" in str(every.value)
+        assert len(every.value.report.errors) == 2
+
+    def test_long_linear_workflow(self):
+        names = [f"S{i}" for i in range(20000)]
+        states = {name: WorkflowState(name) for name in names}
+        states["S0"].is_initial = True
+        states[names[-1]].is_terminal = True
+        transitions = [Transition(a, b, [], []) for a, b in zip(names, names[1:])]
+
+        report = WorkflowValidator().check(UnifiedWorkflow(states, transitions, {}))
+
+        assert report.ok
+
+    def test_dead_ends_and_traps(self):
+        states = {name: WorkflowState(name) for name in "ABCDEF"}
+        states["A"].is_initial = True
+        states["F"].is_terminal = True
+        transitions = [
+            Transition(a, b, [], []) for a, b in ["AB", "AC", "AF", "CD", "DC", "EA"]
+        ]
+
+        report = WorkflowValidator(["reachability"]).check(
+            UnifiedWorkflow(states, transitions, {})
+        )
+
+        assert [v.rule for v in report.errors] == ["reachability.unreachable"]
+        assert [(v.rule, v.states) for v in report.warnings] == [
+            ("reachability.dead-end", ("B",)),
+            ("reachability.trap", ("C", "D")),
+        ]
+
+    def test_cycles_replace_traps_in_full_check(self):
+        states = {name: WorkflowState(name) for name in "ABCDEFG"}
+        states["A"].is_initial = True
+        states["F"].is_terminal = True
+        transitions = [
+            Transition(a, b, [], [])
+            for a, b in ["AB", "AC", "AF", "AG", "CD", "DC", "EA", "GC"]
+        ]
+
+        report = WorkflowValidator().check(UnifiedWorkflow(states, transitions, {}))
+
+        assert [(v.rule, v.states) for v in report.errors] == [
+            ("reachability.unreachable", ("E",))
+        ]
+        assert [(v.rule, v.states) for v in report.warnings] == [
+            ("reachability.dead-end", ("B",)),
+            ("reachability.trap", ("G",)),
+            ("cycles.non-terminating", ("C", "D")),
+        ]
+
+    def test_unreachable_from_any_initial_state(self):
+        states = {name: WorkflowState(name) for name in "ABC"}
+        states["A"].is_initial = states["B"].is_initial = True
+        states["C"].is_terminal = True
+        transitions = [Transition("B", "C", [], [])]
+
+        report = WorkflowValidator(["reachability"]).check(
+            UnifiedWorkflow(states, transitions, {})
+        )
+
+        assert [(v.rule, v.states) for v in report.violations] == [
+            ("reachability.dead-end", ("A",))
+        ]
+
+    def test_non_terminating_cycle(self):
+        states = {name: WorkflowState(name) for name in "ABCD"}
+        states["A"].is_initial = True
+        states["D"].is_terminal = True
+        transitions = [
+            Transition(a, b, [], []) for a, b in ["AB", "BC", "CB", "AD", "DD"]
+        ]
+
+        report = WorkflowValidator(["cycles"]).check(
+            UnifiedWorkflow(states, transitions, {})
+        )
+
+        assert report.ok
+        assert [(v.rule, v.states) for v in report.warnings] == [
+            ("cycles.non-terminating", ("B", "C"))
+        ]
+
+    def test_sees_in_place_edits(self, unified_workflow):
+        workflow = unified_workflow
+        assert WorkflowValidator().check(workflow).ok
+        initial = workflow.index.initial[0]
+
+        workflow.states[initial].is_initial = False
+        old = workflow.transitions[0]
+        workflow.transitions[0] = Transition(old.from_state, "Nowhere", [], [])
+
+        report = WorkflowValidator().check(workflow)
+        assert [v.rule for v in report.errors] == [
+            "states.no-initial",
+            "transitions.unknown-to",
+        ]
+        lines = MermaidParser().serialize(workflow).splitlines()
+        assert f"    [*] --> {initial}" not in lines
+        assert f"    {old.from_state} --> Nowhere" in lines
+
+    def test_check_subset(self, invalid_workflow_unreachable):
+        workflow = FreshServiceParser().parse(invalid_workflow_unreachable)
+
+        assert WorkflowValidator(STRUCTURAL_CHECKS).check(workflow).ok
+        with pytest.raises(ValueError):
+            WorkflowValidator(["spelling"])